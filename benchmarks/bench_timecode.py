@@ -0,0 +1,378 @@
+#!-*- coding: utf-8 -*-
+"""Benchmarks for the timecode library.
+
+Runs the hot paths of the library for every frame rate and prints the
+operations per second and the latency of every operation. The results can be
+saved as a JSON baseline and compared against a previous run::
+
+    python benchmarks/bench_timecode.py --save baseline.json
+    python benchmarks/bench_timecode.py --compare baseline.json
+
+The comparison exits with status 1 if any benchmark is slower than the
+baseline by more than the threshold (10% by default).
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timecode  # noqa: E402
+from timecode import ImmutableTimecode, Timecode  # noqa: E402
+from timecode.formatting import (  # noqa: E402
+    export_timecodes, iter_timecodes, record_width
+)
+from timecode.bulk import parse_buffer, validate_timecodes  # noqa: E402
+from timecode.rational import RateConverter  # noqa: E402
+from timecode.ranges import TimecodeRangeSet  # noqa: E402
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+
+#: All the frame rates handled by Timecode._validate_framerate, 29.97 and
+#: 59.94 are the drop frame ones.
+FRAMERATES = ['23.98', '24', '25', '29.97', '30', '50', '59.94', '60', 'ms',
+              'frames']
+
+#: The number of timecodes in the bulk benchmarks.
+BULK_SIZE = 100000
+
+TIMECODE = '01:23:45:12'
+
+
+def scalar_benchmarks(framerate):
+    """returns the scalar benchmarks of the given frame rate as
+    (name, function, operations per call) tuples
+    """
+    tc = Timecode(framerate, TIMECODE)
+    frames = tc.frames
+    other = Timecode(framerate, frames=1234)
+
+    def tc_to_frames():
+        tc.tc_to_frames(TIMECODE)
+
+    def frames_to_tc():
+        tc.frames_to_tc(frames)
+
+    def frames_to_tc_with(method):
+        rate = tc._rate
+
+        def run():
+            selected = rate.conversion
+            rate.set_conversion(method)
+            try:
+                for _ in range(1000):
+                    frames_to_tc()
+            finally:
+                if selected is not None:
+                    rate.set_conversion(selected)
+        return run
+
+    def repr_new():
+        Timecode(framerate, frames=frames).__repr__()
+
+    def eq_str():
+        tc == TIMECODE
+
+    def lt_str():
+        tc < TIMECODE
+
+    cues = tc._rate.frame_set([TIMECODE])
+    immutable = ImmutableTimecode.from_timecode(tc)
+
+    def in_frame_set():
+        immutable in cues
+
+    def eq_timecode():
+        tc == other
+
+    def add_int():
+        tc + 100
+
+    def add_timecode():
+        tc + other
+
+    def sub_timecode():
+        tc - other
+
+    def lt_timecode():
+        tc < other
+
+    def hash_timecode():
+        hash(immutable)
+
+    def iadd_int():
+        tc_copy = tc.__copy__()
+        tc_copy += 100
+
+    def init_str():
+        Timecode(framerate, TIMECODE)
+
+    def init_str_lazy():
+        Timecode(framerate, TIMECODE, lazy=True)
+
+    def passthrough():
+        Timecode(framerate, TIMECODE).__repr__()
+
+    def passthrough_lazy():
+        Timecode(framerate, TIMECODE, lazy=True).__repr__()
+
+    def init_frames():
+        Timecode(framerate, frames=frames)
+
+    return [
+        ('tc_to_frames', tc_to_frames, 1),
+        ('frames_to_tc', frames_to_tc, 1),
+        ('frames_to_tc_arithmetic', frames_to_tc_with('arithmetic'), 1000),
+        ('frames_to_tc_table', frames_to_tc_with('table'), 1000),
+        ('repr_new', repr_new, 1),
+        ('eq_str', eq_str, 1),
+        ('lt_str', lt_str, 1),
+        ('in_frame_set', in_frame_set, 1),
+        ('eq_timecode', eq_timecode, 1),
+        ('add_int', add_int, 1),
+        ('add_timecode', add_timecode, 1),
+        ('sub_timecode', sub_timecode, 1),
+        ('lt_timecode', lt_timecode, 1),
+        ('hash_timecode', hash_timecode, 1),
+        ('iadd_int', iadd_int, 1),
+        ('init_str', init_str, 1),
+        ('init_str_lazy', init_str_lazy, 1),
+        ('passthrough', passthrough, 1),
+        ('passthrough_lazy', passthrough_lazy, 1),
+        ('init_frames', init_frames, 1),
+    ]
+
+
+def bulk_benchmarks(framerate):
+    """returns the bulk benchmarks of the given frame rate as
+    (name, function, operations per call) tuples
+    """
+    start = Timecode(framerate, TIMECODE)
+    strings = list(iter_timecodes(start, BULK_SIZE))
+    buffer = '\n'.join(strings).encode('ascii')
+    frame_list = list(range(start.frames, start.frames + BULK_SIZE))
+    converter = RateConverter(framerate, '25')
+
+    def scalar_loop():
+        for tc_str in strings:
+            Timecode(framerate, tc_str).__repr__()
+
+    def iter_strings():
+        for _ in iter_timecodes(start, BULK_SIZE):
+            pass
+
+    def repr_encode():
+        b''.join([(Timecode(framerate, frames=f).__repr__() + '\n')
+                  .encode('ascii') for f in frame_list])
+
+    export_buffer = bytearray(record_width(framerate) * BULK_SIZE)
+
+    def export_buffer_fixed():
+        export_timecodes(export_buffer, start, BULK_SIZE)
+
+    def parse_buffer_python():
+        parse_buffer(buffer, framerate, use_numpy=False)
+
+    def convert_list():
+        converter.convert_many(frame_list)
+
+    def validate_python():
+        validate_timecodes(strings, framerate, use_numpy=False)
+
+    # ranges of 10 frames every 15 frames and of 20 frames every 30 frames
+    range_starts = frame_list[::15]
+    first_set = TimecodeRangeSet.from_arrays(
+        framerate, range_starts, [f + 10 for f in range_starts]
+    )
+    second_set = TimecodeRangeSet.from_arrays(
+        framerate, frame_list[::30], [f + 20 for f in frame_list[::30]]
+    )
+
+    def range_set_load():
+        TimecodeRangeSet.from_arrays(framerate, range_starts,
+                                     [f + 10 for f in range_starts])
+
+    def range_set_difference():
+        first_set - second_set
+
+    benchmarks = [
+        ('scalar_loop', scalar_loop, BULK_SIZE),
+        ('iter_timecodes', iter_strings, BULK_SIZE),
+        ('repr_encode', repr_encode, BULK_SIZE),
+        ('export_timecodes', export_buffer_fixed, BULK_SIZE),
+        ('parse_buffer_python', parse_buffer_python, BULK_SIZE),
+        ('convert_many_list', convert_list, BULK_SIZE),
+        ('validate_python', validate_python, BULK_SIZE),
+        ('range_set_load', range_set_load, len(range_starts)),
+        ('range_set_difference', range_set_difference,
+         len(first_set) + len(second_set)),
+    ]
+
+    if numpy is not None:
+        from timecode.array import TimecodeArray
+
+        tc_array = TimecodeArray(framerate, frame_list)
+        frame_array = numpy.array(frame_list)
+        string_array = numpy.array(strings)
+
+        def array_to_strings():
+            tc_array.to_strings()
+
+        def array_from_strings():
+            TimecodeArray.from_timecodes(framerate, string_array)
+
+        def array_add():
+            tc_array + 100
+
+        def parse_buffer_numpy():
+            parse_buffer(buffer, framerate)
+
+        def convert_array():
+            converter.convert_many(frame_array)
+
+        def validate_numpy():
+            validate_timecodes(string_array, framerate)
+
+        benchmarks += [
+            ('array_to_strings', array_to_strings, BULK_SIZE),
+            ('array_from_strings', array_from_strings, BULK_SIZE),
+            ('array_add', array_add, BULK_SIZE),
+            ('parse_buffer_numpy', parse_buffer_numpy, BULK_SIZE),
+            ('convert_many_numpy', convert_array, BULK_SIZE),
+            ('validate_numpy', validate_numpy, BULK_SIZE),
+        ]
+
+    return benchmarks
+
+
+def collect(kinds, framerates):
+    """yields the (name, function, operations per call) tuples of all the
+    benchmarks
+    """
+    for kind, factory in (('scalar', scalar_benchmarks),
+                          ('bulk', bulk_benchmarks)):
+        if kind not in kinds:
+            continue
+        for framerate in framerates:
+            for name, function, ops in factory(framerate):
+                yield '%s.%s[%s]' % (kind, name, framerate), function, ops
+
+
+def measure(function, ops, min_time, repeat):
+    """returns the best seconds per operation of the given function
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / repeat:
+            break
+        number *= 2 if elapsed == 0 else max(
+            2, int(min_time / repeat / elapsed) + 1
+        )
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return best / (number * ops)
+
+
+def run(benchmarks, min_time, repeat, stream=sys.stdout):
+    """runs the benchmarks and returns the results as a dictionary
+    """
+    results = {}
+    for name, function, ops in benchmarks:
+        seconds = measure(function, ops, min_time, repeat)
+        results[name] = {
+            'ops_per_sec': 1.0 / seconds,
+            'seconds_per_op': seconds,
+        }
+        stream.write('%-44s %14.0f ops/s %12.1f ns/op\n' % (
+            name, 1.0 / seconds, seconds * 1e9
+        ))
+        stream.flush()
+    return results
+
+
+def compare(results, baseline, threshold, stream=sys.stdout):
+    """compares the results with the baseline and returns the names of the
+    benchmarks which are slower than the threshold
+    """
+    regressions = []
+    stream.write('\n%-44s %10s %10s %8s\n' % ('benchmark', 'baseline', 'now',
+                                              'change'))
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        before = baseline[name]['ops_per_sec']
+        after = results[name]['ops_per_sec']
+        change = after / before - 1.0
+        flag = ''
+        if change < -threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        stream.write('%-44s %10.0f %10.0f %+7.1f%%%s\n' % (
+            name, before, after, change * 100, flag
+        ))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--framerate', action='append', dest='framerates',
+                        help='run only the given frame rates, can be given '
+                             'more than once')
+    parser.add_argument('--kind', choices=['scalar', 'bulk'],
+                        action='append', dest='kinds',
+                        help='run only the scalar or the bulk benchmarks')
+    parser.add_argument('--filter', default='',
+                        help='run only the benchmarks containing the text')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='the minimum seconds to run each benchmark')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='the number of repeats, the best one is used')
+    parser.add_argument('--save', metavar='FILE',
+                        help='save the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the results with a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='the slow down ratio to report as a regression')
+    args = parser.parse_args(argv)
+
+    benchmarks = [
+        benchmark for benchmark in collect(args.kinds or ['scalar', 'bulk'],
+                                           args.framerates or FRAMERATES)
+        if args.filter in benchmark[0]
+    ]
+    results = run(benchmarks, args.min_time, args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'meta': {
+                    'timecode': timecode.__version__,
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'numpy': numpy.__version__ if numpy else None,
+                },
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            sys.stdout.write('\n%s benchmarks regressed more than %.0f%%\n' %
+                             (len(regressions), args.threshold * 100))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -26,4 +26,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     zip_safe=True,
+    extras_require={
+        'numpy': ['numpy'],
+    },
 )
@@ -0,0 +1,100 @@
+#!-*- coding: utf-8 -*-
+
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode.array import TimecodeArray, numpy
+
+
+FRAMERATES = ['23.98', '24', '25', '29.97', '30', '50', '59.94', '60', 'ms',
+              'frames']
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TimecodeArrayTester(unittest.TestCase):
+    """tests TimecodeArray class
+    """
+
+    def _sample_frames(self, framerate):
+        """returns frames around the interesting drop frame and 24 hour
+        boundaries of the given framerate
+        """
+        tc = Timecode(framerate)
+        frames = list(range(-2000, 40000, 7))
+        day = Timecode(framerate, '23:59:59:00').frames + tc.int_framerate
+        frames += list(range(day - 3000, day + 3000))
+        frames += [day * 3 + 17, 51477873731361]
+        return frames
+
+    def test_frames_to_tc_matches_scalar(self):
+        """testing if the components and strings are the same with the
+        Timecode class for every framerate
+        """
+        for fr in FRAMERATES:
+            frames = self._sample_frames(fr)
+            tc_array = TimecodeArray(fr, frames)
+            strings = tc_array.to_strings()
+            components = numpy.stack(tc_array.frames_to_tc(), axis=1)
+            for i, f in enumerate(frames):
+                tc = Timecode(fr, frames=f)
+                self.assertEqual(tc.__repr__(), strings[i])
+                self.assertEqual(list(tc.frames_to_tc(f)),
+                                 components[i].tolist())
+
+    def test_tc_to_frames_matches_scalar(self):
+        """testing if parsing a column of timecode strings gives the same
+        frames with the Timecode class
+        """
+        for fr in FRAMERATES:
+            strings = TimecodeArray(fr, self._sample_frames(fr)).to_strings()
+            tc_array = TimecodeArray.from_timecodes(fr, strings)
+            for i, tc_str in enumerate(strings):
+                self.assertEqual(Timecode(fr, tc_str).frames,
+                                 tc_array.frames[i])
+
+    def test_parse_accepts_other_separators(self):
+        """testing if drop frame and dot separators are parsed
+        """
+        tc_array = TimecodeArray.from_timecodes(
+            '29.97', ['00:00:59;29', b'03.36.09.23', '00:10:00:00']
+        )
+        self.assertEqual([1800, 388704, 17983], tc_array.frames.tolist())
+
+    def test_parse_error(self):
+        """testing if a TimecodeError is raised for malformed strings
+        """
+        for bad in ['00:00:00', '00:00:00:00:00', '00:0a:00:00', '00::00:00']:
+            with self.assertRaises(TimecodeError):
+                TimecodeArray.from_timecodes('24', ['00:00:00:00', bad])
+
+    def test_arithmetic(self):
+        """testing element wise addition and subtraction
+        """
+        tc_array = TimecodeArray('29.97', [1, 2589408, 388704])
+        self.assertEqual([2, 2589409, 388705],
+                         (tc_array + 1).frames.tolist())
+        self.assertEqual([2, 2589409, 388705],
+                         (1 + tc_array).frames.tolist())
+        self.assertEqual(['23:59:59:29', '23:59:59:28', '03:36:09:22'],
+                         (tc_array - 1).to_strings().tolist())
+        self.assertEqual([2, 2589408 * 2, 388704 * 2],
+                         (tc_array + tc_array).frames.tolist())
+        self.assertEqual([0, 0, 0], (tc_array - tc_array).frames.tolist())
+        self.assertEqual([1, 2589407, 388703],
+                         (tc_array - numpy.array([0, 1, 1])).frames.tolist())
+        self.assertEqual([32, 2589439, 388735],
+                         (tc_array + Timecode('29.97', '00:00:01:00'))
+                         .frames.tolist())
+
+        with self.assertRaises(TimecodeError):
+            tc_array + 'bum'
+
+    def test_sequence_protocol(self):
+        """testing len, indexing, slicing and iteration
+        """
+        tc_array = TimecodeArray('24', [1, 25, 49])
+        self.assertEqual(3, len(tc_array))
+        self.assertEqual(Timecode('24', '00:00:01:00'), tc_array[1])
+        self.assertEqual([25, 49], tc_array[1:].frames.tolist())
+        self.assertEqual(['00:00:00:00', '00:00:01:00', '00:00:02:00'],
+                         [tc.__repr__() for tc in tc_array])
@@ -0,0 +1,80 @@
+#!-*- coding: utf-8 -*-
+
+import unittest
+from array import array
+
+from timecode import Timecode, TimecodeError
+from timecode.batch import convert_many
+from timecode.formatting import iter_timecodes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BatchTester(unittest.TestCase):
+    """tests the batch conversions
+    """
+
+    def setUp(self):
+        start = Timecode('29.97', '23:59:00:00')
+        self.timecodes = list(iter_timecodes(start, 5000))
+        self.frames = [Timecode('29.97', tc).frames for tc in self.timecodes]
+
+    def test_timecodes_to_frames(self):
+        """testing if the timecodes are converted to frames in and out of
+        process
+        """
+        for kwargs in [{}, {'threshold': 0, 'workers': 2, 'chunk_size': 999}]:
+            result = convert_many(self.timecodes, '29.97', **kwargs)
+            self.assertIsInstance(result.values, array)
+            self.assertEqual(self.frames, list(result.values))
+            self.assertEqual([], result.errors)
+
+    def test_frames_to_timecodes(self):
+        """testing if the frames are converted to timecodes in and out of
+        process
+        """
+        for kwargs in [{}, {'threshold': 0, 'workers': 2, 'chunk_size': 999}]:
+            result = convert_many(self.frames, '29.97', target='timecode',
+                                  **kwargs)
+            self.assertEqual(self.timecodes, result.values)
+            self.assertEqual([], result.errors)
+
+        result = convert_many(array('q', self.frames), '29.97',
+                              target='timecode', threshold=0, workers=2)
+        self.assertEqual(self.timecodes, result.values)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy_frames_to_timecodes(self):
+        """testing if numpy arrays of frames can be converted
+        """
+        result = convert_many(numpy.array(self.frames), '29.97',
+                              target='timecode')
+        self.assertEqual(self.timecodes, result.values)
+
+    def test_parse_errors(self):
+        """testing if the timecodes which can not be parsed are reported with
+        their indices
+        """
+        timecodes = list(self.timecodes)
+        timecodes[3] = 'bad'
+        timecodes[2000] = None
+        timecodes[4999] = '00:00:01'
+        for kwargs in [{}, {'threshold': 0, 'workers': 2, 'chunk_size': 999}]:
+            result = convert_many(timecodes, '29.97', **kwargs)
+            self.assertEqual([3, 2000, 4999],
+                             [index for index, message in result.errors])
+            self.assertEqual('Type NoneType not supported.',
+                             result.errors[1][1])
+            self.assertEqual(0, result.values[3])
+            self.assertEqual(self.frames[4], result.values[4])
+
+    def test_invalid_target(self):
+        """testing if a TimecodeError is raised for an unknown target
+        """
+        with self.assertRaises(TimecodeError):
+            convert_many(self.frames, '29.97', target='seconds')
+        with self.assertRaises(TimecodeError):
+            convert_many(['00:00:00:00'], '29.97', target='timecode')
@@ -0,0 +1,101 @@
+#!-*- coding: utf-8 -*-
+
+import unittest
+from array import array
+
+from timecode import Timecode, TimecodeError
+from timecode.binary import (pack_bcd, pack_bcd_many, pack_int,
+                             pack_int_many, unpack_bcd, unpack_bcd_many,
+                             unpack_int, unpack_int_many)
+
+
+class BinaryTester(unittest.TestCase):
+    """tests the binary timecode representations
+    """
+
+    def test_pack_bcd(self):
+        """testing if the timecodes are packed to SMPTE 12M BCD values
+        """
+        self.assertEqual(0x12345623,
+                         pack_bcd(Timecode('25', '12:34:56:23')))
+        self.assertEqual(0x12345668,
+                         pack_bcd(Timecode('29.97', '12:34:56:28')))
+        self.assertEqual(0x00000081,
+                         pack_bcd(Timecode('24', '00:00:00:01'),
+                                  color_frame=True))
+        # the frames are counted in pairs above 30 frames per second
+        self.assertEqual(0x23598029,
+                         pack_bcd(Timecode('60', '23:59:00:59')))
+        self.assertEqual(0x80000012,
+                         pack_bcd(Timecode('50', '00:00:00:25')))
+
+    def test_unpack_bcd(self):
+        """testing if the BCD values are unpacked to timecodes
+        """
+        for framerate in ['23.98', '25', '29.97', '50', '59.94']:
+            tc = Timecode(framerate, '12:34:56:21')
+            self.assertEqual(tc, unpack_bcd(pack_bcd(tc), framerate))
+
+        with self.assertRaises(TimecodeError):
+            unpack_bcd(0x0000000A, '25')
+        with self.assertRaises(TimecodeError):
+            unpack_bcd(0x00000025, '25')
+        with self.assertRaises(TimecodeError):
+            pack_bcd(Timecode('ms', '00:00:00:00'))
+
+    def test_int(self):
+        """testing if the frames and the frame rate are packed to an integer
+        """
+        tc = Timecode('59.94', frames=-1234)
+        value = pack_int(tc)
+        self.assertEqual(-1234 * 256 + 7, value)
+        unpacked = unpack_int(value)
+        self.assertEqual('59.94', unpacked.framerate)
+        self.assertEqual(-1234, unpacked.frames)
+
+        with self.assertRaises(TimecodeError):
+            unpack_int(0)
+        with self.assertRaises(TimecodeError):
+            pack_int(Timecode('48'))
+
+    def test_int_framerate(self):
+        """testing if the timecodes with integer frame rates are packed
+        """
+        tc = Timecode(25, '01:02:03:04')
+        self.assertEqual(pack_int(Timecode('25', '01:02:03:04')),
+                         pack_int(tc))
+        self.assertEqual(tc.frames, unpack_int(pack_int(tc)).frames)
+        self.assertEqual(0x01020304, pack_bcd(tc))
+
+    def test_bcd_many(self):
+        """testing if many frames are packed and unpacked at once
+        """
+        for framerate in ['24', '29.97', '59.94']:
+            rate = Timecode(framerate)._rate
+            frames = list(range(-5, rate.frames_per_24_hours + 100, 997))
+            packed = pack_bcd_many(frames, framerate)
+            self.assertIsInstance(packed, array)
+            self.assertEqual(
+                [pack_bcd(Timecode(framerate, frames=f)) for f in frames],
+                list(packed)
+            )
+            self.assertEqual(
+                [Timecode(framerate, frames=f).__repr__() for f in frames],
+                [Timecode(framerate, frames=f).__repr__()
+                 for f in unpack_bcd_many(packed.tobytes(), framerate)]
+            )
+
+        with self.assertRaises(TimecodeError) as cm:
+            unpack_bcd_many(array('I', [0x01, 0x0A]), '25')
+        self.assertIn('At index 1.', str(cm.exception))
+
+    def test_int_many(self):
+        """testing if many frames are packed and unpacked as integers
+        """
+        frames = array('q', [1, -20, 86400 * 24, 2 ** 40])
+        packed = pack_int_many(frames, '24')
+        self.assertEqual(32, len(packed.tobytes()))
+        self.assertEqual(frames,
+                         unpack_int_many(memoryview(packed.tobytes()), '24'))
+        with self.assertRaises(TimecodeError):
+            unpack_int_many(packed, '25')
@@ -0,0 +1,233 @@
+#!-*- coding: utf-8 -*-
+
+import mmap
+import tempfile
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode import bulk
+from timecode.bulk import parse_buffer, validate_timecodes
+
+
+MIXED = (
+    b"00:00:00:00\n"
+    b" 00:00:59;29\r\n"
+    b"\n"
+    b"03.36.09.23\n"
+    b"bad\n"
+    b"00:00 :00:00\n"
+    b"00:00:00\n"
+    b"1:2:3:4:5\n"
+    b"01:00:00:00\n"
+    b"  \n"
+    b"x"
+)
+
+
+class ParseBufferTester(unittest.TestCase):
+    """tests the parse_buffer function
+    """
+
+    def _parse_both(self, buffer, framerate, **kwargs):
+        """parses the buffer with and without numpy and checks if the
+        results are the same
+        """
+        result = parse_buffer(buffer, framerate, use_numpy=False, **kwargs)
+        if bulk.numpy is not None:
+            self.assertEqual(
+                result, parse_buffer(buffer, framerate, **kwargs)
+            )
+        return result
+
+    def test_matches_timecode(self):
+        """testing if the frames are the same with the Timecode class
+        """
+        for fr in ['23.98', '24', '25', '29.97', '30', '50', '59.94', '60']:
+            tcs = [Timecode(fr, frames=f) for f in range(1, 100000, 37)]
+            buffer = '\n'.join(tc.__repr__() for tc in tcs).encode('ascii')
+            result = self._parse_both(buffer, fr)
+            self.assertEqual([tc.frames for tc in tcs], list(result.frames))
+            self.assertEqual(0, len(result.errors))
+
+    def test_malformed_entries(self):
+        """testing if the malformed entries are reported with their offsets
+        and the empty ones are skipped
+        """
+        result = self._parse_both(MIXED, '29.97')
+        self.assertEqual([1, 1800, 388704, 0, 0, 0, 0, 107893, 0],
+                         list(result.frames))
+        self.assertEqual([39, 43, 56, 65, 90], list(result.errors))
+
+    def test_fixed_width(self):
+        """testing if the fixed width records are correctly parsed
+        """
+        buffer = (b"00:00:00:00\n00:00:59;29\nxx:00:00:00\n"
+                  b"\0\0\0\0\0\0\0\0\0\0\0\n00:00:00:00\n01:00:0")
+        result = self._parse_both(buffer, '29.97')
+        self.assertEqual([1, 1800, 0, 1, 0], list(result.frames))
+        self.assertEqual([24, 60], list(result.errors))
+
+    def test_delimiter(self):
+        """testing if another delimiter can be used
+        """
+        result = self._parse_both(b'00:00:01:00,00:00:02:00,', '25',
+                                  delimiter=',')
+        self.assertEqual([26, 51], list(result.frames))
+
+        with self.assertRaises(TimecodeError):
+            parse_buffer(b'', '25', delimiter=b':')
+        with self.assertRaises(TimecodeError):
+            parse_buffer(b'', '25', delimiter=b'\r\n')
+
+    def test_buffer_types(self):
+        """testing if bytearray, memoryview and mmap buffers can be parsed
+        """
+        buffer = b'00:00:01:00\n00:00:02:00\n'
+        for value in (bytearray(buffer), memoryview(buffer)[12:]):
+            self._parse_both(value, '24')
+        self.assertEqual(
+            [49], list(self._parse_both(memoryview(buffer)[12:], '24').frames)
+        )
+
+        with tempfile.TemporaryFile() as f:
+            f.write(buffer)
+            f.flush()
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                result = self._parse_both(mapped, '24')
+                self.assertEqual([25, 49], list(result.frames))
+                del result
+            finally:
+                mapped.close()
+
+    def test_empty_buffer(self):
+        """testing if an empty buffer results empty arrays
+        """
+        result = self._parse_both(b'', '24')
+        self.assertEqual(0, len(result.frames))
+        self.assertEqual(0, len(result.errors))
+
+    @unittest.skipIf(bulk.numpy is None, 'numpy is not installed')
+    def test_chunks(self):
+        """testing if the results are the same when the buffer is parsed in
+        small chunks
+        """
+        buffer = MIXED * 20
+        expected = parse_buffer(buffer, '29.97')
+        chunk_size = bulk.CHUNK_SIZE
+        try:
+            for size in (1, 5, 13, 64):
+                bulk.CHUNK_SIZE = size
+                self.assertEqual(expected, parse_buffer(buffer, '29.97'))
+        finally:
+            bulk.CHUNK_SIZE = chunk_size
+
+    def test_too_long_fields(self):
+        """testing if the fields too long to fit in an int64 are reported as
+        malformed instead of overflowing
+        """
+        buffer = (b"999999999:00:00:00\n"
+                  b"999999999999999999:00:00:00\n"
+                  b"00:00:00:9999999999\n")
+        result = self._parse_both(buffer, '25')
+        self.assertEqual([999999999 * 90000 + 1, 0, 0], list(result.frames))
+        self.assertEqual([19, 47], list(result.errors))
+
+    def test_validate(self):
+        """testing if the out of range timecodes are reported as errors with
+        validate=True
+        """
+        buffer = b"00:00:59;29\n00:01:00;00\n00:00:00:30\n00:10:00;00\n"
+        result = self._parse_both(buffer, '29.97')
+        self.assertEqual(0, len(result.errors))
+        result = self._parse_both(buffer, '29.97', validate=True)
+        self.assertEqual([1800, 0, 0, 17983], list(result.frames))
+        self.assertEqual([12, 24], list(result.errors))
+
+
+class ValidateTimecodesTester(unittest.TestCase):
+    """tests the validate_timecodes function
+    """
+
+    def _validate_both(self, timecodes, framerate):
+        """validates the timecodes with and without numpy and checks if the
+        results are the same
+        """
+        result = validate_timecodes(timecodes, framerate, use_numpy=False)
+        if bulk.numpy is not None:
+            self.assertEqual(result, validate_timecodes(timecodes, framerate))
+        return result
+
+    def test_matches_timecode(self):
+        """testing if the frames of the valid timecodes are the same with the
+        Timecode class
+        """
+        for fr in ['23.98', '24', '25', '29.97', '30', '50', '59.94', '60',
+                   'ms']:
+            tcs = [Timecode(fr, frames=f) for f in range(1, 100000, 37)]
+            result = self._validate_both([tc.__repr__() for tc in tcs], fr)
+            self.assertEqual([tc.frames for tc in tcs], list(result.frames))
+            self.assertEqual([bulk.VALID] * len(tcs), list(result.codes))
+
+    def test_error_codes(self):
+        """testing if the invalid timecodes get the error codes of their
+        first problem
+        """
+        timecodes = [
+            '00:00:00:00', ' 00:00:59;29 ', '24:00:00:00', '00:60:00:00',
+            '00:00:60:00', '00:00:00:30', '00:01:00;00', '00:01:00;01',
+            '00:01:00;02', '00:10:00;00', '00:00:00', 'bad', '',
+            '00:00:00:0\u00b2', '00:00 :00:00', '99:99:99:99',
+        ]
+        result = self._validate_both(timecodes, '29.97')
+        self.assertEqual([
+            bulk.VALID, bulk.VALID, bulk.HOURS_OUT_OF_RANGE,
+            bulk.MINUTES_OUT_OF_RANGE, bulk.SECONDS_OUT_OF_RANGE,
+            bulk.FRAMES_OUT_OF_RANGE, bulk.DROPPED_FRAME, bulk.DROPPED_FRAME,
+            bulk.VALID, bulk.VALID, bulk.MALFORMED, bulk.MALFORMED,
+            bulk.MALFORMED, bulk.MALFORMED, bulk.MALFORMED,
+            bulk.HOURS_OUT_OF_RANGE,
+        ], list(result.codes))
+        self.assertEqual([1, 1800, 0, 0, 0, 0, 0, 0, 1801, 17983],
+                         list(result.frames)[:10])
+        self.assertEqual([0] * 6, list(result.frames)[10:])
+        for code in result.codes:
+            self.assertIn(code, bulk.ERROR_MESSAGES)
+
+    def test_non_drop_frame(self):
+        """testing if the dropped frame numbers are valid for the non drop
+        frame rates
+        """
+        result = self._validate_both(['00:01:00:00', '00:00:00:24'], '24')
+        self.assertEqual([bulk.VALID, bulk.FRAMES_OUT_OF_RANGE],
+                         list(result.codes))
+
+    def test_too_long_fields(self):
+        """testing if the fields too long to fit in an int64 are reported as
+        malformed
+        """
+        result = self._validate_both(
+            ['999999999999999999:00:00:00', '00:00:00:0000000001'], '25'
+        )
+        self.assertEqual([bulk.MALFORMED, bulk.MALFORMED],
+                         list(result.codes))
+        self.assertEqual([0, 0], list(result.frames))
+
+    def test_not_strings(self):
+        """testing if the items which are not strings are malformed
+        """
+        result = validate_timecodes(['00:00:01:00', None, 12], '25')
+        self.assertEqual([26, 0, 0], list(result.frames))
+        self.assertEqual([bulk.VALID, bulk.MALFORMED, bulk.MALFORMED],
+                         list(result.codes))
+
+    def test_bytes_and_empty(self):
+        """testing if bytes are validated and an empty input results empty
+        arrays
+        """
+        result = self._validate_both([b'00:00:01:00', b'00:00:01:25'], '25')
+        self.assertEqual([bulk.VALID, bulk.FRAMES_OUT_OF_RANGE],
+                         list(result.codes))
+        result = self._validate_both([], '25')
+        self.assertEqual(0, len(result.frames))
+        self.assertEqual(0, len(result.codes))
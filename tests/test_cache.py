@@ -0,0 +1,117 @@
+#!-*- coding: utf-8 -*-
+
+import unittest
+
+from timecode import CacheInfo, LRUCache, Timecode
+
+
+class LRUCacheTester(unittest.TestCase):
+    """tests the LRUCache class
+    """
+
+    def test_get_and_put(self):
+        """testing if the values can be stored and the statistics are counted
+        """
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(1, cache.get('a'))
+        self.assertIn('a', cache)
+        self.assertEqual(CacheInfo(1, 1, 0, 1, 2), cache.info())
+
+    def test_least_recently_used_is_evicted(self):
+        """testing if the least recently used item is evicted when the cache
+        is full
+        """
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(1, cache.info().evictions)
+
+        cache.capacity = 1
+        self.assertEqual(['c'], [key for key in 'abc' if key in cache])
+        self.assertEqual(2, cache.info().evictions)
+
+    def test_clear(self):
+        """testing if clear removes the items and resets the statistics
+        """
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(CacheInfo(0, 0, 0, 0, 2), cache.info())
+
+    def test_capacity_is_validated(self):
+        """testing if a ValueError is raised for an invalid capacity
+        """
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+        with self.assertRaises(ValueError):
+            LRUCache('10')
+
+
+class TimecodeCacheTester(unittest.TestCase):
+    """tests the caching of the timecode strings
+    """
+
+    def setUp(self):
+        Timecode.enable_cache(capacity=2, parse_capacity=3)
+
+    def tearDown(self):
+        Timecode.disable_cache()
+
+    def test_cache_is_disabled_by_default(self):
+        """testing if cache_info returns None when the cache is disabled
+        """
+        Timecode.disable_cache()
+        self.assertIsNone(Timecode.cache_info())
+        self.assertEqual('00:00:01:00', Timecode('24', frames=25).__repr__())
+
+    def test_format_cache(self):
+        """testing if the string representations are cached by frame rate and
+        frames
+        """
+        self.assertEqual('00:01:00:02',
+                         Timecode('29.97', frames=1801).__repr__())
+        self.assertEqual('00:01:00:02',
+                         Timecode('29.97', frames=1801).__repr__())
+        self.assertEqual('00:01:00:00',
+                         Timecode('30', frames=1801).__repr__())
+        self.assertEqual(CacheInfo(1, 2, 0, 2, 2),
+                         Timecode.cache_info()['format'])
+
+        tc = Timecode('24', frames=25)
+        self.assertEqual('00:00:01:00', tc.__repr__())
+        self.assertEqual(1, tc.secs)
+        self.assertEqual(1, Timecode.cache_info()['format'].evictions)
+
+        # the cached fields follow the changes of the frames
+        tc.next()
+        self.assertEqual('00:00:01:01', tc.__repr__())
+
+    def test_parse_cache(self):
+        """testing if the parsed timecodes are cached by frame rate and
+        timecode string
+        """
+        self.assertEqual(1801, Timecode('29.97', '00:01:00:02').frames)
+        self.assertEqual(1801, Timecode('29.97', '00:01:00:02').frames)
+        self.assertEqual(1803, Timecode('30', '00:01:00:02').frames)
+        self.assertEqual(CacheInfo(1, 2, 0, 2, 3),
+                         Timecode.cache_info()['parse'])
+
+        self.assertTrue(Timecode('29.97', frames=1801) == '00:01:00:02')
+
+    def test_clear_cache(self):
+        """testing if clear_cache empties the caches
+        """
+        Timecode('24', '00:00:01:00').__repr__()
+        Timecode.clear_cache()
+        info = Timecode.cache_info()
+        self.assertEqual(CacheInfo(0, 0, 0, 0, 2), info['format'])
+        self.assertEqual(CacheInfo(0, 0, 0, 0, 3), info['parse'])
@@ -0,0 +1,169 @@
+#!-*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode.clock import ClockTick, TimecodeClock
+
+
+class FakeClock(object):
+    """a monotonic clock in nanoseconds which only moves when it is advanced
+    """
+
+    def __init__(self):
+        self.ns = 0
+
+    def __call__(self):
+        return self.ns
+
+
+class FakeClockLoop(asyncio.SelectorEventLoop):
+    """an event loop running on a :class:`FakeClock`, instead of waiting for
+    its timers it advances the clock to them, and ``lag_ns`` later to wake up
+    late like a busy loop
+    """
+
+    def __init__(self, clock, lag_ns=0):
+        super(FakeClockLoop, self).__init__()
+        self.clock = clock
+        self.lag_ns = lag_ns
+        select = self._selector.select
+
+        def fake_select(timeout=None):
+            if timeout:
+                clock.ns += round(timeout * 1e9) + lag_ns
+            return select(0)
+
+        self._selector.select = fake_select
+
+    def time(self):
+        return self.clock.ns / 1e9
+
+
+class TimecodeClockTester(unittest.TestCase):
+    """tests the TimecodeClock class
+    """
+
+    def run_main(self, main, fake_clock, lag_ns=0):
+        """runs the given coroutine in a loop running on the fake clock
+        """
+        loop = FakeClockLoop(fake_clock, lag_ns)
+        try:
+            return loop.run_until_complete(main)
+        finally:
+            loop.close()
+
+    def run_clock(self, clock, seconds, subscribers=1, lag_ns=0):
+        """runs the clock for the given seconds of its fake clock and returns
+        the ticks of each subscriber
+        """
+        async def collect(ticks):
+            async for tick in clock.ticks():
+                ticks.append(tick)
+
+        async def main():
+            results = [[] for _ in range(subscribers)]
+            tasks = [asyncio.ensure_future(collect(ticks))
+                     for ticks in results]
+            # let the subscribers wait before the first tick
+            await asyncio.sleep(0)
+            clock.start()
+            await asyncio.sleep(seconds)
+            clock.stop()
+            await asyncio.gather(*tasks)
+            return results
+
+        return self.run_main(main(), clock.clock, lag_ns)
+
+    def test_ticks(self):
+        """testing if the clock ticks at the frame rate starting from the
+        given timecode
+        """
+        clock = TimecodeClock(Timecode('29.97', '00:00:59:28'),
+                              clock=FakeClock())
+        ticks, other_ticks = self.run_clock(clock, 0.3, subscribers=2)
+        self.assertEqual(ticks, other_ticks)
+        self.assertIsInstance(ticks[0], ClockTick)
+        self.assertEqual('00:00:59:28', ticks[0].timecode)
+        self.assertEqual('00:01:00:02', ticks[2].timecode)
+
+        # the 10th frame of 29.97 starts at 0.3003 seconds
+        self.assertEqual(9, len(ticks))
+        for previous, tick in zip(ticks, ticks[1:]):
+            self.assertEqual(previous.frames + 1, tick.frames)
+            self.assertEqual(0, tick.dropped)
+            self.assertEqual(0, tick.late_ns)
+        # the tick times are rounded up to the nanosecond
+        self.assertEqual(266933334, ticks[-1].time_ns)
+        self.assertEqual(ticks[-1].frames, clock.frames)
+        self.assertEqual(0, clock.late_ticks)
+        self.assertFalse(clock.running)
+
+    def test_ticks_do_not_drift(self):
+        """testing if the tick times are calculated from the start time
+        """
+        clock = TimecodeClock(Timecode('59.94', frames=1), clock=FakeClock(),
+                              tolerance_ns=1000000)
+        # the loop wakes the clock up 3 ms late every time
+        ticks, = self.run_clock(clock, 0.2, lag_ns=3000000)
+        self.assertEqual(12, len(ticks))
+        start_ns = ticks[0].time_ns
+        for tick in ticks[1:]:
+            index = tick.frames - 1
+            exact_ns = start_ns - (-index * 1001000000000 // 60000)
+            self.assertEqual(3000000, tick.late_ns)
+            self.assertEqual(exact_ns + 3000000, tick.time_ns)
+            self.assertEqual(0, tick.dropped)
+        self.assertEqual(11, clock.late_ticks)
+        self.assertEqual(3000000, clock.max_late_ns)
+
+    def test_dropped_ticks(self):
+        """testing if the ticks missed while the event loop was blocked are
+        reported
+        """
+        fake_clock = FakeClock()
+        clock = TimecodeClock(Timecode('25', frames=1), clock=fake_clock)
+        blocked = []
+
+        def block(tick):
+            if not blocked:
+                blocked.append(tick)
+                # block the loop for 0.2 seconds, 5 frames at 25
+                fake_clock.ns += 200000000
+
+        clock.add_callback(block)
+        ticks, = self.run_clock(clock, 0.3)
+        self.assertEqual(6, ticks[1].frames)
+        self.assertEqual(4, ticks[1].dropped)
+        self.assertEqual(0, ticks[1].late_ns)
+        self.assertEqual(4, clock.dropped_ticks)
+        # the clock runs until 0.3 seconds from the start
+        self.assertEqual([6, 7, 8], [tick.frames for tick in ticks[1:]])
+
+    def test_jam_sync(self):
+        """testing if the clock continues from the jam synced timecode
+        """
+        fake_clock = FakeClock()
+        clock = TimecodeClock(Timecode('24', frames=1), clock=fake_clock)
+        ticks = []
+
+        async def main():
+            clock.add_callback(ticks.append)
+            clock.start()
+            await asyncio.sleep(0.1)
+            clock.jam_sync('10:00:00:00')
+            await asyncio.sleep(0.1)
+            clock.stop()
+
+        self.run_main(main(), fake_clock)
+        self.assertEqual(
+            ['00:00:00:00', '00:00:00:01', '00:00:00:02',
+             '10:00:00:00', '10:00:00:01', '10:00:00:02'],
+            [tick.timecode for tick in ticks]
+        )
+        self.assertEqual(100000000, ticks[3].time_ns)
+        self.assertEqual(Timecode('24', '10:00:00:00').frames,
+                         ticks[3].frames)
+        with self.assertRaises(TimecodeError):
+            clock.jam_sync(Timecode('25', '10:00:00:00'))
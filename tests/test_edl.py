@@ -0,0 +1,142 @@
+#!-*- coding: utf-8 -*-
+
+import io
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode.edl import EDLEvent, EDLReader, EDLWriter, read_edl
+
+
+EDL = """TITLE: Test Edit
+FCM: NON-DROP FRAME
+
+001  AX       V     C        01:00:00:00 01:00:05:00 00:00:00:00 00:00:05:00
+* FROM CLIP NAME: shot_010.mov
+002  BL       V     C        00:00:00:00 00:00:01:00 00:00:05:00 00:00:06:00
+002  AX       V     D    024 02:00:00:00 02:00:03:00 00:00:05:00 00:00:08:00
+M2   AX       050.0                      02:00:00:00
+FCM: DROP FRAME
+003  AX       AA/V  C        00:00:59;28 00:01:00;02 00:00:08;00 00:00:08;04
+"""
+
+FCM_RATES = ['30', '30', '30', '29.97']
+
+
+class EDLTester(unittest.TestCase):
+    """tests the EDL reader and writer
+    """
+
+    def test_read(self):
+        """testing if the events are read with their comments and frame
+        rates
+        """
+        reader = EDLReader(io.StringIO(EDL), '29.97')
+        events = list(reader)
+        self.assertEqual('Test Edit', reader.title)
+        self.assertEqual(4, len(events))
+
+        event = events[0]
+        self.assertEqual(1, event.number)
+        self.assertEqual('AX', event.reel)
+        self.assertEqual('V', event.track)
+        self.assertEqual('C', event.transition)
+        self.assertIsNone(event.duration)
+        self.assertEqual('30', event.rate.framerate)
+        self.assertEqual(Timecode('30', '01:00:00:00').frames, event.src_in)
+        self.assertEqual('01:00:05:00', event.src_out_tc.__repr__())
+        self.assertEqual(1, event.rec_in)
+        self.assertEqual(['* FROM CLIP NAME: shot_010.mov'], event.comments)
+
+        event = events[2]
+        self.assertEqual('D', event.transition)
+        self.assertEqual(24, event.duration)
+        self.assertEqual(1, len(event.comments))
+
+        event = events[3]
+        self.assertEqual('29.97', event.rate.framerate)
+        self.assertEqual('AA/V', event.track)
+        self.assertEqual(1799, event.src_in)
+        self.assertEqual(Timecode('29.97', '00:01:00:02'), event.src_out_tc)
+        self.assertEqual('00:00:08:04', event.rec_out_tc.__repr__())
+
+    def test_read_bytes(self):
+        """testing if binary files can be read
+        """
+        events = list(read_edl(io.BytesIO(EDL.encode('ascii')), '30'))
+        self.assertEqual(4, len(events))
+        self.assertEqual(FCM_RATES, [e.rate.framerate for e in events])
+
+    def test_read_error(self):
+        """testing if a TimecodeError is raised for malformed events
+        """
+        edl = '001  AX  V  C  01:00:00:00 01:00:05:00 00:00:00:00 00:00:xx:00'
+        with self.assertRaises(TimecodeError):
+            list(read_edl([edl], '25'))
+
+    def test_key_events(self):
+        """testing if the key events with a background or overlay qualifier
+        and an optional duration are read
+        """
+        edl = [
+            '001  KEY1  V  K B  00:00:00:00 00:00:05:00 01:00:10:00 '
+            '01:00:15:00',
+            '001  KEY2  V  K O 030 00:00:00:00 00:00:05:00 01:00:10:00 '
+            '01:00:15:00',
+            '002  KEY3  V  K  00:00:00:00 00:00:05:00 01:00:10:00 '
+            '01:00:15:00',
+        ]
+        events = list(read_edl(edl, '25'))
+        self.assertEqual(['K B', 'K O', 'K'],
+                         [e.transition for e in events])
+        self.assertEqual([None, 30, None], [e.duration for e in events])
+        self.assertEqual(['KEY1', 'KEY2', 'KEY3'], [e.reel for e in events])
+        self.assertEqual(Timecode('25', '01:00:15:00').frames,
+                         events[1].rec_out)
+
+        output = io.StringIO()
+        EDLWriter(output, '25').write(events)
+        read_events = list(read_edl(io.StringIO(output.getvalue()), '25'))
+        self.assertEqual(['K B', 'K O', 'K'],
+                         [e.transition for e in read_events])
+        self.assertEqual([None, 30, None],
+                         [e.duration for e in read_events])
+
+    def test_round_trip(self):
+        """testing if the written EDL is read back the same
+        """
+        for fr, separator in (('29.97', ';'), ('25', ':')):
+            events = [
+                EDLEvent(i + 1, 'AX', 'V', 'C', None, i * 100 + 1,
+                         i * 100 + 51, i * 50 + 1, i * 50 + 51, fr,
+                         ['* FROM CLIP NAME: %s.mov' % i])
+                for i in range(50)
+            ]
+            output = io.StringIO()
+            writer = EDLWriter(output, fr, title='Round Trip',
+                               separator=separator)
+            writer.write(events)
+
+            reader = EDLReader(io.StringIO(output.getvalue()), fr)
+            read_events = list(reader)
+            self.assertEqual('Round Trip', reader.title)
+            self.assertEqual(len(events), len(read_events))
+            for event, read_event in zip(events, read_events):
+                for attr in EDLEvent.__slots__:
+                    self.assertEqual(getattr(event, attr),
+                                     getattr(read_event, attr))
+
+    def test_write(self):
+        """testing the written lines
+        """
+        output = io.StringIO()
+        writer = EDLWriter(output, '29.97')
+        writer.write_event(
+            EDLEvent(1, 'AX', 'V', 'D', 24, 1, 1801, 1, 1801, '29.97')
+        )
+        self.assertEqual(
+            'FCM: DROP FRAME\n\n'
+            '001  AX       V     D    024 00:00:00:00 00:01:00:02 '
+            '00:00:00:00 00:01:00:02\n',
+            output.getvalue()
+        )
+
@@ -0,0 +1,186 @@
+#!-*- coding: utf-8 -*-
+
+import io
+import mmap
+import os
+import tempfile
+import threading
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode.formatting import (export_timecodes, iter_timecodes,
+                                 record_width, write_timecodes,
+                                 write_timecodes_fd)
+
+
+FRAMERATES = ['23.98', '24', '25', '29.97', '30', '50', '59.94', '60', 'ms',
+              'frames']
+
+
+class IterTimecodesTester(unittest.TestCase):
+    """tests the iter_timecodes and write_timecodes functions
+    """
+
+    def _starts(self, framerate):
+        """returns start timecodes before the interesting boundaries
+        """
+        rate = Timecode(framerate)._rate
+        return [
+            Timecode(framerate, frames=1),
+            Timecode(framerate, frames=-5),
+            Timecode(framerate, frames=rate.frames_per_10_minutes - 50),
+            Timecode(framerate, frames=rate.frames_per_24_hours - 70),
+            Timecode(framerate, frames=rate.frames_per_24_hours * 3 - 3),
+        ]
+
+    def test_matches_repr(self):
+        """testing if the generated strings are the same with the __repr__ of
+        the Timecode class for every framerate
+        """
+        for fr in FRAMERATES:
+            count = 4000 if fr != 'ms' else 2500
+            for start in self._starts(fr):
+                expected = [
+                    Timecode(fr, frames=start.frames + i).__repr__()
+                    for i in range(count)
+                ]
+                self.assertEqual(expected,
+                                 list(iter_timecodes(start, count)))
+
+    def test_drop_frame_minutes(self):
+        """testing if the dropped frame numbers are skipped
+        """
+        start = Timecode('29.97', '00:00:59:28')
+        self.assertEqual(
+            ['00:00:59;28', '00:00:59;29', '00:01:00;02', '00:01:00;03'],
+            list(iter_timecodes(start, 4, separator=';'))
+        )
+        start = Timecode('29.97', '00:09:59:29')
+        self.assertEqual(['00:09:59:29', '00:10:00:00', '00:10:00:01'],
+                         list(iter_timecodes(start, 3)))
+
+    def test_endless(self):
+        """testing if the timecodes are generated forever without a count
+        """
+        generator = iter_timecodes(Timecode('24', '23:59:59:23'))
+        self.assertEqual('23:59:59:23', next(generator))
+        self.assertEqual('00:00:00:00', next(generator))
+        self.assertEqual('00:00:00:01', next(generator))
+
+    def test_does_not_change_start(self):
+        """testing if the start timecode is not changed
+        """
+        start = Timecode('25', '01:00:00:00')
+        list(iter_timecodes(start, 100))
+        self.assertEqual('01:00:00:00', start)
+
+    def test_write_timecodes(self):
+        """testing if the timecodes are written with the terminator
+        """
+        start = Timecode('59.94', '00:00:59:50')
+        output = io.StringIO()
+        write_timecodes(output, start, 300, terminator='\r\n')
+        self.assertEqual(
+            ''.join(tc + '\r\n' for tc in iter_timecodes(start, 300)),
+            output.getvalue()
+        )
+
+
+class ExportTimecodesTester(unittest.TestCase):
+    """tests the export_timecodes and write_timecodes_fd functions
+    """
+
+    def test_matches_iter_timecodes(self):
+        """testing if the records are the same with the strings of
+        iter_timecodes
+        """
+        for fr in FRAMERATES:
+            start = Timecode(fr, frames=Timecode(fr)._rate.frames_per_24_hours
+                             - 1500)
+            count = 3000
+            buffer = bytearray(record_width(fr) * count)
+            self.assertEqual(len(buffer),
+                             export_timecodes(buffer, start, count))
+            expected = list(iter_timecodes(start, count))
+            if fr == 'ms':
+                # the frames always have 3 digits
+                expected = [tc[:9] + '%03d' % int(tc[9:]) for tc in expected]
+            self.assertEqual(expected,
+                             buffer.decode('ascii').splitlines())
+
+    def test_separator_terminator_offset(self):
+        """testing if the separator, the terminator and the offset are used
+        """
+        self.assertEqual(13, record_width('29.97', ';', '\r\n'))
+        self.assertEqual(13, record_width('ms'))
+        buffer = bytearray(b'#' * 30)
+        written = export_timecodes(buffer, Timecode('29.97', '00:00:59:29'),
+                                   2, separator=';', terminator='\r\n',
+                                   offset=3)
+        self.assertEqual(26, written)
+        self.assertEqual(b'###00:00:59;29\r\n00:01:00;02\r\n#',
+                         bytes(buffer))
+
+    def test_buffer_types(self):
+        """testing if the timecodes can be written to a memoryview and an mmap
+        """
+        start = Timecode('25', '01:00:00:00')
+        buffer = bytearray(24)
+        export_timecodes(memoryview(buffer)[12:], start, 1)
+        self.assertEqual(b'01:00:00:00\n', bytes(buffer[12:]))
+
+        mapped = mmap.mmap(-1, 24)
+        try:
+            export_timecodes(mapped, start, 2)
+            self.assertEqual(b'01:00:00:00\n01:00:00:01\n', mapped[:])
+        finally:
+            mapped.close()
+
+    def test_errors(self):
+        """testing if the small and the read only buffers raise errors
+        """
+        start = Timecode('25')
+        with self.assertRaises(TimecodeError):
+            export_timecodes(bytearray(23), start, 2)
+        with self.assertRaises(TimecodeError):
+            export_timecodes(bytearray(24), start, 2, offset=1)
+        with self.assertRaises(TimecodeError):
+            export_timecodes(bytes(24), start, 2)
+
+    def test_write_timecodes_fd(self):
+        """testing if the timecodes are written to a file descriptor in
+        chunks
+        """
+        start = Timecode('59.94', '00:09:59:00')
+        count = 1000
+        expected = ''.join(tc + '\n' for tc in iter_timecodes(start, count))
+        with tempfile.TemporaryFile() as f:
+            written = write_timecodes_fd(f.fileno(), start, count,
+                                         chunk_frames=64)
+            self.assertEqual(len(expected), written)
+            f.seek(0)
+            self.assertEqual(expected.encode('ascii'), f.read())
+        self.assertEqual('00:09:59:00', start.__repr__())
+
+    def test_write_timecodes_fd_pipe(self):
+        """testing if the partial writes to a pipe are continued
+        """
+        start = Timecode('24')
+        count = 100000
+        read_fd, write_fd = os.pipe()
+        chunks = []
+        reader = threading.Thread(
+            target=lambda: chunks.extend(iter(
+                lambda: os.read(read_fd, 65536), b''
+            ))
+        )
+        reader.start()
+        try:
+            write_timecodes_fd(write_fd, start, count)
+        finally:
+            os.close(write_fd)
+            reader.join()
+            os.close(read_fd)
+        data = b''.join(chunks)
+        self.assertEqual(record_width('24') * count, len(data))
+        self.assertEqual(b'01:09:26:15\n', data[-12:])
@@ -0,0 +1,111 @@
+#!-*- coding: utf-8 -*-
+
+import random
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode.intervals import Interval, IntervalIndex
+
+
+class IntervalIndexTester(unittest.TestCase):
+    """tests IntervalIndex class
+    """
+
+    def _brute_force(self, intervals, start, end):
+        return sorted(
+            i for i in intervals if i[0] < end and i[1] > start
+        )
+
+    def _check_tree(self, index):
+        """checks the AVL and max_end invariants of the index
+        """
+        def check(node):
+            if node is None:
+                return 0, None
+            left_height, left_end = check(node.left)
+            right_height, right_end = check(node.right)
+            self.assertLessEqual(abs(left_height - right_height), 1)
+            self.assertEqual(
+                max(e for e in (node.end, left_end, right_end)
+                    if e is not None),
+                node.max_end
+            )
+            return max(left_height, right_height) + 1, node.max_end
+        check(index._root)
+
+    def test_queries_match_brute_force(self):
+        """testing if the stabbing and overlap queries return the same
+        intervals with a linear scan
+        """
+        rnd = random.Random(0)
+        intervals = []
+        for i in range(2000):
+            start = rnd.randrange(0, 100000)
+            intervals.append((start, start + rnd.randrange(1, 3000), i))
+
+        bulk = IntervalIndex('25', intervals)
+        incremental = IntervalIndex('25')
+        for interval in intervals:
+            incremental.add(*interval)
+
+        for index in (bulk, incremental):
+            self.assertEqual(len(intervals), len(index))
+            self.assertEqual(sorted(intervals), [tuple(i) for i in index])
+            self._check_tree(index)
+            for _ in range(200):
+                start = rnd.randrange(-100, 105000)
+                end = start + rnd.randrange(0, 5000)
+                self.assertEqual(
+                    self._brute_force(intervals, start, end),
+                    [tuple(i) for i in index.overlapping(start, end)]
+                )
+                self.assertEqual(
+                    self._brute_force(intervals, start, start + 1),
+                    [tuple(i) for i in index.at(start)]
+                )
+
+    def test_remove(self):
+        """testing if the intervals can be removed
+        """
+        rnd = random.Random(1)
+        intervals = [(i % 50, i % 50 + 10, i) for i in range(500)]
+        index = IntervalIndex.from_sorted('24', sorted(intervals))
+        rnd.shuffle(intervals)
+        for interval in intervals[:400]:
+            index.remove(*interval)
+        self._check_tree(index)
+        remaining = sorted(intervals[400:])
+        self.assertEqual(remaining, [tuple(i) for i in index])
+        self.assertEqual(self._brute_force(remaining, 20, 21),
+                         [tuple(i) for i in index.at(20)])
+
+        with self.assertRaises(KeyError):
+            index.remove(*intervals[0])
+
+    def test_timecodes(self):
+        """testing if Timecode instances and drop frame timecode strings are
+        converted with the frame rate of the index
+        """
+        index = IntervalIndex('29.97')
+        index.add('00:00:00;00', '00:01:00;02', 'first')
+        index.add(Timecode('29.97', '00:01:00:02'),
+                  Timecode('29.97', '00:02:00:00'), 'second')
+
+        self.assertEqual([Interval(1, 1801, 'first')],
+                         index.at('00:00:59;28'))
+        self.assertEqual(['second'],
+                         [i.data for i in index.at('00:01:00;02')])
+        self.assertEqual(['first', 'second'],
+                         [i.data for i in index.overlapping(
+                             '00:00:59;29', '00:01:00;03')])
+        self.assertEqual([], index.at('00:02:00;00'))
+        with self.assertRaises(TimecodeError):
+            index.at(Timecode('30', '00:01:00:02'))
+
+    def test_errors(self):
+        """testing if the errors are raised for invalid intervals
+        """
+        with self.assertRaises(TimecodeError):
+            IntervalIndex('24', [(10, 5, None)])
+        with self.assertRaises(TimecodeError):
+            IntervalIndex.from_sorted('24', [(10, 15), (5, 15)])
@@ -0,0 +1,146 @@
+#!-*- coding: utf-8 -*-
+
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode import ltc
+from timecode.ltc import LTCDecoder, LTCEncoder, LTCFrame, numpy
+
+
+class LTCTester(unittest.TestCase):
+    """tests the LTC encoder and decoder
+    """
+
+    def decode(self, decoder, samples, chunk_size=997):
+        frames = []
+        for i in range(0, len(samples), chunk_size):
+            frames += decoder.decode(samples[i:i + chunk_size])
+        return frames + decoder.flush()
+
+    def test_round_trip(self):
+        """testing if the encoded timecodes are decoded back in chunks
+        """
+        for framerate in ['23.98', '24', '25', '29.97', '30']:
+            start = Timecode(framerate, '23:59:58:00')
+            for sample_type in ['int16', 'float32']:
+                encoder = LTCEncoder(framerate, sample_type=sample_type)
+                samples = encoder.encode_many(start, 100,
+                                              user_bits=0x89ABCDEF)
+                decoder = LTCDecoder(framerate, sample_type=sample_type)
+                frames = self.decode(decoder, samples)
+                self.assertEqual(100, len(frames))
+                self.assertEqual(
+                    [tc.__repr__() for tc in (start + i for i in range(100))],
+                    [decoder.to_timecode(f).__repr__() for f in frames]
+                )
+                for frame in frames:
+                    self.assertEqual(0x89ABCDEF, frame.user_bits)
+                    self.assertEqual(framerate == '29.97', frame.drop_frame)
+
+    def test_trailing_silence(self):
+        """testing if the last frame is decoded when the audio ends with
+        silence, with and without numpy
+        """
+        encoder = LTCEncoder('25')
+        start = Timecode('25', '01:00:00:00')
+        samples = encoder.encode_many(start, 100)
+        samples.extend([0] * 50)
+        for use_numpy in (True, False):
+            if use_numpy and numpy is None:
+                continue
+            ltc.numpy = numpy if use_numpy else None
+            try:
+                decoder = LTCDecoder('25')
+                frames = self.decode(decoder, samples)
+            finally:
+                ltc.numpy = numpy
+            self.assertEqual(100, len(frames))
+            self.assertEqual(start.frames + 99,
+                             decoder.to_timecode(frames[-1]).frames)
+
+    def test_leading_silence(self):
+        """testing if the signal starting after silence is decoded
+        """
+        encoder = LTCEncoder('25')
+        samples = encoder.encode_many(Timecode('25', '01:00:00:00'), 10)
+        samples[0:0] = type(samples)(samples.typecode, [0] * 30)
+        frames = self.decode(LTCDecoder('25'), samples)
+        self.assertEqual(10, len(frames))
+        self.assertEqual(30, frames[0].sample)
+
+        if numpy is not None:
+            # the first level change is found once
+            decoder = LTCDecoder('25')
+            edges = decoder._find_edges_numpy(
+                numpy.array([0, 0, 9000, 9000, -9000], dtype=numpy.int16), 100
+            )
+            self.assertEqual([2, 4], edges)
+
+    def test_frame_length(self):
+        """testing if the frames take the exact time of the frame rate
+        """
+        encoder = LTCEncoder('29.97', sample_rate=48000)
+        samples = encoder.encode_many(Timecode('29.97'), 30)
+        # 30 frames at 30000/1001 fps is 1.001 seconds
+        self.assertEqual(48048, len(samples))
+        decoder = LTCDecoder('29.97')
+        frames = self.decode(decoder, samples)
+        self.assertEqual(0, frames[0].sample)
+        self.assertEqual(1601, frames[1].sample)
+
+    def test_frame_bits(self):
+        """testing the bits of a frame
+        """
+        encoder = LTCEncoder('25')
+        bits = encoder.frame_bits(12, 34, 56, 23, user_bits=0xF,
+                                  color_frame=True)
+        self.assertEqual(80, len(bits))
+        self.assertEqual([1, 1, 0, 0], bits[0:4])  # 3 frames
+        self.assertEqual([1, 1, 1, 1], bits[4:8])  # first user bits
+        self.assertEqual([0, 1], bits[8:10])  # 20 frames
+        self.assertEqual([0, 1], bits[10:12])  # drop and color frame
+        self.assertEqual([0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1],
+                         bits[64:])
+        # the polarity correction keeps the number of zeros even
+        self.assertEqual(0, bits.count(0) % 2)
+
+    def test_decode_bytes(self):
+        """testing if the samples can be given as bytes
+        """
+        encoder = LTCEncoder('24')
+        samples = encoder.encode(Timecode('24', '01:02:03:04'), user_bits=5)
+        samples += encoder.encode(Timecode('24', '01:02:03:05'))
+        decoder = LTCDecoder('24')
+        frames = decoder.decode(samples.tobytes()) + decoder.flush()
+        self.assertEqual(
+            [LTCFrame(1, 2, 3, 4, False, False, 5, 0),
+             LTCFrame(1, 2, 3, 5, False, False, 0, 2000)],
+            frames
+        )
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_decode_noisy_signal(self):
+        """testing if a quiet, filtered and noisy signal is decoded
+        """
+        encoder = LTCEncoder('30', sample_rate=44100)
+        start = Timecode('30', '10:00:00:00')
+        samples = numpy.frombuffer(encoder.encode_many(start, 60),
+                                   dtype=numpy.int16) * 0.25
+        samples = numpy.convolve(samples, numpy.ones(5) / 5, mode='same')
+        samples += numpy.random.RandomState(0).normal(0, 300, len(samples))
+        decoder = LTCDecoder('30', sample_rate=44100)
+        frames = self.decode(decoder, samples.astype(numpy.int16), 4410)
+        self.assertEqual(list(range(start.frames, start.frames + 60)),
+                         [decoder.to_timecode(f).frames for f in frames])
+
+    def test_unsupported_framerates(self):
+        """testing if a TimecodeError is raised for the frame rates LTC can
+        not carry
+        """
+        for framerate in ['50', '59.94', 'ms', 'frames']:
+            with self.assertRaises(TimecodeError):
+                LTCEncoder(framerate)
+            with self.assertRaises(TimecodeError):
+                LTCDecoder(framerate)
+        with self.assertRaises(TimecodeError):
+            LTCEncoder('25', sample_type='int8')
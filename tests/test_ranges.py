@@ -0,0 +1,267 @@
+#!-*- coding: utf-8 -*-
+
+import pickle
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode import ranges
+from timecode.ranges import TimecodeRange, TimecodeRangeSet
+
+
+class TimecodeRangeTester(unittest.TestCase):
+    """tests TimecodeRange class
+    """
+
+    def test_creation(self):
+        """testing if the range can be created from timecodes, strings and
+        frames
+        """
+        tc_range = TimecodeRange('00:00:00:00', '00:00:01:00', '24')
+        self.assertEqual(1, tc_range.start)
+        self.assertEqual(25, tc_range.stop)
+        self.assertEqual(1, tc_range.step)
+        self.assertEqual('24', tc_range.framerate)
+
+        self.assertEqual(
+            tc_range,
+            TimecodeRange(Timecode('24'), Timecode('24', '00:00:01:00'), '24')
+        )
+        self.assertEqual(tc_range, TimecodeRange(1, 25, '24'))
+        self.assertNotEqual(tc_range, TimecodeRange(1, 25, '25'))
+
+        with self.assertRaises(TimecodeError):
+            TimecodeRange(1.0, 25, '24')
+
+    def test_different_framerate(self):
+        """testing if the timecodes with a different frame rate raise errors
+        """
+        tc_range = TimecodeRange(Timecode('24', frames=100), 200, '24')
+        with self.assertRaises(TimecodeError):
+            Timecode('30', frames=100) in tc_range
+        with self.assertRaises(TimecodeError):
+            TimecodeRange(Timecode('30', frames=100), 200, '24')
+        with self.assertRaises(TimecodeError):
+            Timecode('30', frames=100) in TimecodeRangeSet('24', [tc_range])
+        self.assertIn(Timecode(24, frames=100), tc_range)
+
+    def test_drop_frame(self):
+        """testing if the drop frame timecodes are correctly converted
+        """
+        tc_range = TimecodeRange('00:00:59;29', '00:01:00;04', '29.97')
+        self.assertEqual(3, len(tc_range))
+        self.assertEqual(['00:00:59:29', '00:01:00:02', '00:01:00:03'],
+                         list(tc_range.timecodes()))
+        self.assertIn('00:01:00;02', tc_range)
+        self.assertNotIn('00:01:00;04', tc_range)
+
+    def test_sequence_protocol(self):
+        """testing len, in, indexing and slicing
+        """
+        start = Timecode('59.94', '00:00:00:00')
+        end = Timecode('59.94', '02:00:00:00')
+        tc_range = TimecodeRange(start, end, '59.94')
+        self.assertEqual(end.frames - start.frames, len(tc_range))
+        self.assertIn(start, tc_range)
+        self.assertIn(start.frames + 1000, tc_range)
+        self.assertIn('01:00:00:00', tc_range)
+        self.assertNotIn(end, tc_range)
+        self.assertNotIn('bad', tc_range)
+        self.assertNotIn(1.5, tc_range)
+
+        self.assertEqual(1, tc_range[0])
+        self.assertEqual(end.frames - 1, tc_range[-1])
+        self.assertEqual(Timecode('59.94', '01:59:59:59'),
+                         tc_range.timecode(-1))
+        self.assertEqual(3600, tc_range.index('00:01:00:04'))
+        self.assertEqual(1, tc_range.count(start))
+        self.assertEqual(0, tc_range.count(end))
+
+        sliced = tc_range[10:20:2]
+        self.assertIsInstance(sliced, TimecodeRange)
+        self.assertEqual([11, 13, 15, 17, 19], list(sliced))
+        self.assertEqual(2, sliced.step)
+        self.assertEqual([19, 17, 15, 13, 11], list(reversed(sliced)))
+
+    def test_step(self):
+        """testing if the step is used while iterating
+        """
+        tc_range = TimecodeRange('00:00:00:00', '00:00:02:00', '25', step=25)
+        self.assertEqual([1, 26], list(tc_range))
+        self.assertEqual(['00:00:00:00', '00:00:01:00'],
+                         list(tc_range.timecodes()))
+        self.assertNotIn('00:00:00:01', tc_range)
+
+    def test_immutable(self):
+        """testing if the range can not be changed and can be hashed
+        """
+        tc_range = TimecodeRange(1, 25, '24')
+        with self.assertRaises(AttributeError):
+            tc_range.rate = None
+        self.assertEqual(hash(tc_range), hash(TimecodeRange(1, 25, '24')))
+        self.assertEqual(
+            "TimecodeRange('00:00:00:00', '00:00:01:00', '24', step=1)",
+            repr(tc_range)
+        )
+
+
+class TimecodeRangeSetTester(unittest.TestCase):
+    """tests TimecodeRangeSet class
+    """
+
+    def _both(self, function):
+        """calls the function with and without numpy and checks if the
+        results are the same
+        """
+        result = function()
+        numpy = ranges.numpy
+        if numpy is not None:
+            ranges.numpy = None
+            try:
+                self.assertEqual(result, function())
+            finally:
+                ranges.numpy = numpy
+        return result
+
+    def test_normalize(self):
+        """testing if the ranges are sorted and the overlapping, touching and
+        empty ones are merged
+        """
+        range_set = self._both(lambda: TimecodeRangeSet(
+            '25', [(30, 40), (1, 10), (5, 20), (40, 45), (50, 50), (60, 55)]
+        ))
+        self.assertEqual([(1, 20), (30, 45)], list(range_set.intervals()))
+        self.assertEqual(2, len(range_set))
+        self.assertEqual(34, range_set.duration)
+
+    def test_only_empty_ranges(self):
+        """testing if a set of only empty or inverted ranges is empty
+        """
+        range_set = self._both(lambda: TimecodeRangeSet('25', [(5, 5)]))
+        self.assertEqual(0, len(range_set))
+        range_set = self._both(
+            lambda: TimecodeRangeSet.from_arrays('25', [5, 9], [3, 2])
+        )
+        self.assertEqual(0, len(range_set))
+        self.assertEqual(0, range_set.duration)
+
+    def test_creation(self):
+        """testing if the set can be created from timecode ranges, timecodes,
+        strings, frames and arrays
+        """
+        from array import array
+        expected = TimecodeRangeSet('24', [(1, 25)])
+        self.assertEqual(
+            expected,
+            TimecodeRangeSet('24', [TimecodeRange(1, 25, '24')])
+        )
+        self.assertEqual(
+            expected,
+            TimecodeRangeSet('24', [(Timecode('24'), '00:00:01:00')])
+        )
+        self.assertEqual(
+            expected,
+            self._both(lambda: TimecodeRangeSet.from_arrays(
+                '24', array('q', [1, 10]), [12, 25]
+            ))
+        )
+        self.assertNotEqual(expected, TimecodeRangeSet('25', [(1, 25)]))
+        with self.assertRaises(TimecodeError):
+            TimecodeRangeSet('24', [TimecodeRange(1, 25, '24', step=2)])
+        with self.assertRaises(TimecodeError):
+            TimecodeRangeSet.from_arrays('24', [1, 2], [3])
+
+    def test_contains(self):
+        """testing if the timecodes in the ranges are found
+        """
+        range_set = TimecodeRangeSet('25', [(1, 10), (30, 40)])
+        self.assertIn(1, range_set)
+        self.assertIn('00:00:01:05', range_set)
+        self.assertIn(Timecode('25', frames=39), range_set)
+        self.assertNotIn(0, range_set)
+        self.assertNotIn(10, range_set)
+        self.assertNotIn(40, range_set)
+        self.assertNotIn('bad', range_set)
+
+    def test_set_operations(self):
+        """testing the union, intersection, difference and symmetric
+        difference
+        """
+        first = TimecodeRangeSet('25', [(1, 20), (30, 45)])
+        second = TimecodeRangeSet('25', [(15, 35), (45, 50), (60, 70)])
+
+        def check(operation, expected):
+            result = self._both(lambda: operation(first, second))
+            self.assertEqual(expected, list(result.intervals()))
+
+        check(lambda a, b: a | b, [(1, 50), (60, 70)])
+        check(lambda a, b: a & b, [(15, 20), (30, 35)])
+        check(lambda a, b: a - b, [(1, 15), (35, 45)])
+        check(lambda a, b: b - a, [(20, 30), (45, 50), (60, 70)])
+        check(lambda a, b: a ^ b, [(1, 15), (20, 30), (35, 50), (60, 70)])
+
+        empty = TimecodeRangeSet('25')
+        self.assertFalse(empty)
+        self.assertEqual(first, self._both(lambda: first | empty))
+        self.assertEqual(empty, self._both(lambda: first & empty))
+
+        with self.assertRaises(TimecodeError):
+            first | TimecodeRangeSet('24')
+        with self.assertRaises(TimecodeError):
+            first | [(1, 2)]
+
+    def test_matches_frame_sets(self):
+        """testing if the set operations give the same result with the
+        builtin sets of frames
+        """
+        import random
+        rng = random.Random(7)
+
+        def random_set():
+            pairs = []
+            for _ in range(200):
+                start = rng.randrange(1, 5000)
+                pairs.append((start, start + rng.randrange(0, 60)))
+            return TimecodeRangeSet('30', pairs)
+
+        def frames(range_set):
+            return set(f for tc_range in range_set for f in tc_range)
+
+        for _ in range(5):
+            first = random_set()
+            second = random_set()
+            a = frames(first)
+            b = frames(second)
+            for operation in ('__or__', '__and__', '__sub__', '__xor__'):
+                result = self._both(
+                    lambda: getattr(first, operation)(second)
+                )
+                self.assertEqual(getattr(a, operation)(b), frames(result))
+            self.assertEqual(len(a), first.duration)
+
+    def test_complement_and_gaps(self):
+        """testing if the complement covers the rest of the 24 hours and the
+        gaps are the holes between the ranges
+        """
+        range_set = TimecodeRangeSet('25', [(1, 20), (30, 45), (50, 60)])
+        complement = self._both(range_set.complement)
+        self.assertEqual(
+            [(20, 30), (45, 50), (60, 2160001)], list(complement.intervals())
+        )
+        self.assertEqual(2160000, complement.duration + range_set.duration)
+        self.assertEqual([(20, 30), (45, 50)],
+                         list(range_set.gaps().intervals()))
+        self.assertEqual(0, len(TimecodeRangeSet('25').gaps()))
+
+    def test_iteration_and_pickle(self):
+        """testing if the set yields timecode ranges and can be pickled
+        """
+        range_set = TimecodeRangeSet('29.97', [(1, 10), (30, 40)])
+        self.assertEqual(
+            [TimecodeRange(1, 10, '29.97'), TimecodeRange(30, 40, '29.97')],
+            list(range_set)
+        )
+        self.assertEqual(range_set, pickle.loads(pickle.dumps(range_set)))
+        self.assertEqual(hash(range_set),
+                         hash(TimecodeRangeSet('29.97', [(30, 40), (1, 10)])))
+        with self.assertRaises(AttributeError):
+            range_set.rate = None
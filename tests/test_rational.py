@@ -0,0 +1,111 @@
+#!-*- coding: utf-8 -*-
+
+import unittest
+from array import array
+from fractions import Fraction
+
+from timecode import FrameRate, Timecode, TimecodeError
+from timecode.rational import (RateConverter, convert_frames,
+                               frames_to_seconds, seconds_to_frames, numpy)
+
+
+class RationalTester(unittest.TestCase):
+    """tests the rational frame rate conversions
+    """
+
+    def test_rational_framerates(self):
+        """testing if the frame rates have the exact rational values
+        """
+        self.assertEqual(Fraction(24000, 1001), FrameRate('23.98').rational)
+        self.assertEqual(Fraction(30000, 1001), FrameRate('29.97').rational)
+        self.assertEqual(Fraction(60000, 1001), FrameRate('59.94').rational)
+        self.assertEqual(25, FrameRate('25').rational)
+        self.assertEqual(1000, FrameRate('ms').rational)
+
+    def test_rounding(self):
+        """testing the rounding modes
+        """
+        # 1 frame in 25 is 1.1988 frames in 29.97
+        self.assertEqual(1, convert_frames(1, '25', '29.97', 'floor'))
+        self.assertEqual(1, convert_frames(1, '25', '29.97', 'nearest'))
+        self.assertEqual(2, convert_frames(1, '25', '29.97', 'ceil'))
+        # 2 frames in 60 is exactly 1 frame in 30, 1 frame is a half
+        self.assertEqual(1, convert_frames(2, '60', '30', 'ceil'))
+        self.assertEqual(0, convert_frames(1, '60', '30', 'floor'))
+        self.assertEqual(1, convert_frames(1, '60', '30', 'nearest'))
+        self.assertEqual(-1, convert_frames(-1, '60', '30', 'floor'))
+
+        with self.assertRaises(TimecodeError):
+            RateConverter('25', '24', rounding='up')
+
+    def test_no_drift(self):
+        """testing if long durations are converted without drift
+        """
+        # 24 hours is 2589410.59 frames in 29.97
+        day = 24 * 60 * 60
+        frames = seconds_to_frames(day, '29.97')
+        self.assertEqual(2589411, frames)
+        self.assertEqual(2589410, seconds_to_frames(day, '29.97', 'floor'))
+        self.assertEqual(day * 25, convert_frames(frames, '29.97', '25'))
+        self.assertEqual(Fraction(1001, 30000), frames_to_seconds(1, '29.97'))
+        # 24000 frames of 23.98 is exactly 1001 seconds
+        self.assertEqual(24024 * 10 ** 9,
+                         convert_frames(24000 * 10 ** 9, '23.98', '24'))
+
+    def test_convert_many(self):
+        """testing if the batch conversions give the same results with the
+        scalar one
+        """
+        values = list(range(-1000, 100000, 7))
+        for rounding in ('floor', 'nearest', 'ceil'):
+            converter = RateConverter('25', '29.97', rounding)
+            expected = [converter.convert(v) for v in values]
+            self.assertEqual(expected, converter.convert_many(values))
+            self.assertEqual(expected,
+                             list(converter.convert_many(iter(values))))
+            self.assertEqual(array('q', expected),
+                             converter.convert_many(array('q', values)))
+            if numpy is not None:
+                self.assertEqual(
+                    expected,
+                    converter.convert_many(numpy.array(values)).tolist()
+                )
+
+    def test_convert_many_limits(self):
+        """testing if the large values are converted exactly and the invalid
+        ones raise errors
+        """
+        converter = RateConverter('29.97', '23.98')
+        values = [2 ** 62, -2 ** 62, 2 ** 63 - 1, 12345]
+        expected = [converter.convert(v) for v in values]
+        self.assertEqual(expected, converter.convert_many(values))
+        self.assertEqual(array('q', expected),
+                         converter.convert_many(array('q', values)))
+        if numpy is None:
+            return
+        self.assertEqual(
+            expected,
+            converter.convert_many(numpy.array(values)).tolist()
+        )
+        self.assertEqual(
+            [converter.convert(2 ** 63 + 10)],
+            converter.convert_many(
+                numpy.array([2 ** 63 + 10], dtype=numpy.uint64)
+            ).tolist()
+        )
+        with self.assertRaises(TimecodeError):
+            converter.convert_many(numpy.array([1.5, 2.0]))
+        with self.assertRaises(TimecodeError):
+            RateConverter('24', '60').convert_many(numpy.array([2 ** 62]))
+
+    def test_convert_timecode(self):
+        """testing if timecodes are converted to show the same time
+        """
+        converter = RateConverter('25', '29.97')
+        tc = converter.convert_timecode(Timecode('25', '00:00:10:00'))
+        self.assertEqual('29.97', tc.framerate)
+        self.assertEqual(300, tc.frame_number)
+
+        converter = RateConverter('24', '48')
+        tc = converter.convert_timecode(Timecode('24', '01:00:00:12'))
+        self.assertEqual('01:00:00:24', tc.__repr__())
@@ -0,0 +1,134 @@
+#!-*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from timecode import Timecode, TimecodeError
+from timecode.segments import Segment, SegmentIndex, SegmentIndexWriter
+
+
+class SegmentIndexTester(unittest.TestCase):
+    """tests the segment index files
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'media.tcsi')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, timecodes):
+        with SegmentIndexWriter(self.path) as writer:
+            for tc in timecodes:
+                writer.add(tc)
+
+    def test_segments_are_joined(self):
+        """testing if the consecutive timecodes are written as segments
+        """
+        tc = Timecode('29.97', '01:00:00:00')
+        timecodes = [tc + i for i in range(100)] + \
+            [Timecode('29.97', '10:00:00:00') + i for i in range(50)] + \
+            [tc + i for i in range(10, 20)]
+        self.write(timecodes)
+
+        with SegmentIndex(self.path) as index:
+            self.assertEqual(160, len(index))
+            self.assertEqual(3, index.segment_count)
+            self.assertEqual(
+                [Segment(0, tc.frames, '29.97', 100),
+                 Segment(100, Timecode('29.97', '10:00:00:00').frames,
+                         '29.97', 50),
+                 Segment(150, tc.frames + 10, '29.97', 10)],
+                list(index.segments())
+            )
+
+            for frame, expected in enumerate(timecodes):
+                self.assertEqual(expected.__repr__(),
+                                 index.timecode_at(frame).__repr__())
+                self.assertIn(frame, index.frames_of(expected))
+
+            self.assertEqual([15, 155], index.frames_of('01:00:00:15'))
+            self.assertEqual(15, index.frame_of(tc + 15))
+            self.assertEqual(120, index.frame_of('10:00:00:20'))
+            self.assertEqual([], index.frames_of('05:00:00:00'))
+            with self.assertRaises(KeyError):
+                index.frame_of('05:00:00:00')
+            with self.assertRaises(IndexError):
+                index.timecode_at(160)
+
+    def test_rollover(self):
+        """testing if the timecodes rolling over at 24 hours are found by
+        their timecode strings
+        """
+        start = Timecode('25', '23:59:59:20')
+        with SegmentIndexWriter(self.path) as writer:
+            writer.add_segment(start, 10)
+
+        with SegmentIndex(self.path) as index:
+            self.assertEqual(2, index.segment_count)
+            self.assertEqual('00:00:00:04', index.timecode_at(9).__repr__())
+            self.assertEqual(9, index.frame_of('00:00:00:04'))
+            self.assertEqual(9, index.frame_of(start + 9))
+
+    def test_overlapping_segments(self):
+        """testing if the frames are found in segments overlapping a long
+        segment and each other
+        """
+        segments = [(1, 5000)] + [(1 + i * 37 % 5200, 1 + i % 60)
+                                  for i in range(500)]
+        with SegmentIndexWriter(self.path) as writer:
+            for start, length in segments:
+                writer.add_segment(Timecode('25', frames=start), length)
+
+        with SegmentIndex(self.path) as index:
+            for value in range(1, 5300, 7):
+                expected = [
+                    segment.start_frame + value - segment.start_timecode
+                    for segment in index.segments()
+                    if 0 <= value - segment.start_timecode < segment.length
+                ]
+                self.assertEqual(
+                    expected, index.frames_of(Timecode('25', frames=value))
+                )
+
+    def test_multiple_framerates(self):
+        """testing if segments with different frame rates are kept apart
+        """
+        self.write([Timecode('24', '00:00:01:00'),
+                    Timecode('25', '00:00:01:00'),
+                    Timecode('25', '00:00:01:01')])
+
+        with SegmentIndex(self.path) as index:
+            self.assertEqual('24', index.timecode_at(0).framerate)
+            self.assertEqual('25', index.timecode_at(2).framerate)
+            self.assertEqual([0, 1], index.frames_of('00:00:01:00'))
+            self.assertEqual([1], index.frames_of(Timecode('25', frames=26)))
+            self.assertEqual([], index.frames_of(Timecode('30', frames=26)))
+
+    def test_int_framerate(self):
+        """testing if the timecodes with integer frame rates are indexed and
+        found
+        """
+        tc = Timecode(25, '01:00:00:00')
+        self.write([tc + i for i in range(10)] +
+                   [Timecode('25', '01:00:00:10') + i for i in range(10)])
+
+        with SegmentIndex(self.path) as index:
+            self.assertEqual(1, index.segment_count)
+            self.assertEqual('25', index.timecode_at(0).framerate)
+            self.assertEqual([5], index.frames_of(tc + 5))
+            self.assertEqual(
+                [15], index.frames_of(Timecode('25', frames=tc.frames + 15))
+            )
+            self.assertEqual([15], index.frames_of('01:00:00:15'))
+
+    def test_invalid_file(self):
+        """testing if a TimecodeError is raised for other files
+        """
+        with open(self.path, 'wb') as f:
+            f.write(b'not an index file at all')
+        with self.assertRaises(TimecodeError):
+            SegmentIndex(self.path)
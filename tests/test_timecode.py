@@ -2,7 +2,12 @@
 
 import unittest
 
-from timecode import Timecode
+import os
+import pickle
+import subprocess
+import sys
+
+from timecode import FrameRate, ImmutableTimecode, Timecode, TimecodeError
 
 
 class TimecodeTester(unittest.TestCase):
@@ -596,6 +601,387 @@ class TimecodeTester(unittest.TestCase):
         tc3 = (tc + tc2)
         self.assertEqual('04:20:13:21', tc3.__str__())
 
+    def test_framerate_is_shared(self):
+        """testing if the Timecode instances with the same frame rate share a
+        single FrameRate instance
+        """
+        tc1 = Timecode('29.97', '00:00:00:00')
+        tc2 = Timecode('29.97', frames=12)
+        self.assertIs(tc1._rate, tc2._rate)
+        self.assertIs(FrameRate('29.97'), tc1._rate)
+        self.assertIs(tc1._rate, (tc1 + tc2)._rate)
+        self.assertIsNot(FrameRate('30'), tc1._rate)
+
+        tc3 = Timecode(FrameRate('29.97'))
+        self.assertIs(tc1._rate, tc3._rate)
+        self.assertEqual('29.97', tc3.framerate)
+
+    def test_framerate_numbers(self):
+        """testing if the equal frame rate numbers and strings share the same
+        FrameRate instance, whichever is created first
+        """
+        rate = FrameRate(48.0)
+        self.assertIs(rate, FrameRate(48))
+        self.assertIs(rate, FrameRate('48'))
+        self.assertEqual('48', rate.framerate)
+        self.assertEqual('48', Timecode(48).framerate)
+        self.assertEqual(12.5, FrameRate(12.5).framerate)
+
+    def test_framerate_constants(self):
+        """testing if the FrameRate constants are correctly calculated
+        """
+        rate = FrameRate('29.97')
+        self.assertTrue(rate.drop_frame)
+        self.assertEqual(30, rate.int_framerate)
+        self.assertEqual(2, rate.drop_frames)
+        self.assertEqual(17982, rate.frames_per_10_minutes)
+        self.assertEqual(1798, rate.frames_per_minute)
+        self.assertEqual(2589408, rate.frames_per_24_hours)
+
+        rate = FrameRate('59.94')
+        self.assertEqual(4, rate.drop_frames)
+        self.assertEqual(35964, rate.frames_per_10_minutes)
+
+        rate = FrameRate('ms')
+        self.assertEqual(1000, rate.framerate)
+        self.assertEqual(1000, rate.int_framerate)
+        self.assertFalse(rate.drop_frame)
+
+    def test_framerate_is_immutable(self):
+        """testing if the FrameRate attributes can not be changed
+        """
+        rate = FrameRate('24')
+        with self.assertRaises(AttributeError):
+            rate.int_framerate = 25
+        with self.assertRaises(AttributeError):
+            del rate.drop_frame
+
+    def test_frames_framerate(self):
+        """testing if the "frames" frame rate can be converted
+        """
+        tc = Timecode('frames', '00:00:01:00')
+        self.assertEqual(2, tc.frames)
+        self.assertEqual('00:00:01:00', tc.__repr__())
+
+    def test_instance_has_no_dict(self):
+        """testing if Timecode instances only hold the frames and the frame
+        rate
+        """
+        tc = Timecode('24', '00:00:01:00')
+        self.assertFalse(hasattr(tc, '__dict__'))
+        with self.assertRaises(AttributeError):
+            tc.some_attribute = 1
+
+    def test_framerate_setter(self):
+        """testing if setting the framerate updates the drop frame settings
+        """
+        tc = Timecode('30', frames=1801)
+        tc.framerate = '29.97'
+        self.assertTrue(tc.drop_frame)
+        self.assertEqual(30, tc.int_framerate)
+        self.assertEqual('00:01:00:02', tc.__repr__())
+
+    def test_pickle(self):
+        """testing if Timecode instances can be pickled and unpickled with the
+        shared FrameRate instance
+        """
+        for fr in ['29.97', 'ms']:
+            tc = Timecode(fr, '01:02:03:04')
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                tc2 = pickle.loads(pickle.dumps(tc, protocol))
+                self.assertIs(Timecode, type(tc2))
+                self.assertEqual(tc, tc2)
+                self.assertIs(tc._rate, tc2._rate)
+
+    def test_fields(self):
+        """testing if the fields attribute returns all the timecode fields
+        and the string representation
+        """
+        tc = Timecode('29.97', '03:36:09:23')
+        self.assertEqual((3, 36, 9, 23, '03:36:09:23'), tc.fields)
+        self.assertEqual(3, tc.fields.hrs)
+        self.assertEqual(36, tc.fields.mins)
+        self.assertEqual(9, tc.fields.secs)
+        self.assertEqual(23, tc.fields.frs)
+        self.assertEqual('03:36:09:23', tc.fields.timecode)
+        self.assertIs(tc.fields, tc.fields)
+
+    def test_fields_are_updated_when_frames_change(self):
+        """testing if the cached fields are updated when the frames of the
+        timecode are changed
+        """
+        tc = Timecode('29.97', '00:00:59:29')
+        self.assertEqual('00:00:59:29', tc.__repr__())
+        tc.next()
+        self.assertEqual('00:01:00:02', tc.__repr__())
+        self.assertEqual(2, tc.frs)
+        tc.back()
+        self.assertEqual(29, tc.frs)
+        tc.add_frames(30)
+        self.assertEqual((0, 1, 1, 1), tc.fields[:4])
+        tc.sub_frames(30)
+        self.assertEqual(59, tc.secs)
+        tc.mult_frames(2)
+        self.assertEqual('00:02:00:03', tc.__repr__())
+        tc.div_frames(2)
+        self.assertEqual('00:00:59:29', tc.__repr__())
+        tc.set_timecode('01:00:00:00')
+        self.assertEqual(1, tc.hrs)
+        tc.frames = 1
+        self.assertEqual(0, tc.hrs)
+        tc.framerate = '24'
+        tc.frames = 25
+        self.assertEqual('00:00:01:00', tc.__repr__())
+
+    def test_table_conversion_matches_arithmetic(self):
+        """testing if the lookup table conversion gives the same result with
+        the arithmetic for all the frame rates
+        """
+        for fr in ['23.98', '24', '25', '29.97', '30', '50', '59.94', '60',
+                   'frames']:
+            rate = FrameRate(fr)
+            selected = rate.conversion
+            try:
+                self.assertEqual('table', rate.set_conversion('table'))
+                self.assertEqual('table', rate.conversion)
+                f24 = rate.frames_per_24_hours
+                samples = list(range(-100, rate.frames_per_10_minutes * 2)) + \
+                    list(range(f24 - 1000, f24 + 1000))
+                for frames in samples:
+                    self.assertEqual(rate._calculate_tc(frames),
+                                     rate.frames_to_tc(frames))
+                self.assertEqual(rate._calculate_tc(12.0),
+                                 rate.frames_to_tc(12.0))
+            finally:
+                if selected is not None:
+                    rate.set_conversion(selected)
+
+    def test_set_conversion(self):
+        """testing if the conversion method can be selected
+        """
+        rate = FrameRate('59.94')
+        selected = rate.conversion
+        try:
+            self.assertEqual('arithmetic', rate.set_conversion('arithmetic'))
+            self.assertEqual('arithmetic', rate.conversion)
+            self.assertEqual('00:10:00:00',
+                             Timecode(rate, frames=35965).__repr__())
+            self.assertIn(rate.set_conversion(), ('table', 'arithmetic'))
+            self.assertEqual('00:10:00:00',
+                             Timecode(rate, frames=35965).__repr__())
+            with self.assertRaises(TimecodeError):
+                rate.set_conversion('fast')
+        finally:
+            if selected is not None:
+                rate.set_conversion(selected)
+
+        # the 'ms' table is too large to be selected automatically
+        self.assertEqual('arithmetic', FrameRate('ms').set_conversion('auto'))
+
+    def test_ordering(self):
+        """testing if timecodes can be ordered with timecodes, strings and
+        integers
+        """
+        tc1 = Timecode('24', '00:00:01:00')
+        tc2 = Timecode('24', '00:00:02:00')
+        self.assertTrue(tc1 < tc2)
+        self.assertTrue(tc1 <= tc2)
+        self.assertTrue(tc2 > tc1)
+        self.assertTrue(tc2 >= tc1)
+        self.assertTrue(tc1 <= Timecode('24', '00:00:01:00'))
+        self.assertFalse(tc1 > tc2)
+        self.assertTrue(tc1 < '00:00:01:01')
+        self.assertTrue(tc1 >= '00:00:01:00')
+        self.assertTrue(tc1 > 24)
+        self.assertTrue(tc1 <= 25)
+        self.assertEqual([tc1, tc2], sorted([tc2, tc1]))
+
+        with self.assertRaises(TimecodeError):
+            tc1 < Timecode('25', '00:00:02:00')
+        with self.assertRaises(TypeError):
+            tc1 < 1.5
+
+    def test_not_hashable(self):
+        """testing if Timecode can not be hashed as it can be changed
+        """
+        tc = Timecode('29.97', '00:01:00:02')
+        with self.assertRaises(TypeError):
+            hash(tc)
+        with self.assertRaises(TypeError):
+            {tc}
+
+    def test_in_place_operators(self):
+        """testing if += and -= change the timecode in place
+        """
+        tc = Timecode('25', '00:00:01:00')
+        same = tc
+        tc += 25
+        self.assertIs(same, tc)
+        self.assertEqual('00:00:02:00', tc.__repr__())
+        tc -= Timecode('25', frames=50)
+        self.assertIs(same, tc)
+        self.assertEqual('00:00:00:00', tc.__repr__())
+        tc += Timecode('25', '00:00:00:10')
+        self.assertEqual('00:00:00:11', tc.__repr__())
+        with self.assertRaises(TimecodeError):
+            tc += 'bum'
+
+    def test_radd(self):
+        """testing if an integer can be added to a timecode from the left
+        """
+        tc = 10 + Timecode('25', '00:00:01:00')
+        self.assertEqual('00:00:01:10', tc.__repr__())
+        self.assertEqual(86, sum([Timecode('25', frames=6), 80]))
+
+    def test_arithmetic_shares_framerate(self):
+        """testing if the results of the arithmetic use the same FrameRate
+        """
+        tc = Timecode('59.94', '00:10:00:00')
+        for result in (tc + 1, tc - 1, tc * 2, 1 + tc):
+            self.assertIs(tc._rate, result._rate)
+            self.assertIsInstance(result, Timecode)
+        self.assertEqual('00:10:00:01', (tc + 1).__repr__())
+
+    def test_string_comparison(self):
+        """testing if timecodes are compared with strings without creating
+        new timecodes
+        """
+        tc = Timecode('59.94', '00:10:00:00')
+        self.assertTrue(tc == '00:10:00:00')
+        self.assertFalse(tc == '00:10:00:01')
+        self.assertTrue(tc != '00:09:59:59')
+        self.assertTrue(tc > '00:09:59:59')
+        self.assertTrue(tc <= '00:10:00:00')
+        self.assertTrue(Timecode('25') == '')
+        self.assertIn(tc, ['01:00:00:00', '00:10:00:00'])
+        self.assertNotIn(tc, ['01:00:00:00'])
+
+        Timecode.enable_cache()
+        try:
+            tc == '00:10:00:00'
+            tc < '00:10:00:00'
+            self.assertEqual(1, Timecode.cache_info()['parse'].hits)
+        finally:
+            Timecode.disable_cache()
+
+    def test_framerate_tc_to_frames(self):
+        """testing if FrameRate.tc_to_frames() gives the same frames with
+        Timecode.tc_to_frames()
+        """
+        for framerate in ('23.98', '25', '29.97', '59.94', 'ms'):
+            rate = FrameRate(framerate)
+            tc = Timecode(rate, frames=123456)
+            self.assertEqual(123456, rate.tc_to_frames(tc.__repr__()))
+
+    def test_frame_set(self):
+        """testing if timecodes can be looked up in the frame set of timecode
+        strings
+        """
+        rate = FrameRate('29.97')
+        cues = rate.frame_set(['00:00:01:00', '00:01:00:02'])
+        self.assertIn(ImmutableTimecode(rate, '00:01:00:02'), cues)
+        self.assertIn(Timecode(rate, '00:00:01:00').frames, cues)
+        self.assertNotIn(ImmutableTimecode(rate, '00:00:01:01'), cues)
+
+    def test_lazy(self):
+        """testing if a lazy timecode is converted only when the frames are
+        needed
+        """
+        tc = Timecode('29.97', '00:10:00:00', lazy=True)
+        self.assertEqual('00:10:00:00', tc.__repr__())
+        self.assertIsNone(tc._fields)
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(tc, '_frames')
+
+        self.assertEqual(17983, tc.frames)
+        self.assertEqual(Timecode('29.97', '00:10:00:00'), tc)
+        self.assertEqual('00:10:00:00', tc.__repr__())
+
+        tc = Timecode('29.97', '00:10:00:00', lazy=True)
+        self.assertTrue(tc < '00:10:00:01')
+        self.assertEqual('00:10:00:01', (tc + 1).__repr__())
+        tc.next()
+        self.assertEqual('00:10:00:01', tc.__repr__())
+
+        tc = Timecode('25', '01:00:00:00', lazy=True)
+        self.assertEqual(10, tc.hrs * 10)
+        with self.assertRaises(AttributeError):
+            tc.foo
+
+    def test_lazy_not_canonical(self):
+        """testing if a lazy timecode which is not in the canonical form is
+        converted for the string representation
+        """
+        for text, expected in (('0:0:1:0', '00:00:01:00'),
+                               ('00:00:00:25', '00:00:01:00'),
+                               ('24:00:00:00', '00:00:00:00')):
+            tc = Timecode('25', text, lazy=True)
+            self.assertEqual(expected, tc.__repr__())
+        # a dropped frame number
+        tc = Timecode('29.97', '00:01:00:00', lazy=True)
+        self.assertEqual(Timecode('29.97', '00:01:00:00').__repr__(),
+                         tc.__repr__())
+        self.assertNotEqual('00:01:00:00', tc.__repr__())
+
+    def test_lazy_framerate_change(self):
+        """testing if a lazy timecode is converted with its original frame
+        rate before the frame rate is changed
+        """
+        tc = Timecode('25', '00:00:01:00', lazy=True)
+        tc.framerate = '24'
+        self.assertEqual(26, tc.frames)
+        self.assertEqual('00:00:01:01', tc.__repr__())
+
+    def test_lazy_errors(self):
+        """testing if a malformed lazy timecode raises an error when it is
+        converted
+        """
+        tc = Timecode('25', 'bad', lazy=True)
+        with self.assertRaises(ValueError):
+            tc.frames
+        with self.assertRaises(ValueError):
+            tc.__repr__()
+
+    def test_lazy_pickle(self):
+        """testing if a lazy timecode stays lazy when it is pickled
+        """
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            tc = pickle.loads(pickle.dumps(
+                Timecode('59.94', '01:00:00:00', lazy=True), protocol
+            ))
+            self.assertEqual('01:00:00:00', tc._text)
+            self.assertEqual(Timecode('59.94', '01:00:00:00').frames,
+                             tc.frames)
+
+    def test_is_canonical(self):
+        """testing if FrameRate.is_canonical() matches the string
+        representations
+        """
+        rate = FrameRate('29.97')
+        self.assertTrue(rate.is_canonical('23:59:59:29'))
+        self.assertTrue(rate.is_canonical('00:10:00:00'))
+        self.assertTrue(rate.is_canonical('00:01:00:02'))
+        self.assertFalse(rate.is_canonical('00:01:00:01'))
+        self.assertFalse(rate.is_canonical('00:00:00:30'))
+        self.assertFalse(rate.is_canonical('00:00:00;00'))
+        self.assertFalse(rate.is_canonical('0:00:00:00'))
+        self.assertFalse(rate.is_canonical('00:00:00:00:00'))
+        self.assertTrue(FrameRate('ms').is_canonical('00:00:00:999'))
+        self.assertTrue(FrameRate('ms').is_canonical('00:00:00:05'))
+        self.assertFalse(FrameRate('ms').is_canonical('00:00:00:005'))
+
+    def test_copy(self):
+        """testing if copies are independent of the original timecode
+        """
+        import copy
+        tc = Timecode('23.98', '01:00:00:00')
+        for tc_copy in (copy.copy(tc), copy.deepcopy(tc)):
+            self.assertEqual(tc, tc_copy)
+            self.assertIs(tc._rate, tc_copy._rate)
+            tc_copy.next()
+            self.assertEqual('01:00:00:00', tc.__repr__())
+            self.assertEqual('01:00:00:01', tc_copy.__repr__())
+
     # def test_exceptions(self):
     #     """test exceptions
     #     """
@@ -701,3 +1087,142 @@ class TimecodeTester(unittest.TestCase):
     #         "Type str not supported for arithmetic.",
     #         cm.exception.__str__()
     #     )
+
+
+class SubclassedImmutableTimecode(ImmutableTimecode):
+    """an ImmutableTimecode subclass to test pickling
+    """
+
+
+class ImmutableTimecodeTester(unittest.TestCase):
+    """tests the ImmutableTimecode class
+    """
+
+    def test_init(self):
+        """testing if ImmutableTimecode is initialized like Timecode
+        """
+        tc = ImmutableTimecode('29.97', '00:10:00:00')
+        self.assertEqual('00:10:00:00', tc.__repr__())
+        self.assertEqual(Timecode('29.97', '00:10:00:00').frames, tc.frames)
+        self.assertIs(FrameRate('29.97'), tc._rate)
+        self.assertEqual(25, ImmutableTimecode('25', start_seconds=1).frames)
+        self.assertEqual(10, ImmutableTimecode('25', frames=10).frames)
+        self.assertEqual(1, ImmutableTimecode('25').frames)
+
+    def test_can_not_be_changed(self):
+        """testing if the frames and the frame rate can not be changed
+        """
+        tc = ImmutableTimecode('25', '00:00:01:00')
+        with self.assertRaises(AttributeError):
+            tc.frames = 10
+        with self.assertRaises(AttributeError):
+            tc.framerate = '24'
+        with self.assertRaises(AttributeError):
+            tc.next()
+        with self.assertRaises(AttributeError):
+            tc.add_frames(1)
+        with self.assertRaises(AttributeError):
+            tc.set_timecode('00:00:02:00')
+        with self.assertRaises(AttributeError):
+            tc.other = 1
+        self.assertEqual('00:00:01:00', tc.__repr__())
+
+    def test_arithmetic(self):
+        """testing if the arithmetic returns new ImmutableTimecode instances
+        """
+        tc = ImmutableTimecode('25', '00:00:01:00')
+        result = tc + 25
+        self.assertIsInstance(result, ImmutableTimecode)
+        self.assertEqual('00:00:02:00', result.__repr__())
+        self.assertEqual('00:00:01:00', tc.__repr__())
+        self.assertIsInstance(tc - 1, ImmutableTimecode)
+        self.assertIsInstance(5 + tc, ImmutableTimecode)
+
+        other = tc
+        other += 1
+        self.assertIsNot(tc, other)
+        self.assertEqual('00:00:01:01', other.__repr__())
+        self.assertEqual('00:00:01:00', tc.__repr__())
+        other -= 2
+        self.assertEqual('00:00:00:24', other.__repr__())
+
+    def test_hash_and_comparison(self):
+        """testing if ImmutableTimecode compares and hashes the same with
+        Timecode
+        """
+        tc = ImmutableTimecode('24', '00:00:01:00')
+        mutable = Timecode('24', '00:00:01:00')
+        self.assertEqual(tc, mutable)
+        self.assertEqual(hash(tc), hash(mutable.frames))
+        self.assertIn(tc, {25})
+        # the strings are equal but hash differently
+        self.assertNotIn(tc, {'00:00:01:00'})
+        self.assertTrue(tc < Timecode('24', '00:00:01:01'))
+        self.assertTrue(tc == '00:00:01:00')
+        self.assertEqual({tc: 1}, {ImmutableTimecode('24', frames=25): 1})
+
+    def test_conversion(self):
+        """testing if Timecode and ImmutableTimecode convert to each other
+        """
+        mutable = Timecode('59.94', '01:00:00:00')
+        tc = ImmutableTimecode.from_timecode(mutable)
+        self.assertIsInstance(tc, ImmutableTimecode)
+        self.assertEqual(mutable, tc)
+        self.assertIs(tc, ImmutableTimecode.from_timecode(tc))
+
+        mutable.next()
+        self.assertEqual('01:00:00:00', tc.__repr__())
+
+        back = tc.to_timecode()
+        self.assertIs(type(back), Timecode)
+        back.next()
+        self.assertEqual('01:00:00:01', back.__repr__())
+        self.assertEqual('01:00:00:00', tc.__repr__())
+
+    def test_copy_and_pickle(self):
+        """testing if copying returns the same instance and pickling keeps the
+        shared frame rate
+        """
+        import copy
+        tc = ImmutableTimecode('23.98', '01:00:00:00')
+        self.assertIs(tc, copy.copy(tc))
+        self.assertIs(tc, copy.deepcopy(tc))
+
+        loaded = pickle.loads(pickle.dumps(tc))
+        self.assertIsInstance(loaded, ImmutableTimecode)
+        self.assertEqual(tc, loaded)
+        self.assertIs(tc._rate, loaded._rate)
+        self.assertEqual('01:00:00:00', loaded.__repr__())
+
+        loaded = pickle.loads(pickle.dumps(
+            SubclassedImmutableTimecode('25', '01:00:00:00')
+        ))
+        self.assertIs(SubclassedImmutableTimecode, type(loaded))
+        self.assertEqual('01:00:00:00', loaded.__repr__())
+
+
+class PackageTester(unittest.TestCase):
+    """tests the timecode package
+    """
+
+    def test_lazy_imports(self):
+        """testing if the optional modules are imported only when their names
+        are used
+        """
+        code = (
+            "import sys, timecode\n"
+            "heavy = ['numpy', 'asyncio', 'concurrent.futures', "
+            "'timecode.array', 'timecode.segments']\n"
+            "print([name for name in heavy if name in sys.modules])\n"
+            "from timecode import TimecodeArray, TimecodeRange\n"
+            "print(timecode.TimecodeArray.__module__)\n"
+        )
+        import timecode
+        root = os.path.dirname(os.path.dirname(timecode.__file__))
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         cwd=root)
+        self.assertEqual(b"[]\ntimecode.array\n", output)
+
+        self.assertIn('SegmentIndex', dir(timecode))
+        with self.assertRaises(AttributeError):
+            timecode.TimecodeClock
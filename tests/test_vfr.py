@@ -0,0 +1,123 @@
+#!-*- coding: utf-8 -*-
+
+import unittest
+from fractions import Fraction
+
+from timecode import Timecode, TimecodeError
+from timecode import vfr
+from timecode.vfr import TimestampMapper
+
+
+# a phone recording, mostly 30 fps with a stall and a burst
+SECONDS = [0.0, 0.033, 0.067, 0.1, 0.5, 0.51, 0.52, 0.7, 1.0]
+
+
+class TimestampMapperTester(unittest.TestCase):
+    """tests the TimestampMapper class
+    """
+
+    def _both(self, function):
+        """calls the function with and without numpy and checks if the
+        results are the same
+        """
+        result = list(function())
+        numpy = vfr.numpy
+        if numpy is not None:
+            vfr.numpy = None
+            try:
+                self.assertEqual(result, list(function()))
+            finally:
+                vfr.numpy = numpy
+        return result
+
+    def test_frames_at(self):
+        """testing if the timestamps are mapped to the timeline frames
+        showing them
+        """
+        mapper = TimestampMapper(SECONDS, '30')
+        self.assertEqual(1, mapper.frames_at(0))
+        self.assertEqual(1, mapper.frames_at(0.0333))
+        self.assertEqual(2, mapper.frames_at(0.0334))
+        # 0.7 * 30 is 20.999999999999996 with floats
+        self.assertEqual(22, mapper.frames_at(0.7))
+        self.assertEqual('00:00:01:00', mapper.timecode_at(1.0).__repr__())
+        self.assertEqual(
+            [1, 1, 3, 4, 16, 16, 16, 22, 31],
+            self._both(lambda: TimestampMapper(SECONDS, '30')
+                       .timeline_frames())
+        )
+        self.assertEqual(
+            [1, 2, 22],
+            self._both(lambda: TimestampMapper(SECONDS, '30')
+                       .frames_at_many([0, 0.04, 0.7]))
+        )
+
+    def test_start_and_time_base(self):
+        """testing if the timeline starts from the start timecode and the
+        timestamps can be in a time base
+        """
+        ticks = [900000 + int(s * 90000) for s in SECONDS]
+        mapper = TimestampMapper(ticks, '29.97', start='01:00:00:00',
+                                 time_base=Fraction(1, 90000))
+        start = Timecode('29.97', '01:00:00:00').frames
+        self.assertEqual(start, mapper.frames_at(900000))
+        # 3003 ticks of 90 kHz is exactly a frame of 29.97
+        self.assertEqual(start, mapper.frames_at(900000 + 3002))
+        self.assertEqual(start + 1, mapper.frames_at(900000 + 3003))
+        self.assertEqual(start + 300, mapper.frames_at(900000 + 300 * 3003))
+        self.assertEqual('29.97', mapper.framerate)
+
+    def test_index_at(self):
+        """testing if the media frame shown at a timestamp is found
+        """
+        mapper = TimestampMapper(SECONDS, '30')
+        self.assertEqual(-1, mapper.index_at(-0.1))
+        self.assertEqual(0, mapper.index_at(0.01))
+        self.assertEqual(3, mapper.index_at(0.4))
+        self.assertEqual(4, mapper.index_at(0.5))
+        self.assertEqual(8, mapper.index_at(5))
+        self.assertEqual(
+            [-1, 0, 3, 4, 8],
+            self._both(lambda: TimestampMapper(SECONDS, '30')
+                       .index_at_many([-0.1, 0.01, 0.4, 0.5, 5]))
+        )
+
+    def test_index_of(self):
+        """testing if the media frame nearest to the start of a timecode is
+        found
+        """
+        mapper = TimestampMapper(SECONDS, '30')
+        self.assertEqual(0, mapper.index_of(1))
+        self.assertEqual(0, mapper.index_of(Timecode('30', frames=-5)))
+        self.assertEqual(2, mapper.index_of(3))
+        # frame 10 starts at 0.3, exactly between 0.1 and 0.5
+        self.assertEqual(3, mapper.index_of(10))
+        self.assertEqual(4, mapper.index_of(11))
+        self.assertEqual(8, mapper.index_of('00:01:00:00'))
+        frames = [1, -5, 3, 10, 11, 1801, 16, 17]
+        expected = [mapper.index_of(f) for f in frames]
+        self.assertEqual(expected, [0, 0, 2, 3, 4, 8, 4, 6])
+        self.assertEqual(
+            expected,
+            self._both(lambda: TimestampMapper(SECONDS, '30')
+                       .index_of_many(frames))
+        )
+
+    def test_index_of_tie(self):
+        """testing if the earlier media frame wins a tie
+        """
+        mapper = TimestampMapper([0, 2], '1', time_base=1)
+        self.assertEqual(0, mapper.index_of(2))
+        self.assertEqual(
+            [0], self._both(lambda: mapper.index_of_many([2]))
+        )
+
+    def test_errors(self):
+        """testing if the invalid timestamps raise errors
+        """
+        with self.assertRaises(TimecodeError):
+            TimestampMapper([0.1, 0.0], '30')
+        with self.assertRaises(TimecodeError):
+            TimestampMapper([], '30')
+        with self.assertRaises(TimecodeError):
+            TimestampMapper([0], '30', time_base=0)
@@ -22,6 +22,58 @@
 # THE SOFTWARE.
 
 
-from .timecode import Timecode, TimecodeError
+from importlib import import_module
+
+from .cache import CacheInfo, LRUCache
+from .timecode import (FrameRate, ImmutableTimecode, Timecode, TimecodeError,
+                       TimecodeFields)
 
 __version__ = '0.3.1'
+
+# the names of the other modules and the modules they are in, the modules
+# are imported when the names are first used, so numpy is not imported with
+# the package
+_LAZY_NAMES = {
+    'TimecodeArray': 'array',
+    'pack_bcd': 'binary',
+    'pack_int': 'binary',
+    'unpack_bcd': 'binary',
+    'unpack_int': 'binary',
+    'parse_buffer': 'bulk',
+    'validate_timecodes': 'bulk',
+    'EDLEvent': 'edl',
+    'EDLReader': 'edl',
+    'EDLWriter': 'edl',
+    'export_timecodes': 'formatting',
+    'iter_timecodes': 'formatting',
+    'write_timecodes': 'formatting',
+    'write_timecodes_fd': 'formatting',
+    'Interval': 'intervals',
+    'IntervalIndex': 'intervals',
+    'LTCDecoder': 'ltc',
+    'LTCEncoder': 'ltc',
+    'LTCFrame': 'ltc',
+    'TimecodeRange': 'ranges',
+    'TimecodeRangeSet': 'ranges',
+    'RateConverter': 'rational',
+    'Segment': 'segments',
+    'SegmentIndex': 'segments',
+    'SegmentIndexWriter': 'segments',
+    'TimestampMapper': 'vfr',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name)
+        )
+    value = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -0,0 +1,247 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from .bulk import parse_columns
+from .timecode import Timecode, TimecodeError
+
+
+def _require_numpy():
+    """raises a TimecodeError if numpy is not available
+    """
+    if numpy is None:
+        raise TimecodeError('TimecodeArray requires numpy to be installed.')
+
+
+class TimecodeArray(object):
+    def __init__(self, framerate, frames=()):
+        """An array of timecodes sharing a single frame rate.
+
+        Holds the total frame counts in an int64 numpy array and does the
+        same calculations that :meth:`.Timecode.frames_to_tc` and
+        :meth:`.Timecode.tc_to_frames` do, but as whole array operations.
+
+        :param str framerate: The frame rate of all the timecodes in this
+          array. Accepts the same values as :class:`.Timecode`.
+        :param frames: An iterable or numpy array of integer frame counts.
+        """
+        _require_numpy()
+        self._rate = Timecode._validate_framerate(framerate)
+        self.frames = numpy.array(frames, dtype=numpy.int64).reshape(-1)
+
+    @classmethod
+    def from_timecodes(cls, framerate, timecodes):
+        """creates a TimecodeArray by parsing the given timecode strings
+
+        :param str framerate: The frame rate of the timecodes.
+        :param timecodes: A sequence or numpy array of timecode strings, in
+          any of the forms :meth:`.Timecode.parse_timecode` accepts.
+        """
+        tc_array = cls(framerate)
+        tc_array.frames = tc_array.tc_to_frames(timecodes)
+        return tc_array
+
+    @property
+    def framerate(self):
+        return self._rate.framerate
+
+    @property
+    def int_framerate(self):
+        return self._rate.int_framerate
+
+    @property
+    def drop_frame(self):
+        return self._rate.drop_frame
+
+    @classmethod
+    def parse_timecodes(cls, timecodes):
+        """parses the given timecode strings into four int64 arrays of
+        hours, minutes, seconds and frames
+
+        The strings are parsed column by column over their fixed width byte
+        representation with :func:`.bulk.parse_columns`.
+        """
+        _require_numpy()
+        data = numpy.asarray(timecodes)
+        if data.dtype.kind == 'U':
+            data = numpy.char.encode(data, 'ascii')
+        elif data.dtype.kind != 'S':
+            data = numpy.array([str(tc) for tc in data.reshape(-1)],
+                               dtype=numpy.bytes_)
+        data = data.reshape(-1)
+
+        count = len(data)
+        width = data.dtype.itemsize
+        chars = numpy.ascontiguousarray(data).view(numpy.uint8)
+        fields, invalid, empty = parse_columns(chars.reshape(count, width))
+
+        invalid |= empty
+        if invalid.any():
+            bad = numpy.flatnonzero(invalid)[0]
+            raise TimecodeError(
+                'Timecode string parsing error. %s' %
+                data[bad].decode('ascii', 'replace')
+            )
+
+        return fields
+
+    def tc_to_frames(self, timecodes):
+        """Converts the given timecode strings to an int64 array of frames
+        """
+        hours, minutes, seconds, frames = self.parse_timecodes(timecodes)
+
+        return self._rate.fields_to_frames(hours, minutes, seconds, frames)
+
+    def frames_to_tc(self, frames=None):
+        """Converts frames back to timecode components
+
+        :param frames: The frames to convert, defaults to the frames of this
+          array.
+        :returns: four int64 arrays of hours, minutes, seconds and frames
+        """
+        if frames is None:
+            frames = self.frames
+        frames = numpy.asarray(frames, dtype=numpy.int64)
+
+        rate = self._rate
+        drop_frames = rate.drop_frames
+        frames_per_10_minutes = rate.frames_per_10_minutes
+
+        # numpy's modulo follows the sign of the divisor like python's does,
+        # so this also handles the negative time case of frames_to_tc
+        frame_number = (frames - 1) % rate.frames_per_24_hours
+
+        if rate.drop_frame:
+            d = frame_number // frames_per_10_minutes
+            m = frame_number % frames_per_10_minutes
+            correction = drop_frames * 9 * d
+            correction += numpy.where(
+                m > drop_frames,
+                drop_frames * ((m - drop_frames) // rate.frames_per_minute),
+                0
+            )
+            frame_number = frame_number + correction
+
+        ifps = rate.int_framerate
+        total_secs = frame_number // ifps
+        frs = frame_number % ifps
+        secs = total_secs % 60
+        mins = (total_secs // 60) % 60
+        hrs = (total_secs // 60) // 60
+
+        return hrs, mins, secs, frs
+
+    def to_strings(self):
+        """returns the timecodes as a numpy array of strings, formatted the
+        same way :meth:`.Timecode.__repr__` formats them
+        """
+        hrs, mins, secs, frs = self.frames_to_tc()
+        frame_digits = max(2, len(str(self.int_framerate - 1)))
+
+        count = len(self.frames)
+        width = 9 + frame_digits
+        chars = numpy.zeros((count, width), dtype=numpy.uint8)
+        chars[:, [2, 5, 8]] = 58  # ':'
+
+        for column, value in ((0, hrs), (3, mins), (6, secs)):
+            chars[:, column] = 48 + value // 10 % 10
+            chars[:, column + 1] = 48 + value % 10
+
+        # "%02d" only pads to two digits, so wider frame values are left
+        # aligned and the rest of the row is left as null padding
+        digits = numpy.full(count, 2, dtype=numpy.int64)
+        for power in range(2, frame_digits):
+            digits += frs >= 10 ** power
+        for position in range(frame_digits):
+            exponent = digits - 1 - position
+            chars[:, 9 + position] = numpy.where(
+                exponent >= 0,
+                48 + frs // 10 ** numpy.maximum(exponent, 0) % 10,
+                0
+            )
+
+        return chars.view('S%s' % width).reshape(count).astype(numpy.str_)
+
+    def _other_frames(self, other):
+        """returns the frames of the other operand of an arithmetic operation
+        """
+        if isinstance(other, TimecodeArray):
+            return other.frames
+        elif isinstance(other, Timecode):
+            return other.frames
+        elif isinstance(other, (int, numpy.integer)):
+            return other
+        elif isinstance(other, numpy.ndarray) and other.dtype.kind in 'iu':
+            return other
+        raise TimecodeError(
+            'Type %s not supported for arithmetic.' %
+            other.__class__.__name__
+        )
+
+    def _new(self, frames):
+        """returns a new TimecodeArray with the same framerate
+        """
+        tc_array = TimecodeArray.__new__(TimecodeArray)
+        tc_array._rate = self._rate
+        tc_array.frames = numpy.asarray(frames, dtype=numpy.int64)
+        return tc_array
+
+    def __add__(self, other):
+        """returns a new TimecodeArray with the given frames added element
+        wise
+        """
+        return self._new(self.frames + self._other_frames(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """returns a new TimecodeArray with the given frames subtracted
+        element wise
+        """
+        return self._new(self.frames - self._other_frames(other))
+
+    def __rsub__(self, other):
+        return self._new(self._other_frames(other) - self.frames)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._new(self.frames[item])
+        return Timecode(self._rate, frames=int(self.frames[item]))
+
+    def __iter__(self):
+        for frames in self.frames:
+            yield Timecode(self._rate, frames=int(frames))
+
+    def __repr__(self):
+        return 'TimecodeArray(%r, %s)' % (
+            self.framerate,
+            numpy.array2string(self.to_strings(), separator=', ',
+                               threshold=10)
+        )
@@ -0,0 +1,328 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import os
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .timecode import Timecode, TimecodeError
+
+
+#: The result of :func:`.convert_many`. ``values`` holds the converted values
+#: in the order of the input and ``errors`` holds (index, message) tuples of
+#: the values that could not be converted, sorted by the index.
+BatchResult = namedtuple('BatchResult', ['values', 'errors'])
+
+#: The conversion targets of :func:`.convert_many`.
+TARGET_FRAMES = 'frames'
+TARGET_TIMECODE = 'timecode'
+
+#: Inputs shorter than this are converted in the calling process, starting
+#: the worker processes costs more than what they save for them.
+DEFAULT_THRESHOLD = 200000
+
+_INT64 = array('q').itemsize
+
+
+def _parse_into(data, offsets, out, framerate, start, stop):
+    """parses the encoded timecodes between the given indices with
+    :meth:`.Timecode.tc_to_frames` and writes the frames to ``out``
+
+    :returns: the (index, message) tuples of the timecodes that could not be
+      parsed
+    """
+    tc_to_frames = Timecode(framerate).tc_to_frames
+    errors = []
+    begin = offsets[start]
+    for i in range(start, stop):
+        end = offsets[i + 1]
+        timecode = bytes(data[begin:end]).decode('utf-8')
+        begin = end
+        try:
+            out[i] = tc_to_frames(timecode)
+        except (ValueError, OverflowError) as e:
+            out[i] = 0
+            errors.append((i, str(e)))
+    return errors
+
+
+def _parse_values(values, rate):
+    """parses the timecode strings in the calling process
+    """
+    tc_to_frames = Timecode(rate).tc_to_frames
+    out = array('q')
+    append = out.append
+    errors = []
+    for i, value in enumerate(values):
+        if not isinstance(value, str):
+            append(0)
+            errors.append((i, _type_error(value)))
+            continue
+        try:
+            append(tc_to_frames(value))
+        except (ValueError, OverflowError) as e:
+            append(0)
+            errors.append((i, str(e)))
+    return BatchResult(out, errors)
+
+
+def _type_error(value):
+    return 'Type %s not supported.' % value.__class__.__name__
+
+
+def _format_into(frames, out, framerate, start, stop):
+    """formats the frames between the given indices like
+    :meth:`.Timecode.__repr__` and writes them to ``out`` separated by new
+    lines
+
+    :returns: the number of the written bytes
+    """
+    format_frames = Timecode._validate_framerate(framerate).format_frames
+    text = '\n'.join(
+        [format_frames(frames[i]) for i in range(start, stop)]
+    ).encode('ascii')
+    out[:len(text)] = text
+    return len(text)
+
+
+def _attach(name, fmt):
+    """attaches to the shared memory of the given name and returns it with a
+    view of its buffer in the given format
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, shm.buf.cast(fmt)
+
+
+def _parse_worker(data_name, offsets_name, out_name, framerate, start, stop):
+    shms = []
+    views = []
+    try:
+        for name, fmt in ((data_name, 'B'), (offsets_name, 'q'),
+                          (out_name, 'q')):
+            shm, view = _attach(name, fmt)
+            shms.append(shm)
+            views.append(view)
+        return _parse_into(views[0], views[1], views[2], framerate, start,
+                           stop)
+    finally:
+        # the views should be released before the shared memory is closed
+        for view in views:
+            view.release()
+        for shm in shms:
+            shm.close()
+
+
+def _format_worker(frames_name, out_name, framerate, start, stop,
+                   out_start, out_stop):
+    frames_shm, frames = _attach(frames_name, 'q')
+    out_shm, out = _attach(out_name, 'B')
+    try:
+        return _format_into(frames, out[out_start:out_stop], framerate,
+                            start, stop)
+    finally:
+        frames.release()
+        out.release()
+        frames_shm.close()
+        out_shm.close()
+
+
+def _create(size):
+    return shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+
+def _chunks(count, workers, chunk_size):
+    """returns the (start, stop) indices of the chunks
+    """
+    if chunk_size is None:
+        # a few chunks per worker so they finish at about the same time
+        chunk_size = -(-count // (workers * 4))
+    return [(start, min(start + chunk_size, count))
+            for start in range(0, count, chunk_size)]
+
+
+def _encode(values):
+    """encodes the timecode strings to a single buffer and returns it with
+    the offsets of the timecodes and the errors of the values which are not
+    strings, which are encoded as empty strings
+    """
+    encoded = []
+    offsets = array('q', [0])
+    errors = []
+    total = 0
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            item = value.encode('utf-8')
+            encoded.append(item)
+            total += len(item)
+        else:
+            errors.append((i, _type_error(value)))
+        offsets.append(total)
+    return b''.join(encoded), offsets, errors
+
+
+def _to_int64(values):
+    """returns the given frame counts as an ``array('q')``
+    """
+    if isinstance(values, array) and values.typecode == 'q':
+        return values
+    if hasattr(values, 'dtype'):
+        # numpy arrays
+        return array('q', values.astype('int64', copy=False).tobytes())
+    try:
+        return array('q', values)
+    except (TypeError, OverflowError) as e:
+        raise TimecodeError('The frames should be integers. %s' % e)
+
+
+def convert_many(values, framerate, target=TARGET_FRAMES, workers=None,
+                 threshold=DEFAULT_THRESHOLD, chunk_size=None, executor=None):
+    """Converts many timecode strings to frames or frames to timecode
+    strings using multiple processes.
+
+    The input is split into chunks which are converted by a pool of worker
+    processes. The input and the output are kept in shared memory, so the
+    workers read and write them in place instead of receiving and returning
+    them through pickles. The conversions are done with
+    :meth:`.Timecode.tc_to_frames` and :meth:`.Timecode.__repr__`, so the
+    results are the same with converting the values one by one, and they are
+    in the order of the input.
+
+    Inputs shorter than the threshold are converted in the calling process.
+
+    :param values: The timecode strings for the 'frames' target or the
+      integer frame counts, like a list, an ``array('q')`` or a numpy array,
+      for the 'timecode' target.
+    :param str framerate: The frame rate of the values.
+    :param str target: 'frames' to convert timecode strings to frames or
+      'timecode' to convert frames to timecode strings.
+    :param int workers: The number of worker processes, defaults to the
+      number of CPUs.
+    :param int threshold: The minimum number of values to use the worker
+      processes.
+    :param int chunk_size: The number of values converted by a worker at
+      once, by default the input is split into four chunks per worker.
+    :param executor: An optional ``concurrent.futures.ProcessPoolExecutor``
+      to use instead of starting a new one, handy for many calls.
+    :returns: A :class:`.BatchResult`. For the 'frames' target ``values`` is
+      an ``array('q')`` where the timecodes which could not be parsed are 0,
+      for the 'timecode' target it is a list of strings.
+    """
+    rate = Timecode._validate_framerate(framerate)
+    if target not in (TARGET_FRAMES, TARGET_TIMECODE):
+        raise TimecodeError(
+            'Unknown target %r, should be one of %s, %s.' %
+            (target, TARGET_FRAMES, TARGET_TIMECODE)
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if target == TARGET_FRAMES:
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        if len(values) < threshold or workers < 2:
+            return _parse_values(values, rate)
+        return _parse_parallel(values, rate, workers, chunk_size, executor)
+
+    frames = _to_int64(values)
+    count = len(frames)
+    if count < threshold or workers < 2:
+        return BatchResult(
+            [rate.format_frames(f) for f in frames], []
+        )
+    return _format_parallel(frames, rate, workers, chunk_size, executor)
+
+
+def _run(executor, workers, submit):
+    """calls submit with an executor, creating one if none is given
+    """
+    if executor is not None:
+        return submit(executor)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return submit(executor)
+
+
+def _parse_parallel(values, rate, workers, chunk_size, executor):
+    data, offsets, errors = _encode(values)
+    count = len(offsets) - 1
+    data_shm = _create(len(data))
+    offsets_shm = _create(len(offsets) * _INT64)
+    out_shm = _create(count * _INT64)
+    try:
+        data_shm.buf[:len(data)] = data
+        offsets_shm.buf[:len(offsets) * _INT64] = offsets.tobytes()
+
+        def submit(executor):
+            futures = [
+                executor.submit(_parse_worker, data_shm.name,
+                                offsets_shm.name, out_shm.name, rate, start,
+                                stop)
+                for start, stop in _chunks(count, workers, chunk_size)
+            ]
+            # the futures are read in the order of the chunks
+            return [future.result() for future in futures]
+
+        # the values which are not strings are already in the errors
+        skipped = set(index for index, message in errors)
+        for chunk_errors in _run(executor, workers, submit):
+            errors += [error for error in chunk_errors
+                       if error[0] not in skipped]
+        out = array('q', bytes(out_shm.buf[:count * _INT64]))
+    finally:
+        for shm in (data_shm, offsets_shm, out_shm):
+            shm.close()
+            shm.unlink()
+    return BatchResult(out, sorted(errors))
+
+
+def _format_parallel(frames, rate, workers, chunk_size, executor):
+    count = len(frames)
+    # every timecode takes at most the width of its fields plus a new line
+    width = 10 + max(2, len(str(rate.int_framerate - 1)))
+    frames_shm = _create(count * _INT64)
+    out_shm = _create(count * width)
+    try:
+        frames_shm.buf[:count * _INT64] = frames.tobytes()
+        chunks = _chunks(count, workers, chunk_size)
+
+        def submit(executor):
+            futures = [
+                executor.submit(_format_worker, frames_shm.name,
+                                out_shm.name, rate, start, stop,
+                                start * width, stop * width)
+                for start, stop in chunks
+            ]
+            return [future.result() for future in futures]
+
+        strings = []
+        for (start, stop), size in zip(chunks, _run(executor, workers,
+                                                    submit)):
+            text = bytes(out_shm.buf[start * width:start * width + size])
+            strings += text.decode('ascii').split('\n')
+    finally:
+        for shm in (frames_shm, out_shm):
+            shm.close()
+            shm.unlink()
+    return BatchResult(strings, [])
@@ -0,0 +1,325 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from .timecode import Timecode, TimecodeError
+
+
+#: The ids of the frame rates in the integer encoding of :func:`.pack_int`,
+#: they should never change.
+RATE_IDS = {
+    '23.98': 1,
+    '24': 2,
+    '25': 3,
+    '29.97': 4,
+    '30': 5,
+    '50': 6,
+    '59.94': 7,
+    '60': 8,
+    'ms': 9,
+    'frames': 10,
+}
+
+_RATES_BY_ID = dict((rate_id, key) for key, rate_id in RATE_IDS.items())
+
+_DROP_FRAME_FLAG = 1 << 6
+_COLOR_FRAME_FLAG = 1 << 7
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _validate_bcd_rate(framerate):
+    rate = Timecode._validate_framerate(framerate)
+    if rate.framerate in ('frames', 1000) or rate.int_framerate > 60:
+        raise TimecodeError(
+            'The %r frame rate can not be packed as BCD.' % rate.framerate
+        )
+    return rate
+
+
+def _pair_flag(rate):
+    """returns the flag marking the second frame of a frame pair for the
+    frame rates above 30, where the frames are counted in pairs like in
+    SMPTE 12M, the flag is in the seconds for 60 and in the hours for 50
+    """
+    if rate.int_framerate <= 30:
+        return 0
+    return 1 << 31 if rate.int_framerate == 50 else 1 << 15
+
+
+def _bcd(hrs, mins, secs, frs):
+    """returns the BCD digits of the fields, it works with integers and with
+    numpy arrays
+    """
+    return (frs % 10) | (frs // 10 << 4) | \
+        (secs % 10 << 8) | (secs // 10 << 12) | \
+        (mins % 10 << 16) | (mins // 10 << 20) | \
+        (hrs % 10 << 24) | (hrs // 10 << 28)
+
+
+def _from_bcd(value):
+    """returns the hours, minutes, seconds and frames of the BCD digits and
+    the nibbles which are not decimal digits, it works with integers and
+    with numpy arrays
+    """
+    units = [(value >> shift) & 0xF for shift in (0, 8, 16, 24)]
+    tens = [(value >> 4) & 0x3, (value >> 12) & 0x7, (value >> 20) & 0x7,
+            (value >> 28) & 0x3]
+    frs, secs, mins, hrs = [u + t * 10 for u, t in zip(units, tens)]
+    invalid = (units[0] > 9) | (units[1] > 9) | (units[2] > 9) | \
+        (units[3] > 9) | (secs > 59) | (mins > 59) | (hrs > 23)
+    return hrs, mins, secs, frs, invalid
+
+
+def pack_bcd(timecode, color_frame=False):
+    """returns the given timecode as a 32 bit SMPTE 12M BCD value
+
+    The layout is the time address of an LTC frame without the user bits:
+    the frame, seconds, minutes and hours in the four bytes from the lowest
+    one, the units in the lower four bits and the tens above them. Bit 6 is
+    the drop frame flag and bit 7 the color frame flag. For the frame rates
+    above 30 the frames are counted in pairs and the second frame of a pair
+    is flagged in bit 15, or in bit 31 for 50 frames per second.
+
+    :param timecode: A :class:`.Timecode`, 'ms' and 'frames' timecodes can
+      not be packed.
+    :param bool color_frame: The color frame flag.
+    :returns int: the packed value
+    """
+    rate = _validate_bcd_rate(timecode._rate)
+    hrs, mins, secs, frs = rate.frames_to_tc(timecode.frames)
+    value = 0
+    pair_flag = _pair_flag(rate)
+    if pair_flag:
+        if frs & 1:
+            value |= pair_flag
+        frs >>= 1
+    value |= _bcd(hrs, mins, secs, frs)
+    if rate.drop_frame:
+        value |= _DROP_FRAME_FLAG
+    if color_frame:
+        value |= _COLOR_FRAME_FLAG
+    return value
+
+
+def unpack_bcd(value, framerate):
+    """returns the :class:`.Timecode` of the given 32 bit SMPTE 12M BCD value,
+    see :func:`.pack_bcd`
+
+    :raises TimecodeError: If the value is not a valid timecode.
+    """
+    rate = _validate_bcd_rate(framerate)
+    hrs, mins, secs, frs, invalid = _from_bcd(value)
+    pair_flag = _pair_flag(rate)
+    if pair_flag:
+        frs = frs * 2 + bool(value & pair_flag)
+    if invalid or frs >= rate.int_framerate:
+        raise TimecodeError('Invalid BCD timecode 0x%08X.' % value)
+    return Timecode(rate, frames=rate.fields_to_frames(hrs, mins, secs, frs))
+
+
+def _rate_id(rate):
+    # integer frame rates like FrameRate(25) have the id of '25'
+    try:
+        return RATE_IDS[str(rate._key)]
+    except KeyError:
+        raise TimecodeError('The %r frame rate has no id.' % rate.framerate)
+
+
+def pack_int(timecode):
+    """returns the frames and the frame rate of the given timecode as a
+    single 64 bit integer
+
+    The frames are in the upper 56 bits and the id of the frame rate from
+    :data:`.RATE_IDS` in the lowest 8 bits, so the frames of any timecode,
+    even the negative ones, are kept as they are.
+    """
+    return (timecode.frames << 8) | _rate_id(timecode._rate)
+
+
+def unpack_int(value):
+    """returns the :class:`.Timecode` of the given 64 bit integer, see
+    :func:`.pack_int`
+    """
+    try:
+        framerate = _RATES_BY_ID[value & 0xFF]
+    except KeyError:
+        raise TimecodeError('Unknown frame rate id %s.' % (value & 0xFF))
+    return Timecode(framerate, frames=value >> 8)
+
+
+def _little_endian(values):
+    """returns the array in little endian byte order"""
+    if _BIG_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def _from_buffer(buffer, typecode):
+    """returns the little endian values in the given buffer as an array"""
+    values = array(typecode)
+    values.frombytes(memoryview(buffer).cast('B'))
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def _to_numpy(values, dtype):
+    if isinstance(values, numpy.ndarray):
+        return values.astype(dtype, copy=False)
+    if isinstance(values, array) and values.itemsize == numpy.dtype(
+            dtype).itemsize:
+        return numpy.frombuffer(values, dtype=dtype)
+    return numpy.asarray(values, dtype=dtype)
+
+
+def pack_bcd_many(frames, framerate, color_frame=False):
+    """packs the timecodes of the given frames to 32 bit SMPTE 12M BCD
+    values, see :func:`.pack_bcd`
+
+    With numpy the values are calculated with whole array operations, no
+    python objects are created for the individual timecodes.
+
+    :param frames: The frames of the timecodes, a list, an ``array('q')``, a
+      numpy array or any iterable of integers.
+    :param str framerate: The frame rate of the timecodes.
+    :returns: An ``array('I')`` in little endian byte order, use
+      ``tobytes()`` to get the bytes.
+    """
+    rate = _validate_bcd_rate(framerate)
+    flags = (_DROP_FRAME_FLAG if rate.drop_frame else 0) | \
+        (_COLOR_FRAME_FLAG if color_frame else 0)
+    pair_flag = _pair_flag(rate)
+
+    if numpy is None:
+        values = array('I')
+        for frame in frames:
+            value = pack_bcd(Timecode(rate, frames=frame), color_frame)
+            values.append(value)
+        return _little_endian(values)
+
+    from .array import TimecodeArray
+
+    hrs, mins, secs, frs = TimecodeArray(rate).frames_to_tc(
+        _to_numpy(frames, numpy.int64)
+    )
+    values = flags
+    if pair_flag:
+        values = values | (frs & 1) * pair_flag
+        frs = frs >> 1
+    values = values | _bcd(hrs, mins, secs, frs)
+    return _little_endian(array('I', values.astype(numpy.uint32).tobytes()))
+
+
+def unpack_bcd_many(buffer, framerate):
+    """unpacks the 32 bit SMPTE 12M BCD values in the given buffer to frames,
+    see :func:`.pack_bcd`
+
+    :param buffer: ``bytes``, an ``array('I')``, a ``memoryview`` or any
+      buffer of little endian 32 bit values.
+    :param str framerate: The frame rate of the timecodes.
+    :returns: An ``array('q')`` of frames.
+    :raises TimecodeError: If any value is not a valid timecode.
+    """
+    rate = _validate_bcd_rate(framerate)
+    values = _from_buffer(buffer, 'I')
+
+    if numpy is None:
+        frames = array('q')
+        for i, value in enumerate(values):
+            try:
+                frames.append(unpack_bcd(value, rate).frames)
+            except TimecodeError as e:
+                raise TimecodeError('%s At index %s.' % (e, i))
+        return frames
+
+    values = numpy.frombuffer(values, dtype=numpy.uint32).astype(numpy.int64)
+    hrs, mins, secs, frs, invalid = _from_bcd(values)
+    pair_flag = _pair_flag(rate)
+    if pair_flag:
+        frs = frs * 2 + ((values & pair_flag) != 0)
+    invalid |= frs >= rate.int_framerate
+    if invalid.any():
+        i = int(numpy.flatnonzero(invalid)[0])
+        raise TimecodeError('Invalid BCD timecode 0x%08X. At index %s.' %
+                            (values[i], i))
+    frames = rate.fields_to_frames(hrs, mins, secs, frs)
+    return array('q', frames.astype(numpy.int64).tobytes())
+
+
+def pack_int_many(frames, framerate):
+    """packs the given frames with the frame rate to 64 bit integers, see
+    :func:`.pack_int`
+
+    :returns: An ``array('q')`` in little endian byte order.
+    """
+    rate_id = _rate_id(Timecode._validate_framerate(framerate))
+    if numpy is None:
+        values = array('q', [(frame << 8) | rate_id for frame in frames])
+        return _little_endian(values)
+    values = (_to_numpy(frames, numpy.int64) << 8) | rate_id
+    return _little_endian(array('q', values.tobytes()))
+
+
+def unpack_int_many(buffer, framerate):
+    """unpacks the 64 bit integers in the given buffer to frames, see
+    :func:`.pack_int`
+
+    :param buffer: ``bytes``, an ``array('q')``, a ``memoryview`` or any
+      buffer of little endian 64 bit values.
+    :param str framerate: The frame rate all the values should have.
+    :returns: An ``array('q')`` of frames.
+    :raises TimecodeError: If any value has another frame rate.
+    """
+    rate = Timecode._validate_framerate(framerate)
+    rate_id = _rate_id(rate)
+    values = _from_buffer(buffer, 'q')
+
+    if numpy is None:
+        frames = array('q')
+        for i, value in enumerate(values):
+            if value & 0xFF != rate_id:
+                raise TimecodeError(
+                    'The value at index %s is not in the %r frame rate.' %
+                    (i, rate.framerate)
+                )
+            frames.append(value >> 8)
+        return frames
+
+    values = numpy.frombuffer(values, dtype=numpy.int64)
+    wrong = (values & 0xFF) != rate_id
+    if wrong.any():
+        raise TimecodeError(
+            'The value at index %s is not in the %r frame rate.' %
+            (int(numpy.flatnonzero(wrong)[0]), rate.framerate)
+        )
+    return array('q', (values >> 8).tobytes())
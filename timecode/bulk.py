@@ -0,0 +1,497 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from array import array
+from collections import namedtuple
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from .timecode import Timecode, TimecodeError
+
+
+#: The result of :func:`.parse_buffer`. ``frames`` holds one frame count per
+#: timecode in the buffer, and ``errors`` holds the byte offsets of the
+#: timecodes that could not be parsed, their frame counts are set to 0.
+BulkParseResult = namedtuple('BulkParseResult', ['frames', 'errors'])
+
+#: The number of bytes parsed at once by the numpy parser, it limits the
+#: memory used for the temporary arrays.
+CHUNK_SIZE = 1 << 22
+
+#: The maximum number of digits in a timecode field, the frames of the
+#: largest fields still fit in an int64.
+MAX_FIELD_DIGITS = 9
+
+_SEPARATORS = frozenset(b':;.')
+_POWERS_OF_10 = numpy and numpy.array(
+    [10 ** i for i in range(MAX_FIELD_DIGITS + 1)], dtype=numpy.int64
+)
+_WHITESPACE = frozenset(b' \t\r\0')
+_WHITESPACE_STR = ' \t\r\0'
+
+#: The error codes of :func:`.validate_timecodes`, from the most to the least
+#: severe one, a timecode gets the code of the first problem found.
+VALID = 0
+MALFORMED = 1
+HOURS_OUT_OF_RANGE = 2
+MINUTES_OUT_OF_RANGE = 3
+SECONDS_OUT_OF_RANGE = 4
+FRAMES_OUT_OF_RANGE = 5
+DROPPED_FRAME = 6
+
+ERROR_MESSAGES = {
+    VALID: 'valid',
+    MALFORMED: 'malformed timecode',
+    HOURS_OUT_OF_RANGE: 'hours out of range',
+    MINUTES_OUT_OF_RANGE: 'minutes out of range',
+    SECONDS_OUT_OF_RANGE: 'seconds out of range',
+    FRAMES_OUT_OF_RANGE: 'frames out of range',
+    DROPPED_FRAME: 'dropped frame number in a drop frame timecode',
+}
+
+#: The result of :func:`.validate_timecodes`. ``frames`` holds the frame
+#: count of every timecode, 0 for the invalid ones, and ``codes`` holds the
+#: error code of every timecode, :data:`VALID` (0) for the valid ones.
+ValidationResult = namedtuple('ValidationResult', ['frames', 'codes'])
+
+
+def parse_buffer(buffer, framerate, delimiter=b'\n', use_numpy=True,
+                 validate=False):
+    """Parses the timecodes in the given buffer to frames.
+
+    The timecodes are separated by the delimiter and can be in any of the
+    forms :meth:`.Timecode.parse_timecode` accepts ('00:00:00:00',
+    '00:00:00;00' or '00.00.00.00'). Leading and trailing white space and null
+    bytes of each timecode are ignored and so are the empty timecodes.
+
+    The buffer is read in place, no intermediate strings are created. When
+    numpy is installed the buffer is parsed in chunks with whole array
+    operations, otherwise it is scanned byte by byte.
+
+    Malformed timecodes do not raise an error, their frame counts are set to
+    0 and the byte offsets where they start are listed in the ``errors`` of
+    the result.
+
+    :param buffer: A ``bytes``, ``bytearray``, ``mmap`` or ``memoryview`` or
+      any other object supporting the buffer protocol.
+    :param str framerate: The frame rate of the timecodes.
+    :param bytes delimiter: The single byte separating the timecodes.
+    :param bool use_numpy: Set it to False to use the pure python parser even
+      when numpy is installed.
+    :param bool validate: Set it to True to also report the timecodes with
+      out of range fields or dropped frame numbers as errors, see
+      :func:`.validate_timecodes`.
+    :returns: A :class:`.BulkParseResult` holding two ``array('q')``
+      instances.
+    """
+    rate = Timecode._validate_framerate(framerate)
+
+    if isinstance(delimiter, str):
+        delimiter = delimiter.encode('ascii')
+    if len(delimiter) != 1:
+        raise TimecodeError('The delimiter should be a single byte.')
+    delimiter = delimiter[0]
+    if delimiter in _SEPARATORS or 48 <= delimiter <= 57:
+        raise TimecodeError(
+            'The delimiter can not be a digit or a timecode separator.'
+        )
+
+    view = memoryview(buffer)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+
+    frames = array('q')
+    errors = array('q')
+    if numpy is not None and use_numpy:
+        _parse_numpy(view, rate, delimiter, frames, errors, validate)
+    else:
+        _parse_python(view, rate, delimiter, frames, errors, validate)
+    return BulkParseResult(frames, errors)
+
+
+def _parse_python(view, rate, delimiter, frames_out, errors_out, validate):
+    """parses the buffer byte by byte
+    """
+    separators = _SEPARATORS
+    whitespace = _WHITESPACE
+
+    fields = [0, 0, 0, 0]
+    digits = [0, 0, 0, 0]
+    field = 0
+    start = 0
+    has_content = False
+    content_ended = False
+    valid = True
+
+    for offset, char in enumerate(view):
+        if char == delimiter:
+            if has_content or not valid:
+                _finish_record(rate, fields, digits, field, valid, start,
+                               frames_out, errors_out, validate)
+            fields = [0, 0, 0, 0]
+            digits = [0, 0, 0, 0]
+            field = 0
+            start = offset + 1
+            has_content = False
+            content_ended = False
+            valid = True
+        elif not valid:
+            continue
+        elif char in whitespace:
+            if has_content:
+                content_ended = True
+        elif content_ended:
+            # white space inside the timecode
+            valid = False
+        elif 48 <= char <= 57:
+            has_content = True
+            if field < 4:
+                fields[field] = fields[field] * 10 + char - 48
+                digits[field] += 1
+        elif char in separators:
+            has_content = True
+            field += 1
+        else:
+            valid = False
+
+    if has_content or not valid:
+        _finish_record(rate, fields, digits, field, valid, start,
+                       frames_out, errors_out, validate)
+
+
+def _finish_record(rate, fields, digits, field, valid, start, frames_out,
+                   errors_out, validate):
+    """appends the frames of a single record parsed by :func:`_parse_python`
+    """
+    if valid and field == 3 and min(digits) > 0 and \
+            max(digits) <= MAX_FIELD_DIGITS and \
+            not (validate and _field_code(rate, *fields)):
+        frames_out.append(rate.fields_to_frames(*fields))
+    else:
+        frames_out.append(0)
+        errors_out.append(start)
+
+
+def _parse_numpy(view, rate, delimiter, frames_out, errors_out, validate):
+    """parses the buffer in chunks that end at a delimiter
+    """
+    data = numpy.frombuffer(view, dtype=numpy.uint8)
+    size = len(data)
+    position = 0
+    while position < size:
+        end = min(position + CHUNK_SIZE, size)
+        while end < size:
+            # end the chunk right after the last delimiter in it
+            hits = numpy.flatnonzero(data[position:end] == delimiter)
+            if len(hits):
+                end = position + hits[-1] + 1
+                break
+            end = min(end + CHUNK_SIZE, size)
+
+        frames, errors = _parse_chunk(data[position:end], rate, delimiter,
+                                      validate)
+        frames_out.frombytes(frames.tobytes())
+        errors_out.frombytes((errors + position).tobytes())
+        position = end
+
+
+def _parse_chunk(data, rate, delimiter, validate=False):
+    """parses the records in a chunk with whole array operations
+
+    :returns: two int64 arrays, the frames of each record and the offsets of
+      the malformed records within the chunk
+    """
+    delims = numpy.flatnonzero(data == delimiter)
+    starts = numpy.concatenate(([0], delims + 1))
+
+    width = starts[1] if len(delims) else 0
+    if width > 1 and delims[-1] == len(delims) * width - 1 and \
+            len(data) - len(delims) * width < width and \
+            numpy.array_equal(delims,
+                              numpy.arange(width - 1, len(delims) * width,
+                                           width)):
+        # all the records have the same length, which is the usual case for
+        # logs, they are parsed as the columns of a matrix
+        rows = len(delims)
+        chars = data[:rows * width].reshape(rows, width)[:, :-1]
+        fields, invalid, empty = parse_columns(chars)
+        tail = data[rows * width:]
+        tail_result = parse_columns(tail.reshape(1, len(tail)))
+        fields = numpy.concatenate((fields, tail_result[0]), axis=1)
+        invalid = numpy.concatenate((invalid, tail_result[1]))
+        empty = numpy.concatenate((empty, tail_result[2]))
+    else:
+        fields, invalid, empty = _parse_records(data, delims, starts)
+
+    keep = ~empty
+    fields = fields[:, keep]
+    invalid = invalid[keep]
+    starts = starts[keep]
+    if validate:
+        invalid |= _field_codes(rate, fields) != VALID
+
+    frames = rate.fields_to_frames(*fields)
+    frames[invalid] = 0
+    return frames, starts[invalid]
+
+
+def validate_timecodes(timecodes, framerate, use_numpy=True):
+    """Validates and converts the given timecode strings to frames in a
+    single pass, without raising errors.
+
+    Every timecode is checked to be in one of the forms
+    :meth:`.Timecode.parse_timecode` accepts, to have its hours, minutes,
+    seconds and frames within the ranges of the frame rate and, for the drop
+    frame rates, to not be one of the dropped frame numbers, like
+    '00:01:00;00' in 29.97.
+
+    :param timecodes: A sequence or numpy array of timecode strings. Items
+      which are not strings are reported as malformed.
+    :param str framerate: The frame rate of the timecodes.
+    :param bool use_numpy: Set it to False to use the pure python validator
+      even when numpy is installed.
+    :returns: A :class:`.ValidationResult`, the frames in an ``array('q')``
+      and the error codes in an ``array('B')``, one per timecode. The error
+      codes are explained in :data:`.ERROR_MESSAGES`.
+    """
+    rate = Timecode._validate_framerate(framerate)
+
+    if numpy is not None and use_numpy:
+        chars = _string_columns(timecodes)
+        if chars is not None:
+            fields, invalid, empty = parse_columns(chars)
+            codes = _field_codes(rate, fields)
+            codes[invalid | empty] = MALFORMED
+            frames = rate.fields_to_frames(*fields)
+            frames[codes != VALID] = 0
+            return ValidationResult(array('q', frames.tobytes()),
+                                    array('B', codes.tobytes()))
+
+    frames_out = array('q')
+    codes_out = array('B')
+    fields_to_frames = rate.fields_to_frames
+    for timecode in timecodes:
+        fields = _split_fields(timecode)
+        if fields is None:
+            code = MALFORMED
+        else:
+            code = _field_code(rate, *fields)
+        frames_out.append(0 if code else fields_to_frames(*fields))
+        codes_out.append(code)
+    return ValidationResult(frames_out, codes_out)
+
+
+def _split_fields(timecode):
+    """returns the hours, minutes, seconds and frames of the given timecode
+    string, or None if it is malformed
+    """
+    if isinstance(timecode, bytes):
+        timecode = timecode.decode('latin-1')
+    elif not isinstance(timecode, str):
+        return None
+    parts = timecode.strip(_WHITESPACE_STR).replace(';', ':') \
+        .replace('.', ':').split(':')
+    if len(parts) != 4:
+        return None
+    for part in parts:
+        if not (part.isdigit() and part.isascii()) or \
+                len(part) > MAX_FIELD_DIGITS:
+            return None
+    return [int(part) for part in parts]
+
+
+def _field_code(rate, hours, minutes, seconds, frames):
+    """returns the error code of the given timecode fields
+    """
+    if hours >= 24:
+        return HOURS_OUT_OF_RANGE
+    elif minutes >= 60:
+        return MINUTES_OUT_OF_RANGE
+    elif seconds >= 60:
+        return SECONDS_OUT_OF_RANGE
+    elif frames >= rate.int_framerate:
+        return FRAMES_OUT_OF_RANGE
+    elif rate.drop_frame and frames < rate.drop_frames and seconds == 0 \
+            and minutes % 10:
+        return DROPPED_FRAME
+    return VALID
+
+
+def _field_codes(rate, fields):
+    """returns the error codes of the timecode fields in the given (4, n)
+    int64 array as an uint8 array, does what :func:`._field_code` does with
+    whole array operations
+    """
+    hours, minutes, seconds, frames = fields
+    codes = numpy.zeros(len(hours), dtype=numpy.uint8)
+    # the less severe codes are set first, so the more severe ones win
+    if rate.drop_frame:
+        codes[(frames < rate.drop_frames) & (seconds == 0) &
+              (minutes % 10 != 0)] = DROPPED_FRAME
+    codes[frames >= rate.int_framerate] = FRAMES_OUT_OF_RANGE
+    codes[seconds >= 60] = SECONDS_OUT_OF_RANGE
+    codes[minutes >= 60] = MINUTES_OUT_OF_RANGE
+    codes[hours >= 24] = HOURS_OUT_OF_RANGE
+    return codes
+
+
+def _string_columns(timecodes):
+    """returns the given timecode strings as a two dimensional uint8 array of
+    their characters, one row per timecode, or None if they are not all
+    strings
+
+    Non ASCII characters are replaced with 0xff, so they are reported as
+    malformed instead of raising an encoding error.
+    """
+    data = numpy.asarray(timecodes)
+    if data.dtype.kind not in 'US':
+        return None
+    data = numpy.ascontiguousarray(data.reshape(-1))
+    count = len(data)
+    if data.dtype.kind == 'S':
+        return data.view(numpy.uint8).reshape(count, data.dtype.itemsize)
+    chars = data.view(numpy.uint32).reshape(count, data.dtype.itemsize // 4)
+    return numpy.where(chars < 128, chars, 255).astype(numpy.uint8)
+
+
+def parse_columns(chars):
+    """parses the rows of the given two dimensional uint8 array as timecodes
+
+    The rows are parsed column by column, so the cost is a handful of numpy
+    operations per character position instead of per timecode. White space
+    and null bytes are allowed before and after the timecode.
+
+    :returns: an int64 array of shape (4, rows) of the hours, minutes,
+      seconds and frames, a bool array marking the malformed rows and a bool
+      array marking the empty rows
+    """
+    count, width = chars.shape
+    fields = numpy.zeros((4, count), dtype=numpy.int64)
+    digit_count = numpy.zeros((4, count), dtype=numpy.int64)
+    field = numpy.zeros(count, dtype=numpy.int64)
+    started = numpy.zeros(count, dtype=bool)
+    ended = numpy.zeros(count, dtype=bool)
+    bad_chars = numpy.zeros(count, dtype=bool)
+    rows = numpy.arange(count)
+
+    for column in range(width):
+        char = chars[:, column]
+        digit = char - 48  # wraps around for the smaller values
+        is_digit = digit < 10
+        is_sep = (char == 58) | (char == 59) | (char == 46)  # : ; .
+        is_content = is_digit | is_sep
+        is_ws = (char == 32) | (char == 9) | (char == 13) | (char == 0)
+
+        bad_chars |= ~(is_content | is_ws)
+        # white space inside the timecode
+        bad_chars |= is_content & ended
+        ended |= is_ws & started
+        started |= is_content
+
+        mask = is_digit & (field < 4)
+        if mask.all():
+            idx = field
+            row = rows
+        else:
+            idx = field[mask]
+            row = rows[mask]
+            digit = digit[mask]
+        fields[idx, row] = fields[idx, row] * 10 + digit
+        digit_count[idx, row] += 1
+
+        field += is_sep
+
+    invalid = bad_chars | (field != 3)
+    invalid |= (digit_count == 0).any(axis=0)
+    invalid |= (digit_count > MAX_FIELD_DIGITS).any(axis=0)
+    empty = ~started & ~bad_chars
+    return fields, invalid, empty
+
+
+def _parse_records(data, delims, starts):
+    """parses the variable length records of a chunk at byte level
+
+    :returns: the same values with :func:`.parse_columns`
+    """
+    is_delim = numpy.zeros(len(data), dtype=bool)
+    is_delim[delims] = True
+    is_digit = (data >= 48) & (data <= 57)
+    is_sep = (data == 58) | (data == 59) | (data == 46)
+    is_ws = (data == 32) | (data == 9) | (data == 13) | (data == 0)
+    is_content = is_digit | is_sep
+    is_other = ~(is_content | is_ws | is_delim)
+    record_count = len(starts)
+
+    # the index of the record of each byte
+    record = numpy.cumsum(is_delim, dtype=numpy.int32) - is_delim
+
+    def per_record(mask):
+        return numpy.bincount(record[mask], minlength=record_count)
+
+    content_count = per_record(is_content)
+    sep_count = per_record(is_sep)
+    bad_chars = per_record(is_other) > 0
+
+    # white space is only allowed before and after the timecode
+    content_before = numpy.cumsum(is_content, dtype=numpy.int32) - is_content
+    padded = numpy.append(content_before,
+                          content_before[-1:] + is_content[-1:])
+    record_base = padded[starts]
+    ws = numpy.flatnonzero(is_ws)
+    ws_record = record[ws]
+    before = content_before[ws] - record_base[ws_record]
+    after = content_count[ws_record] - before
+    interior = ws[(before > 0) & (after > 0)]
+    bad_chars |= numpy.bincount(record[interior], minlength=record_count) > 0
+
+    # the field index of each digit
+    sep_before = numpy.cumsum(is_sep, dtype=numpy.int32) - is_sep
+    sep_base = numpy.append(sep_before, 0)[starts]
+    digits = numpy.flatnonzero(is_digit)
+    digit_record = record[digits]
+    field = sep_before[digits] - sep_base[digit_record]
+    group = digit_record * 4 + numpy.minimum(field, 3)
+
+    digit_count = numpy.bincount(group, minlength=record_count * 4)
+    invalid = bad_chars | (sep_count != 3)
+    invalid |= (digit_count == 0).reshape(record_count, 4).any(axis=1)
+    invalid |= (digit_count > MAX_FIELD_DIGITS).reshape(
+        record_count, 4).any(axis=1)
+
+    # digits of a field are contiguous, so the fields are summed in runs
+    fields = numpy.zeros(record_count * 4, dtype=numpy.int64)
+    if len(digits):
+        group_start = numpy.cumsum(digit_count) - digit_count
+        rank = numpy.arange(len(digits)) - group_start[group]
+        exponent = numpy.minimum(digit_count[group] - 1 - rank,
+                                 MAX_FIELD_DIGITS)
+        values = (data[digits] - 48) * _POWERS_OF_10[exponent]
+        groups = numpy.flatnonzero(digit_count)
+        fields[groups] = numpy.add.reduceat(values, group_start[groups])
+    fields = fields.reshape(record_count, 4).T
+
+    empty = (content_count == 0) & ~bad_chars
+    return fields, invalid, empty
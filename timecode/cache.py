@@ -0,0 +1,119 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+
+#: The statistics of an :class:`.LRUCache`.
+CacheInfo = namedtuple('CacheInfo',
+                       ['hits', 'misses', 'evictions', 'size', 'capacity'])
+
+
+class LRUCache(object):
+    """A size bounded mapping which drops the least recently used item when
+    it is full.
+
+    Counts the hits, the misses and the evicted items, so the capacity can be
+    sized by looking at :meth:`.info`. It is safe to use from multiple
+    threads.
+
+    :param int capacity: The maximum number of items.
+    """
+
+    def __init__(self, capacity):
+        self._items = OrderedDict()
+        self._lock = Lock()
+        self._capacity = 0
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError(
+                'The capacity should be a positive integer, not %r.' %
+                capacity
+            )
+        with self._lock:
+            self._capacity = capacity
+            self._evict()
+
+    def _evict(self):
+        items = self._items
+        while len(items) > self._capacity:
+            items.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        """returns the value of the given key and marks it as the most
+        recently used one, or the default if the key is not in the cache
+        """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """adds the given value to the cache, evicting the least recently used
+        item if the cache is full
+        """
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            self._evict()
+
+    def clear(self):
+        """removes all the items and resets the counters
+        """
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """returns the statistics of the cache as a :class:`.CacheInfo`
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             len(self._items), self._capacity)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __repr__(self):
+        return '<LRUCache %s/%s items>' % (len(self._items), self._capacity)
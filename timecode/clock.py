@@ -0,0 +1,283 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import time
+from collections import namedtuple
+
+from .ranges import to_frames
+from .timecode import Timecode
+
+
+#: A tick of a :class:`.TimecodeClock`. ``frames`` and ``timecode`` are the
+#: frames and the string representation of the timecode of the tick,
+#: ``time_ns`` is the clock time when the tick was emitted, ``late_ns`` is how
+#: much later than its exact time it was emitted and ``dropped`` is the number
+#: of ticks skipped before it because the clock was too late to emit them.
+ClockTick = namedtuple('ClockTick',
+                       ['frames', 'timecode', 'time_ns', 'late_ns', 'dropped'])
+
+_NS_PER_SECOND = 1000000000
+
+
+def _wake(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class TimecodeClock(object):
+    """A real time clock that counts timecodes at the exact frame rate.
+
+    The time of every tick is calculated from the time the clock started
+    with the exact rational frame rate, like 60000/1001 frames per second for
+    '59.94', so the clock does not drift no matter how long it runs or how
+    late the event loop wakes it up. When the clock falls behind by more than
+    a frame the missed ticks are skipped, the next tick shows the current
+    timecode and how many ticks were dropped.
+
+    A single task runs the clock. Any number of subscribers can wait for the
+    ticks with :meth:`.ticks` or :meth:`.next_tick`, and callbacks added with
+    :meth:`.add_callback` are called from the clock task. The ticks are
+    published as a chain of futures, every future holds a tick and the future
+    of the next tick, so all the subscribers wait for the same future and a
+    subscriber which falls behind still gets every tick in order.
+
+    :param start: The :class:`.Timecode` of the first tick, it also sets the
+      frame rate.
+    :param clock: A function returning a monotonic time in nanoseconds,
+      defaults to ``time.monotonic_ns``.
+    :param int tolerance_ns: Ticks emitted later than this are counted as
+      late, defaults to half a frame.
+    """
+
+    def __init__(self, start, clock=time.monotonic_ns, tolerance_ns=None):
+        self.rate = start._rate
+        self.clock = clock
+        rational = self.rate.rational
+        # the time of a tick is index * _period_num / _period_den nanoseconds
+        self._period_num = _NS_PER_SECOND * rational.denominator
+        self._period_den = rational.numerator
+        if tolerance_ns is None:
+            tolerance_ns = self._period_num // self._period_den // 2
+        self.tolerance_ns = tolerance_ns
+
+        self._origin_frames = start.frames
+        self._origin_ns = None
+        self._index = -1
+        self._frames = start.frames
+
+        self._callbacks = []
+        self._future = None
+        self._waiter = None
+        self._task = None
+        self._stopped = False
+
+        #: The number of ticks emitted later than the tolerance.
+        self.late_ticks = 0
+        #: The number of skipped ticks.
+        self.dropped_ticks = 0
+        #: The latest a tick has been emitted.
+        self.max_late_ns = 0
+
+    @property
+    def framerate(self):
+        return self.rate.framerate
+
+    @property
+    def frames(self):
+        """returns the frames of the latest tick
+        """
+        return self._frames
+
+    @property
+    def timecode(self):
+        """returns the timecode of the latest tick as a :class:`.Timecode`
+        """
+        return Timecode(self.rate, frames=self._frames)
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def _time_of(self, index):
+        """returns the exact clock time of the tick with the given index,
+        rounded up to the nanosecond
+        """
+        return self._origin_ns - \
+            (-index * self._period_num // self._period_den)
+
+    def _index_at(self, time_ns):
+        """returns the index of the latest tick due at the given time
+        """
+        return (time_ns - self._origin_ns) * self._period_den // \
+            self._period_num
+
+    def start(self):
+        """starts the clock in the running event loop, the first tick is
+        emitted immediately
+
+        A stopped clock continues from where it would be if it was never
+        stopped, use :meth:`.jam_sync` to start it from another timecode.
+
+        :returns: the ``asyncio.Task`` running the clock
+        """
+        if not self.running:
+            loop = asyncio.get_running_loop()
+            if self._origin_ns is None:
+                self._origin_ns = self.clock()
+            self._next_future()
+            self._stopped = False
+            self._task = loop.create_task(self._run(loop))
+        return self._task
+
+    def stop(self):
+        """stops the clock, the waiting subscribers get None
+        """
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._finish()
+
+    def _finish(self):
+        future = self._future
+        self._future = None
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def jam_sync(self, timecode, at_ns=None):
+        """sets the clock to the given timecode, the clock continues counting
+        from it
+
+        :param timecode: A :class:`.Timecode`, a timecode string or an
+          integer frame count.
+        :param int at_ns: The clock time when the clock showed the given
+          timecode, defaults to now. Give it to sync to a timecode which was
+          read earlier, like from an LTC input.
+        """
+        self._origin_frames = to_frames(self.rate, timecode)
+        self._origin_ns = self.clock() if at_ns is None else at_ns
+        self._index = -1
+        if self._waiter is not None:
+            # the next tick may be earlier than the one the clock waits for
+            _wake(self._waiter)
+
+    def add_callback(self, callback):
+        """adds a function to be called with every :class:`.ClockTick`
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        self._callbacks.remove(callback)
+
+    async def next_tick(self):
+        """waits for the next tick and returns it as a :class:`.ClockTick`,
+        or None if the clock is stopped, it can be called before the clock is
+        started
+        """
+        if self._stopped:
+            return None
+        result = await asyncio.shield(self._next_future())
+        return result and result[0]
+
+    def _next_future(self):
+        future = self._future
+        if future is None:
+            future = self._future = asyncio.get_running_loop().create_future()
+        return future
+
+    async def ticks(self):
+        """yields the ticks as :class:`.ClockTick` instances until the clock
+        is stopped
+        """
+        if self._stopped:
+            return
+        future = self._next_future()
+        while True:
+            # cancelling a subscriber should not cancel the shared future
+            result = await asyncio.shield(future)
+            if result is None:
+                return
+            tick, future = result
+            yield tick
+
+    async def _run(self, loop):
+        try:
+            while True:
+                index = self._index + 1
+                due_ns = self._time_of(index)
+                now = self.clock()
+                if due_ns > now:
+                    # wait with a future, so jam_sync can wake the clock
+                    waiter = self._waiter = loop.create_future()
+                    handle = loop.call_later((due_ns - now) / _NS_PER_SECOND,
+                                             _wake, waiter)
+                    try:
+                        await waiter
+                    finally:
+                        handle.cancel()
+                        self._waiter = None
+                    now = self.clock()
+                    if now < self._time_of(self._index + 1):
+                        # woken up early or jam synced to a later time
+                        continue
+                self._tick(now)
+        finally:
+            self._finish()
+
+    def _tick(self, now):
+        expected = self._index + 1
+        index = self._index_at(now)
+        dropped = index - expected
+        self._index = index
+
+        late_ns = now - self._time_of(index)
+        frames = self._frames = self._origin_frames + index
+        tick = ClockTick(frames, self.rate.format_frames(frames), now,
+                         late_ns, dropped)
+
+        self.dropped_ticks += dropped
+        if late_ns > self.tolerance_ns:
+            self.late_ticks += 1
+        if late_ns > self.max_late_ns:
+            self.max_late_ns = late_ns
+
+        future = self._future
+        self._future = future.get_loop().create_future()
+        future.set_result((tick, self._future))
+
+        for callback in list(self._callbacks):
+            try:
+                callback(tick)
+            except Exception as e:
+                # a failing subscriber should not stop the clock
+                future.get_loop().call_exception_handler({
+                    'message': 'TimecodeClock callback failed',
+                    'exception': e,
+                })
+
+    def __repr__(self):
+        return '<TimecodeClock %r at %s>' % (
+            self.framerate, self.rate.format_frames(self._frames)
+        )
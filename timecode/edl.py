@@ -0,0 +1,269 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from .timecode import Timecode, TimecodeError
+
+
+#: The frame rates to use for the "FCM: DROP FRAME" header
+DROP_FRAME_RATES = {
+    '29.97': '29.97',
+    '30': '29.97',
+    '59.94': '59.94',
+    '60': '59.94',
+}
+
+#: The frame rates to use for the "FCM: NON-DROP FRAME" header. 29.97 and
+#: 59.94 are always drop frame in this library, the non drop frame counting of
+#: them is the same with 30 and 60.
+NON_DROP_FRAME_RATES = {
+    '29.97': '30',
+    '59.94': '60',
+}
+
+
+class EDLEvent(object):
+    """A single event of a CMX3600 EDL.
+
+    The source and record timecodes are held as frames, use the ``*_tc``
+    properties to get them as :class:`.Timecode` instances.
+
+    :param int number: The event number.
+    :param str reel: The reel name.
+    :param str track: The track, like 'V', 'A', 'A2' or 'AA/V'.
+    :param str transition: The transition, like 'C', 'D', 'W001', 'K', or
+      'K B' and 'K O' for the key events with a background or overlay
+      qualifier.
+    :param duration: The duration of the transition in frames or None.
+    :param int src_in: The source in point in frames.
+    :param int src_out: The source out point in frames.
+    :param int rec_in: The record in point in frames.
+    :param int rec_out: The record out point in frames.
+    :param rate: The :class:`.FrameRate` of the timecodes.
+    :param comments: The lines following the event line, like the
+      "* FROM CLIP NAME:" comments or the "M2" motion effects.
+    """
+
+    __slots__ = ('number', 'reel', 'track', 'transition', 'duration',
+                 'src_in', 'src_out', 'rec_in', 'rec_out', 'rate', 'comments')
+
+    def __init__(self, number, reel, track, transition, duration, src_in,
+                 src_out, rec_in, rec_out, rate, comments=None):
+        self.number = number
+        self.reel = reel
+        self.track = track
+        self.transition = transition
+        self.duration = duration
+        self.src_in = src_in
+        self.src_out = src_out
+        self.rec_in = rec_in
+        self.rec_out = rec_out
+        self.rate = Timecode._validate_framerate(rate)
+        self.comments = comments if comments is not None else []
+
+    @property
+    def src_in_tc(self):
+        return Timecode(self.rate, frames=self.src_in)
+
+    @property
+    def src_out_tc(self):
+        return Timecode(self.rate, frames=self.src_out)
+
+    @property
+    def rec_in_tc(self):
+        return Timecode(self.rate, frames=self.rec_in)
+
+    @property
+    def rec_out_tc(self):
+        return Timecode(self.rate, frames=self.rec_out)
+
+    def __repr__(self):
+        rate = self.rate
+        return '<EDLEvent %03d %s %s %s %s %s %s>' % (
+            self.number, self.reel, self.track,
+            rate.format_frames(self.src_in), rate.format_frames(self.src_out),
+            rate.format_frames(self.rec_in), rate.format_frames(self.rec_out)
+        )
+
+
+class EDLReader(object):
+    """Reads the events of a CMX3600 EDL one by one.
+
+    Iterating over the reader yields :class:`.EDLEvent` instances while
+    reading the file, only the event that is being read is kept in memory.
+
+    The "FCM: DROP FRAME" and "FCM: NON-DROP FRAME" lines switch the frame rate
+    of the following events between the drop frame and non drop frame versions
+    of the given frame rate, like between '29.97' and '30'.
+
+    :param fileobj: A file object or any iterable of lines.
+    :param str framerate: The frame rate of the EDL.
+    """
+
+    def __init__(self, fileobj, framerate):
+        self.fileobj = fileobj
+        self.rate = Timecode._validate_framerate(framerate)
+        self.title = None
+        self.drop_frame = None
+
+    def _set_fcm(self, value):
+        """sets the frame rate by using the given FCM value
+        """
+        value = value.upper()
+        if value.startswith('DROP'):
+            self.drop_frame = True
+            rates = DROP_FRAME_RATES
+        elif value.startswith('NON'):
+            self.drop_frame = False
+            rates = NON_DROP_FRAME_RATES
+        else:
+            raise TimecodeError('Unknown FCM value. %s' % value)
+
+        framerate = self.rate.framerate
+        framerate = rates.get(str(framerate), framerate)
+        self.rate = Timecode._validate_framerate(framerate)
+
+    def _parse_event(self, fields):
+        """creates an EDLEvent from the whitespace separated fields of an
+        event line
+        """
+        rate = self.rate
+        fields_to_frames = rate.fields_to_frames
+        parse_timecode = Timecode.parse_timecode
+        src_in, src_out, rec_in, rec_out = [
+            fields_to_frames(*parse_timecode(tc)) for tc in fields[-4:]
+        ]
+        transition = fields[3]
+        rest = fields[4:-4]
+        # key events have a B (background) or O (overlay) qualifier
+        if transition.upper() == 'K' and rest and \
+                rest[0].upper() in ('B', 'O'):
+            transition = '%s %s' % (transition, rest.pop(0))
+        if len(rest) > 1:
+            raise ValueError('Too many fields.')
+        duration = int(rest[0]) if rest else None
+        return EDLEvent(int(fields[0]), fields[1], fields[2], transition,
+                        duration, src_in, src_out, rec_in, rec_out, rate)
+
+    def __iter__(self):
+        event = None
+        for line in self.fileobj:
+            if isinstance(line, bytes):
+                line = line.decode('ascii', 'replace')
+            line = line.strip()
+            if not line:
+                continue
+
+            fields = line.split()
+            if fields[0].isdigit() and len(fields) in (8, 9, 10):
+                if event is not None:
+                    yield event
+                try:
+                    event = self._parse_event(fields)
+                except (ValueError, IndexError):
+                    raise TimecodeError('EDL event parsing error. %s' % line)
+            elif line.upper().startswith('TITLE:'):
+                self.title = line[6:].strip()
+            elif line.upper().startswith('FCM:'):
+                self._set_fcm(line[4:].strip())
+            elif event is not None:
+                event.comments.append(line)
+
+        if event is not None:
+            yield event
+
+
+class EDLWriter(object):
+    """Writes CMX3600 EDLs.
+
+    The timecodes are formatted with the :class:`.FrameRate` of the writer,
+    the frame rates of the written events are not validated again.
+
+    :param fileobj: A file object opened in text mode.
+    :param str framerate: The frame rate of the EDL.
+    :param str title: The title of the EDL, the TITLE line is skipped if it is
+      None.
+    :param str separator: The separator before the frames field of the
+      timecodes, use ';' for the drop frame notation.
+    """
+
+    def __init__(self, fileobj, framerate, title=None, separator=':'):
+        self.fileobj = fileobj
+        self.rate = Timecode._validate_framerate(framerate)
+        self.separator = separator
+        self._header_written = False
+        self.title = title
+
+    def write_header(self):
+        """writes the TITLE and FCM lines, it is called automatically before
+        the first event is written
+        """
+        lines = []
+        if self.title is not None:
+            lines.append('TITLE: %s\n' % self.title)
+        if self.rate.drop_frame:
+            lines.append('FCM: DROP FRAME\n')
+        else:
+            lines.append('FCM: NON-DROP FRAME\n')
+        lines.append('\n')
+        self.fileobj.write(''.join(lines))
+        self._header_written = True
+
+    def write_event(self, event):
+        """writes the given event
+
+        :param event: An :class:`.EDLEvent` whose frames are in the frame rate
+          of this writer.
+        """
+        if not self._header_written:
+            self.write_header()
+
+        format_frames = self.rate.format_frames
+        separator = self.separator
+        if event.duration is None:
+            duration = ''
+        else:
+            duration = '%03d' % event.duration
+
+        line = '%03d  %-8s %-5s %-4s %3s %s %s %s %s\n' % (
+            event.number, event.reel, event.track, event.transition,
+            duration,
+            format_frames(event.src_in, separator),
+            format_frames(event.src_out, separator),
+            format_frames(event.rec_in, separator),
+            format_frames(event.rec_out, separator),
+        )
+        if event.comments:
+            line += '\n'.join(event.comments) + '\n'
+        self.fileobj.write(line)
+
+    def write(self, events):
+        """writes all the given events
+        """
+        for event in events:
+            self.write_event(event)
+
+
+def read_edl(fileobj, framerate):
+    """yields the events of the given CMX3600 EDL, see :class:`.EDLReader`
+    """
+    return iter(EDLReader(fileobj, framerate))
@@ -0,0 +1,220 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+
+from .timecode import Timecode, TimecodeError
+
+
+#: The number of timecodes :func:`.write_timecodes_fd` formats for each
+#: ``write`` call.
+FD_CHUNK_FRAMES = 16384
+
+
+def _blocks(start, count):
+    """yields the timecodes starting from the given Timecode as
+    (hrs, mins, secs, first_frs, last_frs) blocks, each block is within a
+    single second
+
+    The hours, minutes, seconds and frames are counted up one by one the same
+    way a timecode generator counts, skipping the dropped frame numbers and
+    rolling over at 24 hours, instead of converting every frame.
+    """
+    rate = start._rate
+    ifps = rate.int_framerate
+    drop_frames = rate.drop_frames if rate.drop_frame else 0
+    frames_per_24_hours = rate.frames_per_24_hours
+
+    hrs, mins, secs, frs = rate.frames_to_tc(start.frames)
+    # frames left before the clock rolls over
+    until_rollover = frames_per_24_hours - \
+        (start.frames - 1) % frames_per_24_hours
+
+    while count is None or count > 0:
+        size = min(ifps - frs, until_rollover)
+        if count is not None:
+            size = min(size, count)
+            count -= size
+
+        yield hrs, mins, secs, frs, frs + size
+        frs += size
+        until_rollover -= size
+
+        if not until_rollover:
+            hrs = mins = secs = frs = 0
+            until_rollover = frames_per_24_hours
+        elif frs == ifps:
+            frs = 0
+            secs += 1
+            if secs == 60:
+                secs = 0
+                mins += 1
+                if mins == 60:
+                    mins = 0
+                    hrs += 1
+                if drop_frames and mins % 10:
+                    frs = drop_frames
+
+
+def iter_timecodes(start, count=None, separator=':'):
+    """yields the string representations of the consecutive timecodes
+    starting from the given timecode
+
+    Gives the same result with calling :meth:`.Timecode.__repr__` for every
+    frame, but the timecode is only converted once and the strings are built
+    from cached parts.
+
+    :param start: The first :class:`.Timecode`.
+    :param int count: The number of timecodes, leave it None to generate
+      timecodes forever.
+    :param str separator: The separator before the frames field, use ';' for
+      the drop frame notation.
+    """
+    frame_strings = ['%02d' % frs for frs in range(start.int_framerate)]
+
+    for hrs, mins, secs, first, last in _blocks(start, count):
+        prefix = '%02d:%02d:%02d%s' % (hrs, mins, secs, separator)
+        for frs in frame_strings[first:last]:
+            yield prefix + frs
+
+
+def write_timecodes(fileobj, start, count, separator=':', terminator='\n'):
+    """writes the consecutive timecodes starting from the given timecode to
+    the given file object, one timecode per line
+
+    The timecodes of each second are written with a single ``write`` call.
+
+    :param fileobj: Any object with a ``write`` method accepting strings.
+    :param start: The first :class:`.Timecode`.
+    :param int count: The number of timecodes.
+    :param str separator: The separator before the frames field.
+    :param str terminator: The string written after every timecode.
+    """
+    frame_strings = ['%02d%s' % (frs, terminator)
+                     for frs in range(start.int_framerate)]
+    write = fileobj.write
+
+    for hrs, mins, secs, first, last in _blocks(start, count):
+        prefix = '%02d:%02d:%02d%s' % (hrs, mins, secs, separator)
+        write(prefix + prefix.join(frame_strings[first:last]))
+
+
+def _frame_digits(rate):
+    """returns the number of digits of the frames field in the fixed width
+    form, 2 or 3 for 'ms'
+    """
+    return max(2, len(str(rate.int_framerate - 1)))
+
+
+def record_width(framerate, separator=':', terminator='\n'):
+    """returns the number of bytes of a timecode written by
+    :func:`.export_timecodes`, including the separator and the terminator
+    """
+    rate = Timecode._validate_framerate(framerate)
+    return 8 + len(separator) + _frame_digits(rate) + len(terminator)
+
+
+def export_timecodes(buffer, start, count, separator=':', terminator='\n',
+                     offset=0):
+    """writes the consecutive timecodes starting from the given timecode to
+    the given buffer as fixed width ASCII records
+
+    Every record is the hours, minutes and seconds, the separator, the frames
+    and the terminator, see :func:`.record_width`. The frames have 2 digits,
+    3 for the 'ms' frame rate, otherwise the records are the same with
+    :meth:`.Timecode.__repr__`. The timecodes are counted up like
+    :func:`.iter_timecodes` does and each second is copied to the buffer with
+    a single slice assignment.
+
+    :param buffer: A writable ``bytearray``, ``memoryview``, ``mmap`` or any
+      other object supporting the buffer protocol.
+    :param start: The first :class:`.Timecode`.
+    :param int count: The number of timecodes.
+    :param str separator: The separator before the frames field, use ';' for
+      the drop frame notation.
+    :param str terminator: The string written after every timecode.
+    :param int offset: The byte offset in the buffer of the first record.
+    :returns int: The number of bytes written.
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        raise TimecodeError('The buffer should be writable.')
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+
+    width = record_width(start._rate, separator, terminator)
+    size = width * count
+    if offset < 0 or offset + size > len(view):
+        raise TimecodeError(
+            'The buffer is too small for %s timecodes of %s bytes at offset '
+            '%s.' % (count, width, offset)
+        )
+
+    separator = separator.encode('ascii')
+    frame_format = '%%0%dd%s' % (_frame_digits(start._rate), terminator)
+    frame_bytes = [(frame_format % frs).encode('ascii')
+                   for frs in range(start.int_framerate)]
+
+    position = offset
+    for hrs, mins, secs, first, last in _blocks(start, count):
+        prefix = b'%02d:%02d:%02d%s' % (hrs, mins, secs, separator)
+        chunk = prefix + prefix.join(frame_bytes[first:last])
+        end = position + len(chunk)
+        view[position:end] = chunk
+        position = end
+    return size
+
+
+def write_timecodes_fd(fd, start, count, separator=':', terminator='\n',
+                       chunk_frames=None):
+    """writes the consecutive timecodes starting from the given timecode to
+    the given file descriptor as fixed width ASCII records, see
+    :func:`.export_timecodes`
+
+    The records are formatted into a single reused buffer of
+    ``chunk_frames`` records, which is written with one ``os.write`` call,
+    or more if the descriptor takes only a part of it, like a full pipe.
+
+    :param int fd: The file descriptor, like ``pipe.fileno()``.
+    :param int chunk_frames: The number of records per write, defaults to
+      :data:`FD_CHUNK_FRAMES`.
+    :returns int: The number of bytes written.
+    """
+    rate = start._rate
+    if chunk_frames is None:
+        chunk_frames = FD_CHUNK_FRAMES
+    width = record_width(rate, separator, terminator)
+    buffer = bytearray(width * min(chunk_frames, count))
+    view = memoryview(buffer)
+    frames = start.frames
+    written = 0
+    while written < count:
+        size = export_timecodes(
+            buffer, Timecode(rate, frames=frames + written),
+            min(chunk_frames, count - written), separator, terminator
+        )
+        position = 0
+        while position < size:
+            position += os.write(fd, view[position:size])
+        written += size // width
+    return written * width
@@ -0,0 +1,336 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from collections import namedtuple
+
+from .ranges import to_frames
+from .timecode import Timecode, TimecodeError
+
+
+#: An interval of an :class:`.IntervalIndex`, ``start`` and ``end`` are
+#: frames and the ``end`` is not included in the interval.
+Interval = namedtuple('Interval', ['start', 'end', 'data'])
+
+
+class _Node(object):
+    """a node of the AVL tree of an IntervalIndex
+    """
+
+    __slots__ = ('start', 'end', 'data', 'key', 'left', 'right', 'height',
+                 'max_end')
+
+    def __init__(self, start, end, data, seq):
+        self.start = start
+        self.end = end
+        self.data = data
+        self.key = (start, end, seq)
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.max_end = end
+
+
+def _update(node):
+    """updates the height and the max_end of the given node from its children
+    """
+    left = node.left
+    right = node.right
+    max_end = node.end
+    height = 0
+    if left is not None:
+        height = left.height
+        if left.max_end > max_end:
+            max_end = left.max_end
+    if right is not None:
+        if right.height > height:
+            height = right.height
+        if right.max_end > max_end:
+            max_end = right.max_end
+    node.height = height + 1
+    node.max_end = max_end
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _rotate_right(node):
+    left = node.left
+    node.left = left.right
+    left.right = node
+    _update(node)
+    _update(left)
+    return left
+
+
+def _rotate_left(node):
+    right = node.right
+    node.right = right.left
+    right.left = node
+    _update(node)
+    _update(right)
+    return right
+
+
+def _balance(node):
+    """rebalances the subtree of the given node and returns its new root
+    """
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    elif balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node, new_node):
+    if node is None:
+        return new_node
+    if new_node.key < node.key:
+        node.left = _insert(node.left, new_node)
+    else:
+        node.right = _insert(node.right, new_node)
+    return _balance(node)
+
+
+def _remove_min(node):
+    """removes the leftmost node of the subtree and returns the new root
+    """
+    if node.left is None:
+        return node.right
+    node.left = _remove_min(node.left)
+    return _balance(node)
+
+
+def _remove(node, key):
+    if node is None:
+        return None
+    if key < node.key:
+        node.left = _remove(node.left, key)
+    elif key > node.key:
+        node.right = _remove(node.right, key)
+    else:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        successor = node.right
+        while successor.left is not None:
+            successor = successor.left
+        successor.right = _remove_min(node.right)
+        successor.left = node.left
+        node = successor
+    return _balance(node)
+
+
+def _build(nodes, first, last):
+    """builds a balanced tree from the sorted nodes between the given indices
+    """
+    if first > last:
+        return None
+    middle = (first + last) // 2
+    node = nodes[middle]
+    node.left = _build(nodes, first, middle - 1)
+    node.right = _build(nodes, middle + 1, last)
+    _update(node)
+    return node
+
+
+class IntervalIndex(object):
+    """An index of frame intervals answering which intervals cover a
+    timecode or overlap a range of timecodes.
+
+    The intervals are kept in a balanced binary tree ordered by their start
+    frames, where each node also holds the largest end frame of its subtree.
+    Queries skip the subtrees that can not overlap, so a query finding k
+    intervals takes O((k + 1) log n) time, and inserting or removing an
+    interval takes O(log n) time.
+
+    The intervals are half open, the ``end`` frame is not included, the same
+    with the out points of an EDL. All the timecodes are converted to frames
+    with the frame rate of the index, so drop frame timecodes are handled
+    correctly.
+
+    :param str framerate: The frame rate of the timecodes.
+    :param intervals: An optional iterable of (start, end, data) tuples to
+      fill the index with. The start and end can be :class:`.Timecode`
+      instances, timecode strings or integer frames.
+    """
+
+    def __init__(self, framerate, intervals=None):
+        self.rate = Timecode._validate_framerate(framerate)
+        self._root = None
+        self._size = 0
+        self._seq = 0
+        if intervals is not None:
+            self._bulk_load(sorted(
+                (self._to_interval(*interval) for interval in intervals),
+                key=lambda interval: interval[:2]
+            ))
+
+    @classmethod
+    def from_sorted(cls, framerate, intervals):
+        """creates an IntervalIndex from intervals which are already sorted by
+        their start and end frames, it takes O(n) time
+
+        :raises TimecodeError: If the intervals are not sorted.
+        """
+        index = cls(framerate)
+        converted = [index._to_interval(*interval) for interval in intervals]
+        for i in range(1, len(converted)):
+            if converted[i][:2] < converted[i - 1][:2]:
+                raise TimecodeError('The intervals are not sorted.')
+        index._bulk_load(converted)
+        return index
+
+    @property
+    def framerate(self):
+        return self.rate.framerate
+
+    def _to_interval(self, start, end, data=None):
+        """converts the given start and end to frames
+        """
+        start = to_frames(self.rate, start)
+        end = to_frames(self.rate, end)
+        if end < start:
+            raise TimecodeError(
+                'The end of an interval can not be before its start.'
+            )
+        return start, end, data
+
+    def _bulk_load(self, intervals):
+        nodes = []
+        for seq, (start, end, data) in enumerate(intervals):
+            nodes.append(_Node(start, end, data, seq))
+        self._root = _build(nodes, 0, len(nodes) - 1)
+        self._size = len(nodes)
+        self._seq = len(nodes)
+
+    def add(self, start, end, data=None):
+        """adds an interval to the index
+
+        :param start: The start of the interval, a :class:`.Timecode`, a
+          timecode string or an integer frame count.
+        :param end: The end of the interval, it is not included in the
+          interval.
+        :param data: Any data to be returned with the interval, like a clip or
+          an EDL event.
+        """
+        start, end, data = self._to_interval(start, end, data)
+        self._root = _insert(self._root, _Node(start, end, data, self._seq))
+        self._seq += 1
+        self._size += 1
+
+    def remove(self, start, end, data=None):
+        """removes an interval from the index
+
+        :raises KeyError: If there is no such interval in the index.
+        """
+        start, end, data = self._to_interval(start, end, data)
+        node = self._find(self._root, (start, end), data)
+        if node is None:
+            raise KeyError(Interval(start, end, data))
+        self._root = _remove(self._root, node.key)
+        self._size -= 1
+
+    def _find(self, node, start_end, data):
+        """finds the node with the given start, end and data, the nodes with
+        the same start and end can be on both sides of each other
+        """
+        while node is not None:
+            key = node.key[:2]
+            if start_end < key:
+                node = node.left
+            elif start_end > key:
+                node = node.right
+            else:
+                if node.data == data:
+                    return node
+                return self._find(node.left, start_end, data) or \
+                    self._find(node.right, start_end, data)
+        return None
+
+    def at(self, timecode):
+        """returns the intervals covering the given timecode
+
+        :param timecode: A :class:`.Timecode`, a timecode string or an
+          integer frame count.
+        :returns: a list of :class:`.Interval` instances sorted by their start
+        """
+        frames = to_frames(self.rate, timecode)
+        return self._query(frames, frames + 1)
+
+    def overlapping(self, start, end):
+        """returns the intervals overlapping the given range, the ``end`` is
+        not included in the range
+
+        :returns: a list of :class:`.Interval` instances sorted by their start
+        """
+        return self._query(to_frames(self.rate, start),
+                           to_frames(self.rate, end))
+
+    def _query(self, start, end):
+        result = []
+        append = result.append
+        stack = []
+        node = self._root
+        # in order traversal, skipping the subtrees that end before the range
+        # and the ones that start after it
+        while stack or node is not None:
+            if node is not None and node.max_end > start:
+                stack.append(node)
+                node = node.left
+                continue
+            if not stack:
+                break
+            node = stack.pop()
+            if node.start >= end:
+                break
+            if node.end > start:
+                append(Interval(node.start, node.end, node.data))
+            node = node.right
+        return result
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+                continue
+            node = stack.pop()
+            yield Interval(node.start, node.end, node.data)
+            node = node.right
+
+    def __repr__(self):
+        return '<IntervalIndex %r with %s intervals>' % (self.framerate,
+                                                         self._size)
@@ -0,0 +1,472 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from array import array
+from collections import deque, namedtuple
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from .timecode import Timecode, TimecodeError
+
+
+#: A frame decoded by :class:`.LTCDecoder`. ``user_bits`` holds the eight
+#: binary groups as a 32 bit integer, the first group in the lowest four
+#: bits, and ``sample`` is the position of the first sample of the frame in
+#: the decoded stream.
+LTCFrame = namedtuple('LTCFrame', ['hrs', 'mins', 'secs', 'frs', 'drop_frame',
+                                   'color_frame', 'user_bits', 'sample'])
+
+#: The number of bits in an LTC frame.
+FRAME_BITS = 80
+
+#: The last 16 bits of every frame, in the order they are sent.
+SYNC_WORD = 0x3FFD
+
+#: The samples processed at once by the numpy decoder, it limits the memory
+#: used for the temporary arrays.
+CHUNK_SIZE = 1 << 20
+
+_SAMPLE_TYPES = {
+    # typecode, full scale
+    'int16': ('h', 32767),
+    'float32': ('f', 1.0),
+}
+
+# the (first bit, bit count) of the fields
+_FRS_UNITS = (0, 4)
+_FRS_TENS = (8, 2)
+_SECS_UNITS = (16, 4)
+_SECS_TENS = (24, 3)
+_MINS_UNITS = (32, 4)
+_MINS_TENS = (40, 3)
+_HRS_UNITS = (48, 4)
+_HRS_TENS = (56, 2)
+_USER_BITS = (4, 12, 20, 28, 36, 44, 52, 60)
+_DROP_FRAME_BIT = 10
+_COLOR_FRAME_BIT = 11
+
+
+def _validate_rate(framerate):
+    """returns the FrameRate of the given frame rate, LTC can only carry the
+    frame rates up to 30 frames per second
+    """
+    rate = Timecode._validate_framerate(framerate)
+    if rate.framerate in ('frames', 1000) or rate.int_framerate > 30:
+        raise TimecodeError(
+            'LTC does not support the %r frame rate.' % rate.framerate
+        )
+    return rate
+
+
+def _polarity_bit(rate):
+    """returns the bit which keeps the number of zeros in a frame even, it is
+    bit 59 for 25 frames per second and bit 27 for the others
+    """
+    return 59 if rate.int_framerate == 25 else 27
+
+
+def _validate_sample_type(sample_type):
+    if sample_type not in _SAMPLE_TYPES:
+        raise TimecodeError(
+            'Unknown sample type %r, should be one of %s.' %
+            (sample_type, ', '.join(sorted(_SAMPLE_TYPES)))
+        )
+    return _SAMPLE_TYPES[sample_type]
+
+
+class LTCEncoder(object):
+    """Encodes timecodes to linear timecode (LTC) audio.
+
+    Every timecode is encoded as an 80 bit SMPTE 12M frame with biphase mark
+    coding: the signal changes its level at the start of every bit and also
+    in the middle of the bits which are 1. The bit boundaries are calculated
+    from the start of the stream with the exact frame rate, so the frames of
+    '29.97' take exactly 48000 * 1001 / 30000 samples on average at 48 kHz and
+    the signal does not drift. The signal is a square wave, without the
+    filtering of the rise time.
+
+    Consecutive calls continue the same signal, so the audio can be generated
+    in chunks.
+
+    :param str framerate: The frame rate of the timecodes, up to 30 frames
+      per second.
+    :param int sample_rate: The sample rate of the audio.
+    :param float amplitude: The level of the signal, 1.0 is full scale.
+    :param str sample_type: 'int16' or 'float32'.
+    """
+
+    def __init__(self, framerate, sample_rate=48000, amplitude=0.5,
+                 sample_type='int16'):
+        self.rate = _validate_rate(framerate)
+        self.sample_rate = sample_rate
+        self.sample_type = sample_type
+        typecode, full_scale = _validate_sample_type(sample_type)
+        self._typecode = typecode
+        level = amplitude * full_scale
+        if typecode == 'h':
+            level = int(round(level))
+        self._levels = (array(typecode, [level]), array(typecode, [-level]))
+        self._polarity_bit = _polarity_bit(self.rate)
+
+        rational = self.rate.rational
+        # the position of a half bit is half * _half_num // _half_den
+        self._half_num = sample_rate * rational.denominator
+        self._half_den = 2 * FRAME_BITS * rational.numerator
+        # the number of the encoded half bits and the current level
+        self._half = 0
+        self._level = 0
+
+    def frame_bits(self, hrs, mins, secs, frs, user_bits=0,
+                   color_frame=False):
+        """returns the 80 bits of an LTC frame as a list in the order they
+        are sent
+        """
+        bits = [0] * FRAME_BITS
+
+        def put(value, field):
+            first, count = field
+            for i in range(count):
+                bits[first + i] = (value >> i) & 1
+
+        put(frs % 10, _FRS_UNITS)
+        put(frs // 10, _FRS_TENS)
+        put(secs % 10, _SECS_UNITS)
+        put(secs // 10, _SECS_TENS)
+        put(mins % 10, _MINS_UNITS)
+        put(mins // 10, _MINS_TENS)
+        put(hrs % 10, _HRS_UNITS)
+        put(hrs // 10, _HRS_TENS)
+        for i, first in enumerate(_USER_BITS):
+            put(user_bits >> (4 * i), (first, 4))
+        bits[_DROP_FRAME_BIT] = int(self.rate.drop_frame)
+        bits[_COLOR_FRAME_BIT] = int(bool(color_frame))
+        put(SYNC_WORD, (64, 16))
+        # the sync word is sent from its highest bit
+        bits[64:] = bits[64:][::-1]
+
+        # an even number of zeros keeps the polarity of every frame the same
+        if bits.count(0) % 2:
+            bits[self._polarity_bit] = 1
+        return bits
+
+    def encode(self, timecode, user_bits=0, color_frame=False):
+        """returns the samples of a single frame
+
+        :param timecode: The :class:`.Timecode` to encode, its frame rate
+          should be the same with the encoder.
+        :param int user_bits: The eight binary groups as a 32 bit integer, the
+          first group in the lowest four bits.
+        :param bool color_frame: The color frame flag.
+        :returns: An ``array('h')`` for int16 or an ``array('f')`` for float32
+          samples.
+        """
+        hrs, mins, secs, frs = self.rate.frames_to_tc(timecode.frames)
+        return self._encode_bits(
+            self.frame_bits(hrs, mins, secs, frs, user_bits, color_frame)
+        )
+
+    def encode_many(self, start, count, user_bits=0):
+        """returns the samples of the consecutive frames starting from the
+        given timecode
+        """
+        frames_to_tc = self.rate.frames_to_tc
+        frame_bits = self.frame_bits
+        samples = array(self._typecode)
+        for frames in range(start.frames, start.frames + count):
+            hrs, mins, secs, frs = frames_to_tc(frames)
+            samples += self._encode_bits(
+                frame_bits(hrs, mins, secs, frs, user_bits)
+            )
+        return samples
+
+    def _encode_bits(self, bits):
+        half_num = self._half_num
+        half_den = self._half_den
+        levels = self._levels
+        level = self._level
+        half = self._half
+        position = half * half_num // half_den
+        samples = array(self._typecode)
+        for bit in bits:
+            # the level changes at the start of every bit
+            level ^= 1
+            middle = (half + 1) * half_num // half_den
+            end = (half + 2) * half_num // half_den
+            if bit:
+                samples += levels[level] * (middle - position)
+                level ^= 1
+                samples += levels[level] * (end - middle)
+            else:
+                samples += levels[level] * (end - position)
+            position = end
+            half += 2
+        self._level = level
+        self._half = half
+        return samples
+
+
+class LTCDecoder(object):
+    """Decodes linear timecode (LTC) audio.
+
+    The audio is given in chunks of any size with :meth:`.decode`, and the
+    frames are returned as soon as they are complete, so a stream can be
+    decoded as it is captured. Only a few values are kept between the chunks.
+
+    The level changes of the signal are found with a hysteresis around zero,
+    so small noise does not add false level changes. The intervals between
+    them are classified as half or whole bits by comparing them to the bit
+    length, which starts from the one of the frame rate and follows the
+    actual speed of the signal. A frame is returned when its sync word is
+    found, the frames played backwards are not decoded.
+
+    When numpy is installed the level changes are found with whole array
+    operations, otherwise the samples are read one by one.
+
+    :param str framerate: The frame rate of the timecode.
+    :param int sample_rate: The sample rate of the audio.
+    :param str sample_type: 'int16' or 'float32', the type of the samples
+      given as ``bytes`` or other buffers. numpy arrays and ``array``
+      instances use their own types.
+    :param float threshold: The hysteresis of the level changes relative to
+      full scale.
+    """
+
+    def __init__(self, framerate, sample_rate=48000, sample_type='int16',
+                 threshold=0.02):
+        self.rate = _validate_rate(framerate)
+        self.sample_rate = sample_rate
+        self.sample_type = sample_type
+        self._typecode = _validate_sample_type(sample_type)[0]
+        self.threshold = threshold
+
+        rational = self.rate.rational
+        self._nominal_bit = float(sample_rate * rational.denominator) / \
+            (FRAME_BITS * rational.numerator)
+        self.reset()
+
+    def reset(self):
+        """drops the partially decoded frame and starts from the beginning of
+        a new stream
+        """
+        # the position of the next sample in the stream
+        self._position = 0
+        # the signal level, None until it passes the threshold
+        self._state = None
+        self._last_edge = None
+        self._bit_length = self._nominal_bit
+        # waiting for the second half of a 1 bit
+        self._half = False
+        self._cell_start = 0
+        self._register = 0
+        self._count = 0
+        self._starts = deque(maxlen=FRAME_BITS)
+
+    def to_timecode(self, frame):
+        """returns the given :class:`.LTCFrame` as a :class:`.Timecode`
+        """
+        return Timecode(self.rate, frames=self.rate.fields_to_frames(
+            frame.hrs, frame.mins, frame.secs, frame.frs
+        ))
+
+    def decode(self, samples):
+        """decodes the given chunk of samples
+
+        :param samples: int16 or float32 samples in a numpy array, an
+          ``array('h')``, an ``array('f')`` or any buffer.
+        :returns: a list of the :class:`.LTCFrame` instances completed in this
+          chunk
+        """
+        samples, full_scale = self._to_samples(samples)
+        threshold = self.threshold * full_scale
+        frames = []
+        if numpy is not None:
+            for start in range(0, len(samples), CHUNK_SIZE):
+                chunk = samples[start:start + CHUNK_SIZE]
+                self._decode_edges(self._find_edges_numpy(chunk, threshold),
+                                   frames)
+                self._position += len(chunk)
+        else:
+            self._decode_edges(self._find_edges(samples, threshold), frames)
+            self._position += len(samples)
+        return frames
+
+    def flush(self):
+        """decodes the last bit of the stream, which has no level change after
+        it, and resets the decoder
+
+        :returns: a list of the :class:`.LTCFrame` instances completed
+        """
+        frames = []
+        if self._last_edge is not None:
+            # close the last bit a bit length after it started, the stream
+            # may end with silence
+            self._decode_edges(
+                [self._cell_start + int(round(self._bit_length))], frames
+            )
+        self.reset()
+        return frames
+
+    def _to_samples(self, samples):
+        """returns the samples as a numpy array, an array or a memoryview
+        together with their full scale
+        """
+        if numpy is not None and isinstance(samples, numpy.ndarray):
+            if samples.dtype.kind == 'f':
+                return samples, 1.0
+            return samples, float(numpy.iinfo(samples.dtype).max)
+        if isinstance(samples, array):
+            typecode = samples.typecode
+        else:
+            typecode = self._typecode
+            samples = memoryview(samples).cast('B').cast(typecode)
+        full_scale = 1.0 if typecode in 'fd' else \
+            float(2 ** (8 * array(typecode).itemsize - 1) - 1)
+        if numpy is not None:
+            samples = numpy.frombuffer(samples, dtype=typecode)
+        return samples, full_scale
+
+    def _find_edges_numpy(self, samples, threshold):
+        """returns the positions of the level changes in the chunk"""
+        high = samples > threshold
+        defined = high | (samples < -threshold)
+        # carry the last defined level forward over the samples within the
+        # hysteresis
+        index = numpy.where(defined, numpy.arange(len(samples)), -1)
+        numpy.maximum.accumulate(index, out=index)
+        state = self._state
+        first = 0
+        if state is None:
+            # the signal starting from silence is the first level change
+            defined_at = numpy.flatnonzero(defined)
+            if not len(defined_at):
+                return []
+            first = defined_at[0]
+            state = not high[first]
+        levels = numpy.where(index >= 0, high[numpy.maximum(index, 0)], state)
+        edges = numpy.flatnonzero(levels[1:] != levels[:-1]) + 1
+        if first == 0 and levels[0] != state:
+            # the diff only finds the level changes after the first sample
+            edges = numpy.concatenate(([0], edges))
+        self._state = bool(levels[-1])
+        return (edges + self._position).tolist()
+
+    def _find_edges(self, samples, threshold):
+        """yields the positions of the level changes in the chunk"""
+        state = self._state
+        position = self._position
+        for i, sample in enumerate(samples):
+            if sample > threshold:
+                level = True
+            elif sample < -threshold:
+                level = False
+            else:
+                continue
+            if level != state:
+                # the signal starting from silence is the first level change
+                yield position + i
+                state = level
+        self._state = state
+
+    def _decode_edges(self, edges, frames):
+        last_edge = self._last_edge
+        bit_length = self._bit_length
+        half = self._half
+        cell_start = self._cell_start
+        register = self._register
+        count = self._count
+        starts = self._starts
+
+        for edge in edges:
+            if last_edge is None:
+                last_edge = cell_start = edge
+                continue
+            length = edge - last_edge
+            last_edge = edge
+
+            if length > 1.5 * bit_length:
+                # lost the signal, start again
+                half = False
+                count = 0
+                cell_start = edge
+                continue
+            elif length < 0.75 * bit_length:
+                if not half:
+                    # the first half of a 1 bit
+                    half = True
+                    continue
+                bit = 1
+                half = False
+            else:
+                if half:
+                    # the previous half bit was the end of a 1 bit which
+                    # started before the signal was locked
+                    half = False
+                    cell_start = edge - length
+                bit = 0
+
+            # follow the speed of the signal
+            bit_length += (edge - cell_start - bit_length) * 0.125
+            starts.append(cell_start)
+            cell_start = edge
+            register = ((register << 1) | bit) & 0xFFFFFFFFFFFFFFFFFFFF
+            count += 1
+            if count >= FRAME_BITS and register & 0xFFFF == SYNC_WORD:
+                frames.append(self._frame(register, starts[0]))
+                count = 0
+
+        self._last_edge = last_edge
+        self._bit_length = bit_length
+        self._half = half
+        self._cell_start = cell_start
+        self._register = register
+        self._count = count
+
+    @staticmethod
+    def _frame(register, sample):
+        """returns the LTCFrame of the given 80 bits, the first bit of the
+        frame is the highest one
+        """
+        def get(field):
+            first, count = field
+            value = 0
+            for i in range(count):
+                value |= ((register >> (79 - first - i)) & 1) << i
+            return value
+
+        user_bits = 0
+        for i, first in enumerate(_USER_BITS):
+            user_bits |= get((first, 4)) << (4 * i)
+        return LTCFrame(
+            get(_HRS_TENS) * 10 + get(_HRS_UNITS),
+            get(_MINS_TENS) * 10 + get(_MINS_UNITS),
+            get(_SECS_TENS) * 10 + get(_SECS_UNITS),
+            get(_FRS_TENS) * 10 + get(_FRS_UNITS),
+            bool(get((_DROP_FRAME_BIT, 1))),
+            bool(get((_COLOR_FRAME_BIT, 1))),
+            user_bits,
+            sample,
+        )
@@ -0,0 +1,540 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from .formatting import iter_timecodes
+from .timecode import Timecode, TimecodeError
+
+
+def to_frames(rate, value):
+    """returns the frames of the given Timecode, timecode string or integer
+    frame count in the given :class:`.FrameRate`
+
+    :raises TimecodeError: If the Timecode has another frame rate.
+    """
+    if isinstance(value, Timecode):
+        if value._rate is not rate:
+            raise TimecodeError(
+                'Can not use a timecode with a different frame rate, %s '
+                'instead of %s.' % (value.framerate, rate.framerate)
+            )
+        return value.frames
+    elif isinstance(value, str):
+        return rate.fields_to_frames(*Timecode.parse_timecode(value))
+    elif isinstance(value, int):
+        return value
+    raise TimecodeError(
+        'Type %s not supported for timecode ranges.' %
+        value.__class__.__name__
+    )
+
+
+class TimecodeRange(object):
+    """An immutable range of timecodes.
+
+    Works like the builtin ``range`` over the frames of the timecodes, the
+    ``end`` is not included in the range. ``len()``, ``in``, indexing and
+    slicing take constant time and iterating over the range yields the frames
+    as integers without creating any :class:`.Timecode` instances.
+
+    :param start: The first timecode of the range, a :class:`.Timecode`, a
+      timecode string or an integer frame count.
+    :param end: The timecode that ends the range, it is not included.
+    :param str framerate: The frame rate of the timecodes.
+    :param int step: The number of frames between the timecodes.
+    """
+
+    __slots__ = ('rate', '_range')
+
+    def __init__(self, start, end, framerate, step=1):
+        rate = Timecode._validate_framerate(framerate)
+        init = object.__setattr__
+        init(self, 'rate', rate)
+        init(self, '_range', range(to_frames(rate, start),
+                                   to_frames(rate, end), step))
+
+    @classmethod
+    def _from_range(cls, rate, frame_range):
+        """creates a TimecodeRange from a builtin range of frames
+        """
+        tc_range = cls.__new__(cls)
+        object.__setattr__(tc_range, 'rate', rate)
+        object.__setattr__(tc_range, '_range', frame_range)
+        return tc_range
+
+    def __setattr__(self, name, value):
+        raise AttributeError('TimecodeRange instances are immutable.')
+
+    @property
+    def framerate(self):
+        return self.rate.framerate
+
+    @property
+    def start(self):
+        return self._range.start
+
+    @property
+    def stop(self):
+        return self._range.stop
+
+    @property
+    def step(self):
+        return self._range.step
+
+    @property
+    def frames(self):
+        """returns the frames of this range as a builtin range
+        """
+        return self._range
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._from_range(self.rate, self._range[item])
+        return self._range[item]
+
+    def __contains__(self, item):
+        if isinstance(item, Timecode):
+            # raises an error for a different frame rate, like the comparisons
+            return to_frames(self.rate, item) in self._range
+        try:
+            return to_frames(self.rate, item) in self._range
+        except (TimecodeError, ValueError, IndexError):
+            return False
+
+    def __iter__(self):
+        return iter(self._range)
+
+    def __reversed__(self):
+        return reversed(self._range)
+
+    def index(self, item):
+        """returns the index of the given timecode in this range
+        """
+        return self._range.index(to_frames(self.rate, item))
+
+    def count(self, item):
+        """returns 1 if the given timecode is in this range, 0 otherwise
+        """
+        return int(item in self)
+
+    def timecode(self, index):
+        """returns the timecode at the given index as a :class:`.Timecode`
+        """
+        return Timecode(self.rate, frames=self._range[index])
+
+    def timecodes(self):
+        """yields the string representations of the timecodes in this range
+        """
+        if self.step == 1:
+            return iter_timecodes(Timecode(self.rate, frames=self.start),
+                                  len(self))
+        return self._format_each()
+
+    def _format_each(self):
+        format_frames = self.rate.format_frames
+        for frames in self._range:
+            yield format_frames(frames)
+
+    def __eq__(self, other):
+        if isinstance(other, TimecodeRange):
+            return self.rate is other.rate and self._range == other._range
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        return hash((self.rate, self._range))
+
+    def __repr__(self):
+        format_frames = self.rate.format_frames
+        return 'TimecodeRange(%r, %r, %r, step=%s)' % (
+            format_frames(self.start), format_frames(self.stop),
+            self.framerate, self.step
+        )
+
+
+# the coverage codes of the set operations, bit 0 is set inside the first set
+# and bit 1 inside the second one
+_UNION = (False, True, True, True)
+_INTERSECTION = (False, False, False, True)
+_DIFFERENCE = (False, True, False, False)
+_SYMMETRIC_DIFFERENCE = (False, True, True, False)
+
+
+class TimecodeRangeSet(object):
+    """An immutable set of timecodes stored as sorted ranges of frames.
+
+    The ranges are kept normalized, they are sorted and the overlapping or
+    touching ones are merged, so every timecode is covered by at most one
+    range. Like :class:`.TimecodeRange` the ends of the ranges are not
+    included. The starts and the ends are held in two ``array('q')``
+    instances, so even millions of ranges take 16 bytes each.
+
+    The set operations sort the ends of the ranges of both sets and sweep
+    over them once, with whole array operations when numpy is installed.
+    Testing if a timecode is in the set is a binary search.
+
+    :param str framerate: The frame rate of the timecodes.
+    :param ranges: An iterable of :class:`.TimecodeRange` instances with a
+      step of 1 or (start, end) pairs of :class:`.Timecode` instances,
+      timecode strings or integer frame counts. They can be in any order and
+      overlap. Use :meth:`.from_arrays` to load many ranges at once.
+    """
+
+    __slots__ = ('rate', '_starts', '_stops')
+
+    def __init__(self, framerate, ranges=()):
+        rate = Timecode._validate_framerate(framerate)
+        starts = array('q')
+        stops = array('q')
+        for item in ranges:
+            if isinstance(item, TimecodeRange):
+                if item.step != 1:
+                    raise TimecodeError(
+                        'Only the timecode ranges with a step of 1 can be '
+                        'added to a TimecodeRangeSet.'
+                    )
+                starts.append(item.start)
+                stops.append(item.stop)
+            else:
+                start, end = item
+                starts.append(to_frames(rate, start))
+                stops.append(to_frames(rate, end))
+        init = object.__setattr__
+        init(self, 'rate', rate)
+        init(self, '_starts', starts)
+        init(self, '_stops', stops)
+        self._normalize()
+
+    @classmethod
+    def from_arrays(cls, framerate, starts, stops):
+        """creates a TimecodeRangeSet from the start and the end frames of the
+        ranges
+
+        :param starts: A numpy array, an ``array`` or a sequence of the start
+          frames.
+        :param stops: The end frames in the same form, which are not included
+          in the ranges.
+        """
+        if len(starts) != len(stops):
+            raise TimecodeError(
+                'The starts and the stops should have the same length.'
+            )
+        range_set = cls._from_arrays(Timecode._validate_framerate(framerate),
+                                     _to_array(starts), _to_array(stops))
+        range_set._normalize()
+        return range_set
+
+    @classmethod
+    def _from_arrays(cls, rate, starts, stops):
+        """creates a TimecodeRangeSet from normalized array('q') instances
+        """
+        range_set = cls.__new__(cls)
+        init = object.__setattr__
+        init(range_set, 'rate', rate)
+        init(range_set, '_starts', starts)
+        init(range_set, '_stops', stops)
+        return range_set
+
+    def __setattr__(self, name, value):
+        raise AttributeError('TimecodeRangeSet instances are immutable.')
+
+    def _normalize(self):
+        """sorts the ranges and merges the overlapping or touching ones,
+        the empty ranges are removed
+        """
+        starts = self._starts
+        stops = self._stops
+        if numpy is not None and len(starts):
+            start_values = numpy.frombuffer(starts, dtype=numpy.int64)
+            stop_values = numpy.frombuffer(stops, dtype=numpy.int64)
+            keep = start_values < stop_values
+            start_values = start_values[keep]
+            stop_values = stop_values[keep]
+            if len(start_values):
+                order = numpy.argsort(start_values, kind='stable')
+                start_values = start_values[order]
+                ends = numpy.maximum.accumulate(stop_values[order])
+                # a range starts a new group if it starts after all the
+                # previous ranges end
+                first = numpy.ones(len(start_values), dtype=bool)
+                first[1:] = start_values[1:] > ends[:-1]
+                last = numpy.append(first[1:], True)
+                starts = array('q', start_values[first].tobytes())
+                stops = array('q', ends[last].tobytes())
+            else:
+                # all the ranges are empty
+                starts = array('q')
+                stops = array('q')
+        else:
+            new_starts = array('q')
+            new_stops = array('q')
+            for start, stop in sorted(zip(starts, stops)):
+                if start >= stop:
+                    continue
+                if new_stops and start <= new_stops[-1]:
+                    if stop > new_stops[-1]:
+                        new_stops[-1] = stop
+                else:
+                    new_starts.append(start)
+                    new_stops.append(stop)
+            starts, stops = new_starts, new_stops
+        object.__setattr__(self, '_starts', starts)
+        object.__setattr__(self, '_stops', stops)
+
+    @property
+    def framerate(self):
+        return self.rate.framerate
+
+    @property
+    def starts(self):
+        """returns the start frames of the ranges as an ``array('q')``
+        """
+        return self._starts
+
+    @property
+    def stops(self):
+        """returns the end frames of the ranges as an ``array('q')``, they are
+        not included in the ranges
+        """
+        return self._stops
+
+    @property
+    def duration(self):
+        """returns the total number of frames covered by the ranges
+        """
+        if numpy is not None and len(self._starts):
+            return int(numpy.frombuffer(self._stops, dtype=numpy.int64).sum() -
+                       numpy.frombuffer(self._starts, dtype=numpy.int64).sum())
+        return sum(self._stops) - sum(self._starts)
+
+    def __len__(self):
+        """returns the number of ranges
+        """
+        return len(self._starts)
+
+    def __bool__(self):
+        return len(self._starts) > 0
+
+    def __iter__(self):
+        """yields the ranges as :class:`.TimecodeRange` instances
+        """
+        rate = self.rate
+        for start, stop in zip(self._starts, self._stops):
+            yield TimecodeRange._from_range(rate, range(start, stop))
+
+    def intervals(self):
+        """yields the ranges as (start, end) frame pairs
+        """
+        return zip(self._starts, self._stops)
+
+    def __contains__(self, item):
+        if isinstance(item, Timecode):
+            # raises an error for a different frame rate, like the comparisons
+            frames = to_frames(self.rate, item)
+        else:
+            try:
+                frames = to_frames(self.rate, item)
+            except (TimecodeError, ValueError, IndexError):
+                return False
+        index = bisect_right(self._starts, frames) - 1
+        return index >= 0 and frames < self._stops[index]
+
+    def _validate_other(self, other):
+        if not isinstance(other, TimecodeRangeSet):
+            raise TimecodeError(
+                'Type %s not supported for timecode range sets.' %
+                other.__class__.__name__
+            )
+        if other.rate is not self.rate:
+            raise TimecodeError(
+                'Can not combine timecode range sets with different frame '
+                'rates, %s and %s.' % (self.framerate, other.framerate)
+            )
+
+    def _combine(self, other, keep):
+        """returns the ranges covered by the given coverage codes as a new
+        TimecodeRangeSet
+        """
+        self._validate_other(other)
+        if numpy is not None:
+            starts, stops = _sweep_numpy(self, other, keep)
+        else:
+            starts, stops = _sweep_python(self, other, keep)
+        return self._from_arrays(self.rate, starts, stops)
+
+    def union(self, other):
+        """returns the timecodes in either of the sets
+        """
+        return self._combine(other, _UNION)
+
+    def intersection(self, other):
+        """returns the timecodes in both of the sets
+        """
+        return self._combine(other, _INTERSECTION)
+
+    def difference(self, other):
+        """returns the timecodes in this set but not in the other one
+        """
+        return self._combine(other, _DIFFERENCE)
+
+    def symmetric_difference(self, other):
+        """returns the timecodes in only one of the sets
+        """
+        return self._combine(other, _SYMMETRIC_DIFFERENCE)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+
+    def complement(self):
+        """returns the timecodes of the 24 hours which are not in this set
+
+        The 24 hours are the frames from 1 to
+        :attr:`.FrameRate.frames_per_24_hours`, the parts of the ranges
+        outside of them are ignored.
+        """
+        day = self._from_arrays(
+            self.rate, array('q', [1]),
+            array('q', [self.rate.frames_per_24_hours + 1])
+        )
+        return day.difference(self)
+
+    def gaps(self):
+        """returns the timecodes between the first and the last range which
+        are not in this set, as a new TimecodeRangeSet
+        """
+        return self._from_arrays(self.rate, self._stops[:-1],
+                                 self._starts[1:])
+
+    def __eq__(self, other):
+        if isinstance(other, TimecodeRangeSet):
+            return self.rate is other.rate and \
+                self._starts == other._starts and self._stops == other._stops
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        return hash((self.rate, self._starts.tobytes(),
+                     self._stops.tobytes()))
+
+    def __reduce__(self):
+        return TimecodeRangeSet._from_arrays, (self.rate, self._starts,
+                                               self._stops)
+
+    def __repr__(self):
+        format_frames = self.rate.format_frames
+        return 'TimecodeRangeSet(%r, [%s])' % (
+            self.framerate, ', '.join([
+                '(%r, %r)' % (format_frames(start), format_frames(stop))
+                for start, stop in self.intervals()
+            ])
+        )
+
+
+def _to_array(values):
+    """returns the given values as an array('q')
+    """
+    if isinstance(values, array) and values.typecode == 'q':
+        return array('q', values)
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return array('q', values.astype(numpy.int64).tobytes())
+    return array('q', values)
+
+
+def _sweep_python(first, second, keep):
+    """sweeps over the ends of the ranges of two normalized sets and returns
+    the start and the end frames where the coverage code is kept
+    """
+    events = [(start, 1) for start in first._starts]
+    events += [(stop, -1) for stop in first._stops]
+    events += [(start, 2) for start in second._starts]
+    events += [(stop, -2) for stop in second._stops]
+    events.sort()
+
+    starts = array('q')
+    stops = array('q')
+    code = 0
+    inside = False
+    count = len(events)
+    i = 0
+    while i < count:
+        position = events[i][0]
+        # apply all the changes at the same position together
+        while i < count and events[i][0] == position:
+            code += events[i][1]
+            i += 1
+        if keep[code] != inside:
+            inside = not inside
+            if inside:
+                starts.append(position)
+            else:
+                stops.append(position)
+    return starts, stops
+
+
+def _sweep_numpy(first, second, keep):
+    """does what :func:`._sweep_python` does with whole array operations
+    """
+    sizes = [len(first), len(first), len(second), len(second)]
+    positions = numpy.concatenate([
+        numpy.frombuffer(values, dtype=numpy.int64)
+        for values in (first._starts, first._stops, second._starts,
+                       second._stops)
+    ])
+    if not len(positions):
+        return array('q'), array('q')
+    deltas = numpy.repeat(numpy.array([1, -1, 2, -2], dtype=numpy.int8),
+                          sizes)
+    order = numpy.argsort(positions, kind='stable')
+    positions = positions[order]
+    codes = numpy.cumsum(deltas[order])
+
+    # the coverage code after all the changes at each position
+    last = numpy.append(positions[1:] != positions[:-1], True)
+    positions = positions[last]
+    inside = numpy.array(keep)[codes[last]]
+
+    changed = inside != numpy.append(False, inside[:-1])
+    return (array('q', positions[changed & inside].tobytes()),
+            array('q', positions[changed & ~inside].tobytes()))
@@ -0,0 +1,210 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from array import array
+from fractions import Fraction
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from .timecode import Timecode, TimecodeError
+
+
+ROUND_FLOOR = 'floor'
+ROUND_NEAREST = 'nearest'
+ROUND_CEIL = 'ceil'
+
+_ROUNDINGS = (ROUND_FLOOR, ROUND_NEAREST, ROUND_CEIL)
+
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _divide(numerator, denominator, rounding):
+    """divides the integers or integer numpy arrays with the given rounding,
+    the denominator should be positive
+    """
+    if rounding == ROUND_FLOOR:
+        return numerator // denominator
+    elif rounding == ROUND_CEIL:
+        return -(-numerator // denominator)
+    # round half up
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def _validate_rounding(rounding):
+    if rounding not in _ROUNDINGS:
+        raise TimecodeError(
+            'Unknown rounding %r, should be one of %s.' %
+            (rounding, ', '.join(_ROUNDINGS))
+        )
+    return rounding
+
+
+class RateConverter(object):
+    """Converts frames between two frame rates with exact rational math.
+
+    The frame rates are used as exact fractions, like 30000/1001 for '29.97',
+    and the ratio of the two rates is calculated once, so every conversion is
+    an integer multiplication and a division. There is no floating point
+    drift no matter how long the durations are.
+
+    The converted values are frame counts, like durations or 0 based frame
+    numbers. Use :meth:`.convert_timecode` to convert :class:`.Timecode`
+    instances.
+
+    :param source: The frame rate of the values to convert.
+    :param target: The frame rate to convert the values to.
+    :param str rounding: How the frames that fall between two target frames
+      are rounded, one of 'floor', 'nearest' or 'ceil'. 'nearest' rounds the
+      halves up.
+    """
+
+    def __init__(self, source, target, rounding=ROUND_NEAREST):
+        self.source = Timecode._validate_framerate(source)
+        self.target = Timecode._validate_framerate(target)
+        self.rounding = _validate_rounding(rounding)
+
+        ratio = self.target.rational / self.source.rational
+        self.ratio = ratio
+        self._numerator = ratio.numerator
+        self._denominator = ratio.denominator
+
+    def convert(self, frames):
+        """converts the given frame count
+
+        :param int frames: The frame count in the source frame rate.
+        :returns int: The frame count in the target frame rate.
+        """
+        return _divide(frames * self._numerator, self._denominator,
+                       self.rounding)
+
+    def convert_many(self, values):
+        """converts many frame counts at once
+
+        numpy arrays are converted with whole array operations and the result
+        is an int64 numpy array, ``array('q')`` instances result another
+        ``array('q')`` and all other iterables result a list.
+
+        :raises TimecodeError: If a numpy array does not hold integers, or a
+          converted value does not fit in an int64.
+        """
+        numerator = self._numerator
+        denominator = self._denominator
+        rounding = self.rounding
+
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return self._convert_numpy(values)
+
+        if numpy is not None and isinstance(values, array) and \
+                values.typecode == 'q':
+            result = self._convert_numpy(
+                numpy.frombuffer(values, dtype=numpy.int64)
+            )
+            return array('q', result.tobytes())
+
+        if rounding == ROUND_FLOOR:
+            converted = [value * numerator // denominator for value in values]
+        elif rounding == ROUND_CEIL:
+            converted = [-(-value * numerator // denominator)
+                         for value in values]
+        else:
+            double = 2 * denominator
+            converted = [(2 * value * numerator + denominator) // double
+                         for value in values]
+
+        if isinstance(values, array):
+            return array(values.typecode, converted)
+        return converted
+
+    def _convert_numpy(self, values):
+        """converts the integer numpy array, with python integers when the
+        int64 multiplication could overflow
+        """
+        if values.dtype.kind not in 'iu':
+            raise TimecodeError(
+                'The values should be integers, not %s.' % values.dtype
+            )
+        numerator = self._numerator
+        denominator = self._denominator
+        # the largest value 'nearest' can double and multiply in an int64
+        limit = (_INT64_MAX - denominator) // (2 * numerator)
+        if values.size and \
+                max(-int(values.min()), int(values.max())) > limit:
+            result = _divide(values.astype(object) * numerator, denominator,
+                             self.rounding)
+            try:
+                return result.astype(numpy.int64)
+            except OverflowError:
+                raise TimecodeError(
+                    'The converted frames do not fit in an int64.'
+                )
+        return _divide(values.astype(numpy.int64, copy=False) * numerator,
+                       denominator, self.rounding)
+
+    def convert_timecode(self, timecode):
+        """converts the given timecode to the target frame rate
+
+        :param timecode: A :class:`.Timecode` in the source frame rate.
+        :returns: A new :class:`.Timecode` in the target frame rate, showing
+          the same time.
+        """
+        return Timecode(self.target,
+                        frames=self.convert(timecode.frame_number) + 1)
+
+    def __repr__(self):
+        return 'RateConverter(%r, %r, rounding=%r)' % (
+            self.source.framerate, self.target.framerate, self.rounding
+        )
+
+
+def convert_frames(frames, source, target, rounding=ROUND_NEAREST):
+    """converts the given frame count between the given frame rates, see
+    :class:`.RateConverter`
+    """
+    return RateConverter(source, target, rounding).convert(frames)
+
+
+def frames_to_seconds(frames, framerate):
+    """returns the exact duration of the given frame count in seconds
+
+    :returns: a :class:`fractions.Fraction`
+    """
+    rate = Timecode._validate_framerate(framerate)
+    return Fraction(frames) / rate.rational
+
+
+def seconds_to_frames(seconds, framerate, rounding=ROUND_NEAREST):
+    """returns the frame count of the given duration in seconds
+
+    Unlike :meth:`.Timecode.float_to_tc` it uses the exact frame rate, like
+    30000/1001 for '29.97' instead of 30.
+
+    :param seconds: An integer, a float, a :class:`fractions.Fraction` or a
+      :class:`decimal.Decimal`.
+    """
+    rate = Timecode._validate_framerate(framerate)
+    value = Fraction(seconds) * rate.rational
+    return _divide(value.numerator, value.denominator,
+                   _validate_rounding(rounding))
@@ -0,0 +1,371 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+
+from .binary import RATE_IDS, _RATES_BY_ID, _rate_id
+from .ranges import to_frames
+from .timecode import Timecode, TimecodeError
+
+
+#: A segment of a :class:`.SegmentIndex`, ``length`` media frames starting
+#: from the media frame ``start_frame`` have the consecutive timecodes
+#: starting from the ``start_timecode`` frames in the ``framerate``.
+Segment = namedtuple('Segment', ['start_frame', 'start_timecode', 'framerate',
+                                 'length'])
+
+MAGIC = b'TCSI'
+VERSION = 2
+
+# magic, version, number of frame rates, number of segments, number of tree
+# nodes, total frames
+_HEADER = struct.Struct('<4sHHqqq')
+_ITEM = 8
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+class SegmentIndexWriter(object):
+    """Writes the timecodes of the frames of a media file to a segment index
+    file, see :class:`.SegmentIndex`.
+
+    The timecodes are given frame by frame with :meth:`.add` or segment by
+    segment with :meth:`.add_segment`, consecutive timecodes are joined into
+    segments as they come, so only the segments are kept in memory. The file
+    is written when the writer is closed.
+
+    :param path: The path of the index file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._segments = []
+        self._total = 0
+        # the rate id and the timecode frames the next frame continues from
+        self._rate_id = None
+        self._next = None
+
+    def add(self, timecode):
+        """adds the timecode of the next media frame
+
+        :param timecode: A :class:`.Timecode`.
+        """
+        self.add_segment(timecode, 1)
+
+    def add_segment(self, timecode, length):
+        """adds the timecodes of the next ``length`` media frames, starting
+        from the given :class:`.Timecode`
+        """
+        rate = timecode._rate
+        rate_id = _rate_id(rate)
+        framerate = _RATES_BY_ID[rate_id]
+        frames_per_24_hours = rate.frames_per_24_hours
+        # the timecodes roll over at 24 hours, so the frames are kept within
+        # a day to be found by their timecode strings
+        start = (timecode.frames - 1) % frames_per_24_hours + 1
+
+        while length > 0:
+            size = min(length, frames_per_24_hours - start + 1)
+            if rate_id == self._rate_id and start == self._next:
+                start_frame, start_tc, _, previous = self._segments[-1]
+                self._segments[-1] = Segment(start_frame, start_tc,
+                                             framerate, previous + size)
+            else:
+                self._segments.append(
+                    Segment(self._total, start, framerate, size)
+                )
+            self._rate_id = rate_id
+            self._next = start + size
+            self._total += size
+            length -= size
+            start = 1
+
+    def close(self):
+        """writes the index file
+        """
+        segments = self._segments
+        count = len(segments)
+
+        columns = [array('q', [getattr(s, name) for s in segments])
+                   for name in ('start_frame', 'start_timecode', 'length')]
+        rate_ids = array('q', [RATE_IDS[s.framerate] for s in segments])
+
+        # an interval tree of the timecodes of the segments per frame rate
+        by_rate = {}
+        for index in sorted(range(count), key=lambda i: segments[i][1]):
+            by_rate.setdefault(rate_ids[index], []).append(index)
+        tree = _IntervalTree(segments)
+        rate_table = array('q')
+        for rate_id in sorted(by_rate):
+            rate_table.extend([rate_id, tree.add_node(by_rate[rate_id])])
+
+        sections = columns + [rate_ids] + tree.nodes + \
+            [tree.by_start, tree.by_end, rate_table]
+        with open(self.path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(by_rate), count,
+                                 len(tree.nodes[0]), self._total))
+            for section in sections:
+                if _BIG_ENDIAN:
+                    section.byteswap()
+                f.write(section.tobytes())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+
+class _IntervalTree(object):
+    """builds a centered interval tree of the timecodes of the segments as
+    columns
+
+    Every node has a center timecode and keeps the segments containing it,
+    sorted by their start timecodes in ``by_start`` and by their end
+    timecodes, the last one first, in ``by_end``. The segments ending before
+    the center are in the left child and the ones starting after it are in
+    the right one. The center is the median start timecode, so the tree is
+    balanced.
+    """
+
+    def __init__(self, segments):
+        self.segments = segments
+        # the center, left child, right child, first position in by_start
+        # and by_end and the number of segments of every node
+        self.nodes = [array('q') for _ in range(5)]
+        self.by_start = array('q')
+        self.by_end = array('q')
+
+    def add_node(self, indexes):
+        """adds the node of the segments at the given indexes, sorted by their
+        start timecodes, and its children, returns the index of the node or
+        -1 if there are no segments
+        """
+        if not indexes:
+            return -1
+        segments = self.segments
+        center = segments[indexes[len(indexes) // 2]][1]
+        left = []
+        right = []
+        here = []
+        for index in indexes:
+            start = segments[index][1]
+            if start + segments[index][3] <= center:
+                left.append(index)
+            elif start > center:
+                right.append(index)
+            else:
+                here.append(index)
+
+        centers, lefts, rights, firsts, sizes = self.nodes
+        node = len(centers)
+        centers.append(center)
+        lefts.append(-1)
+        rights.append(-1)
+        firsts.append(len(self.by_start))
+        sizes.append(len(here))
+        self.by_start.extend(here)
+        self.by_end.extend(sorted(here, key=lambda i: segments[i][1] +
+                                  segments[i][3], reverse=True))
+        lefts[node] = self.add_node(left)
+        rights[node] = self.add_node(right)
+        return node
+
+
+class SegmentIndex(object):
+    """A memory mapped index of the timecodes of the frames of a media file.
+
+    The file lists the segments of consecutive timecodes, so a media file
+    with timecode breaks takes one entry per break instead of one per frame.
+    The file is memory mapped and read in place, there is no load step.
+    :meth:`.timecode_at` is a binary search over the segments and
+    :meth:`.frames_of` walks down a centered interval tree of the segments,
+    so it takes O(log segments + results) even when the segments overlap.
+
+    The file starts with a header and continues with little endian 64 bit
+    integer columns: the start frames, the start timecode frames, the
+    lengths and the frame rate ids of the segments, then the centers, left
+    children, right children, first positions and segment counts of the tree
+    nodes, then the segments of the nodes sorted by start timecode and by
+    end timecode, and then the (frame rate id, root node) pairs of the frame
+    rates. The frame rate ids are the ones of :data:`.binary.RATE_IDS`.
+
+    :param path: The path of an index file written by
+      :class:`.SegmentIndexWriter`.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, rate_count, count, node_count, total = \
+                _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise TimecodeError('%s is not a segment index file.' % path)
+
+        self.segment_count = count
+        self.total_frames = total
+        self._view = memoryview(self._mmap)
+        offset = _HEADER.size
+        sections = []
+        for size in [count] * 4 + [node_count] * 5 + [count] * 2 + \
+                [rate_count * 2]:
+            sections.append(self._column(offset, size))
+            offset += size * _ITEM
+        (self._start_frames, self._start_tcs, self._lengths, self._rate_ids,
+         self._centers, self._lefts, self._rights, self._firsts, self._sizes,
+         self._by_start, self._by_end, rate_table) = sections
+        self._rates = dict(
+            (rate_table[i], rate_table[i + 1])
+            for i in range(0, len(rate_table), 2)
+        )
+
+    def _column(self, offset, size):
+        column = self._view[offset:offset + size * _ITEM]
+        if _BIG_ENDIAN:
+            values = array('q', column)
+            values.byteswap()
+            return values
+        return column.cast('q')
+
+    def close(self):
+        for name in ('_start_frames', '_start_tcs', '_lengths', '_rate_ids',
+                     '_centers', '_lefts', '_rights', '_firsts', '_sizes',
+                     '_by_start', '_by_end', '_view'):
+            column = getattr(self, name)
+            if isinstance(column, memoryview):
+                column.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.total_frames
+
+    def segment(self, index):
+        """returns the segment at the given index as a :class:`.Segment`
+        """
+        return Segment(self._start_frames[index], self._start_tcs[index],
+                       _RATES_BY_ID[self._rate_ids[index]],
+                       self._lengths[index])
+
+    def segments(self):
+        """yields the segments in the order of the media frames
+        """
+        for index in range(self.segment_count):
+            yield self.segment(index)
+
+    def timecode_at(self, frame):
+        """returns the timecode of the given 0 based media frame as a
+        :class:`.Timecode`
+
+        :raises IndexError: If the frame is not in the media.
+        """
+        if not 0 <= frame < self.total_frames:
+            raise IndexError('Frame %s is not in the index.' % frame)
+        index = bisect_right(self._start_frames, frame) - 1
+        return Timecode(
+            _RATES_BY_ID[self._rate_ids[index]],
+            frames=self._start_tcs[index] + frame - self._start_frames[index]
+        )
+
+    def frames_of(self, timecode):
+        """returns the sorted list of the 0 based media frames with the given
+        timecode, the list is empty if there is no such frame
+
+        :param timecode: A :class:`.Timecode` or a timecode string, the
+          strings are looked up in all the frame rates of the index.
+        """
+        if isinstance(timecode, Timecode):
+            rate = timecode._rate
+            keys = [(RATE_IDS.get(str(rate._key)),
+                     (timecode.frames - 1) % rate.frames_per_24_hours + 1)]
+        elif isinstance(timecode, str):
+            keys = []
+            for rate_id in self._rates:
+                rate = Timecode._validate_framerate(_RATES_BY_ID[rate_id])
+                keys.append((rate_id, to_frames(rate, timecode)))
+        else:
+            raise TimecodeError(
+                'Type %s not supported for segment index lookups.' %
+                timecode.__class__.__name__
+            )
+
+        start_frames = self._start_frames
+        start_tcs = self._start_tcs
+        lengths = self._lengths
+        frames = []
+        for rate_id, value in keys:
+            node = self._rates.get(rate_id, -1)
+            while node >= 0:
+                first = self._firsts[node]
+                positions = range(first, first + self._sizes[node])
+                # the segments of the node all contain the center, so they
+                # contain the value if they start before or end after it
+                if value < self._centers[node]:
+                    for position in positions:
+                        index = self._by_start[position]
+                        if start_tcs[index] > value:
+                            break
+                        frames.append(start_frames[index] + value -
+                                      start_tcs[index])
+                    node = self._lefts[node]
+                else:
+                    for position in positions:
+                        index = self._by_end[position]
+                        offset = value - start_tcs[index]
+                        if offset >= lengths[index]:
+                            break
+                        frames.append(start_frames[index] + offset)
+                    node = self._rights[node]
+        frames.sort()
+        return frames
+
+    def frame_of(self, timecode):
+        """returns the first 0 based media frame with the given timecode
+
+        :raises KeyError: If there is no frame with the timecode.
+        """
+        frames = self.frames_of(timecode)
+        if not frames:
+            raise KeyError(timecode)
+        return frames[0]
+
+    def __repr__(self):
+        return '<SegmentIndex with %s segments of %s frames>' % (
+            self.segment_count, self.total_frames
+        )
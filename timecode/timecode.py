@@ -21,141 +21,237 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+from collections import namedtuple
+from fractions import Fraction
+from time import perf_counter
 
-class Timecode(object):
-    def __init__(self, framerate, start_timecode=None, start_seconds=None,
-                 frames=None):
-        """The main timecode class.
+from .cache import LRUCache
 
-        Does all the calculation over frames, so the main data it holds is
-        frames, then when required it converts the frames to a timecode by
-        using the frame rate setting.
 
-        :param str framerate: The frame rate of the Timecode instance. It
-          should be one of ['23.98', '24', '25', '29.97', '30', '50', '59.94',
-          '60', 'ms'] where "ms" equals to 1000 fps. Can not be skipped.
-          Setting the framerate will automatically set the :attr:`.drop_frame`
-          attribute to correct value.
-        :param start_timecode: The start timecode. Use this to be able to
-          set the timecode of this Timecode instance. It can be skipped and
-          then the frames attribute will define the timecode, and if it is also
-          skipped then the start_second attribute will define the start
-          timecode, and if start_seconds is also skipped then the default value
-          of '00:00:00:00' will be used.
-        :type start_timecode: str or None
-        :param start_seconds: A float or integer value showing the seconds.
-        :param int frames: Timecode objects can be initialized with an
-          integer number showing the total frames.
-        """
-        self.drop_frame = False
-        self.int_framerate = -1
-        self.framerate = self._validate_framerate(framerate)
+#: The hours, minutes, seconds and frames of a timecode together with its
+#: string representation.
+TimecodeFields = namedtuple('TimecodeFields',
+                            ['hrs', 'mins', 'secs', 'frs', 'timecode'])
 
-        self.frames = None
+# the two digit strings of the valid hours and minutes or seconds
+_HOURS = frozenset(['%02d' % i for i in range(24)])
+_SIXTY = frozenset(['%02d' % i for i in range(60)])
 
-        # attribute override order
-        # start_timecode > frames > start_seconds
-        if start_timecode:
-            self.frames = self.tc_to_frames(start_timecode)
-        else:
-            if frames is not None:  # because 0==False, and frames can be 0
-                self.frames = frames
-            elif start_seconds is not None:
-                self.frames = self.float_to_tc(start_seconds)
-            else:
-                # use default value of 00:00:00:00
-                self.frames = self.tc_to_frames('00:00:00:00')
 
-    def _validate_framerate(self, framerate):
-        """validates the given framerate value
-        """
+class FrameRate(object):
+    """An immutable description of a frame rate.
+
+    Holds the constants that the timecode calculations need for a frame rate,
+    so they are calculated only once. There is only one FrameRate instance per
+    frame rate value, calling ``FrameRate('29.97')`` twice returns the same
+    object, so all the Timecode instances with the same frame rate share it.
+    The integer frame rates are kept as strings, ``FrameRate(24)`` is
+    ``FrameRate('24')``.
+
+    :param str framerate: The frame rate. It should be one of ['23.98', '24',
+      '25', '29.97', '30', '50', '59.94', '60', 'ms', 'frames'] or an integer
+      value.
+    """
+
+    __slots__ = ('_key', 'framerate', 'int_framerate', 'float_framerate',
+                 'rational', 'drop_frame', 'drop_frames', 'hour_frames',
+                 'minute_frames', 'frames_per_hour', 'frames_per_24_hours',
+                 'frames_per_10_minutes', 'frames_per_minute', '_block_frames',
+                 '_block_minutes', '_lookup_table', '_table', '_frame_strings',
+                 '_dropped_strings')
+
+    _instances = {}
+
+    #: The conversion methods of :meth:`.set_conversion`.
+    CONVERSIONS = ('auto', 'table', 'arithmetic')
+
+    #: The largest lookup table :meth:`.frames_to_tc` builds automatically,
+    #: it is enough for all the frame rates but 'ms'.
+    MAX_TABLE_SIZE = 36000
+
+    def __new__(cls, framerate):
+        try:
+            return cls._instances[framerate]
+        except KeyError:
+            pass
+        framerate = cls._canonical(framerate)
+        try:
+            return cls._instances[framerate]
+        except KeyError:
+            pass
+
+        rate = object.__new__(cls)
+        init = object.__setattr__
+        drop_frame = False
+        key = framerate
+
         # set the int_frame_rate
         if framerate == '29.97':
-            self.int_framerate = 30
-            self.drop_frame = True
+            int_framerate = 30
+            drop_frame = True
         elif framerate == '59.94':
-            self.int_framerate = 60
-            self.drop_frame = True
+            int_framerate = 60
+            drop_frame = True
         elif framerate == '23.98':
-            self.int_framerate = 24
+            int_framerate = 24
         elif framerate == 'ms':
-            self.int_framerate = 1000
+            int_framerate = 1000
             framerate = 1000
         elif framerate == 'frames':
-            self.int_framerate = 1
+            int_framerate = 1
         else:
-            self.int_framerate = int(framerate)
-        return framerate
-
-    def set_timecode(self, timecode):
-        """Sets the frames by using the given timecode
-        """
-        self.frames = self.tc_to_frames(timecode)
+            int_framerate = int(framerate)
 
-    def float_to_tc(self, seconds):
-        """set the frames by using the given seconds
-        """
-        return int(seconds * self.int_framerate)
-
-    def tc_to_frames(self, timecode):
-        """Converts the given timecode to frames
-        """
-        hours, minutes, seconds, frames = map(int, timecode.split(':'))
+        if framerate == 'frames':
+            ffps = 1.0
+        else:
+            ffps = float(framerate)
 
-        ffps = float(self.framerate)
+        # the exact frame rate, the NTSC rates are 1000/1001 of the integer
+        # ones
+        if framerate in ('23.98', '29.97', '59.94'):
+            rational = Fraction(int_framerate * 1000, 1001)
+        else:
+            rational = Fraction(int_framerate)
 
-        if self.drop_frame:
+        if drop_frame:
             # Number of drop frames is 6% of framerate rounded to nearest
             # integer
             drop_frames = int(round(ffps * .066666))
         else:
             drop_frames = 0
 
-        # We don't need the exact framerate anymore, we just need it rounded to
-        # nearest integer
-        ifps = self.int_framerate
+        init(rate, '_key', key)
+        init(rate, 'framerate', framerate)
+        init(rate, 'int_framerate', int_framerate)
+        init(rate, 'float_framerate', ffps)
+        init(rate, 'rational', rational)
+        init(rate, 'drop_frame', drop_frame)
+        init(rate, 'drop_frames', drop_frames)
+        # Number of frames per hour and minute (non-drop)
+        init(rate, 'hour_frames', int_framerate * 60 * 60)
+        init(rate, 'minute_frames', int_framerate * 60)
+        # Number of frames in an hour
+        frames_per_hour = int(round(ffps * 60 * 60))
+        init(rate, 'frames_per_hour', frames_per_hour)
+        # Number of frames in a day - timecode rolls over after 24 hours
+        init(rate, 'frames_per_24_hours', frames_per_hour * 24)
+        # Number of frames per ten minutes
+        init(rate, 'frames_per_10_minutes', int(round(ffps * 60 * 10)))
+        # Number of frames per minute is the round of the framerate * 60 minus
+        # the number of dropped frames
+        init(rate, 'frames_per_minute', int(round(ffps) * 60) - drop_frames)
+
+        # the lookup table of frames_to_tc covers ten minutes for drop frame,
+        # where the dropped frames repeat every ten minutes, and a minute for
+        # non drop frame
+        if drop_frame:
+            init(rate, '_block_frames', rate.frames_per_10_minutes)
+            init(rate, '_block_minutes', 10)
+        else:
+            init(rate, '_block_frames', rate.minute_frames)
+            init(rate, '_block_minutes', 1)
+        # the lookup table is built once when it is first needed, _table is
+        # None until the conversion method is selected, then an empty tuple
+        # for the arithmetic or the lookup table
+        init(rate, '_lookup_table', None)
+        init(rate, '_table', None)
+
+        # the frames fields of the string representations, for is_canonical
+        init(rate, '_frame_strings',
+             frozenset(['%02d' % i for i in range(int_framerate)]))
+        init(rate, '_dropped_strings',
+             frozenset(['%02d' % i for i in range(drop_frames)]))
+
+        return cls._instances.setdefault(key, rate)
+
+    @staticmethod
+    def _canonical(framerate):
+        """returns the canonical form of the given frame rate value, the
+        integer values are strings and the other numbers are floats, so the
+        equal values like 24, 24.0 and '24' share the same instance
+        """
+        if isinstance(framerate, str):
+            return framerate
+        if framerate == int(framerate):
+            return str(int(framerate))
+        return float(framerate)
 
-        # Number of frames per hour (non-drop)
-        hour_frames = ifps * 60 * 60
+    def fields_to_frames(self, hours, minutes, seconds, frames):
+        """Converts the given timecode fields to frames
 
-        # Number of frames per minute (non-drop)
-        minute_frames = ifps * 60
+        Does the same calculation with :meth:`.Timecode.tc_to_frames`, the
+        fields can be integers or numpy arrays.
+        """
+        drop_frames = self.drop_frames
 
         # Total number of minutes
         total_minutes = (60 * hours) + minutes
 
         frame_number = \
-            ((hour_frames * hours) + (minute_frames * minutes) +
-             (ifps * seconds) + frames) - \
+            ((self.hour_frames * hours) + (self.minute_frames * minutes) +
+             (self.int_framerate * seconds) + frames) - \
             (drop_frames * (total_minutes - (total_minutes // 10)))
 
-        frames = frame_number + 1
+        return frame_number + 1
 
-        return frames
+    def tc_to_frames(self, timecode):
+        """Converts the given timecode string to frames
 
-    def frames_to_tc(self, frames):
-        """Converts frames back to timecode
+        Does the calculation of :meth:`.Timecode.tc_to_frames` with the
+        constants of this frame rate, without creating a :class:`.Timecode`.
+        """
+        hours, minutes, seconds, frames = map(int, timecode.split(':'))
+
+        # Total number of minutes
+        total_minutes = (60 * hours) + minutes
+
+        return ((self.hour_frames * hours) + (self.minute_frames * minutes) +
+                (self.int_framerate * seconds) + frames) - \
+            (self.drop_frames * (total_minutes - (total_minutes // 10))) + 1
 
-        :returns str: the string representation of the current time code
+    def frame_set(self, timecodes):
+        """returns the frames of the given timecode strings as a frozenset
+
+        An :class:`.ImmutableTimecode` hashes and compares equal to its
+        frames, so the result can be used for fast membership tests of
+        timecodes::
+
+          cues = FrameRate('25').frame_set(['00:00:01:00', '00:00:02:00'])
+          ImmutableTimecode('25', '00:00:01:00') in cues  # True
         """
-        ffps = float(self.framerate)
+        tc_to_frames = self.tc_to_frames
+        return frozenset([tc_to_frames(timecode) for timecode in timecodes])
 
-        if self.drop_frame:
-            # Number of frames to drop on the minute marks is the nearest
-            # integer to 6% of the framerate
-            drop_frames = int(round(ffps * .066666))
-        else:
-            drop_frames = 0
+    def frames_to_tc(self, frames):
+        """Converts frames back to timecode
 
-        # Number of frames in an hour
-        frames_per_hour = int(round(ffps * 60 * 60))
-        # Number of frames in a day - timecode rolls over after 24 hours
-        frames_per_24_hours = frames_per_hour * 24
-        # Number of frames per ten minutes
-        frames_per_10_minutes = int(round(ffps * 60 * 10))
-        # Number of frames per minute is the round of the framerate * 60 minus
-        # the number of dropped frames
-        frames_per_minute = int(round(ffps) * 60) - drop_frames
+        Does the calculation of :meth:`.Timecode.frames_to_tc`, either with
+        arithmetic or by reading the hours, minutes, seconds and frames from a
+        lookup table, see :meth:`.set_conversion`.
+
+        :returns: the hours, minutes, seconds and frames of the given frames
+        """
+        table = self._table
+        if table:
+            block, offset = divmod((frames - 1) % self.frames_per_24_hours,
+                                   self._block_frames)
+            try:
+                mins, secs, frs = table[offset]
+            except TypeError:
+                # not integer frames
+                return self._calculate_tc(frames)
+            block *= self._block_minutes
+            return block // 60, block % 60 + mins, secs, frs
+        elif table is None:
+            self.set_conversion('auto')
+        return self._calculate_tc(frames)
+
+    def _calculate_tc(self, frames):
+        """does the arithmetic of :meth:`.frames_to_tc`
+        """
+        drop_frames = self.drop_frames
+        frames_per_24_hours = self.frames_per_24_hours
 
         frame_number = frames - 1
 
@@ -168,11 +264,12 @@ class Timecode(object):
         frame_number %= frames_per_24_hours
 
         if self.drop_frame:
+            frames_per_10_minutes = self.frames_per_10_minutes
             d = frame_number // frames_per_10_minutes
             m = frame_number % frames_per_10_minutes
             if m > drop_frames:
                 frame_number += (drop_frames * 9 * d) + \
-                    drop_frames * ((m - drop_frames) // frames_per_minute)
+                    drop_frames * ((m - drop_frames) // self.frames_per_minute)
             else:
                 frame_number += drop_frames * 9 * d
 
@@ -184,6 +281,358 @@ class Timecode(object):
 
         return hrs, mins, secs, frs
 
+    def _build_table(self):
+        """returns the (mins, secs, frs) of every frame of the first block,
+        the first ten minutes for drop frame and the first minute for non drop
+        frame
+        """
+        if self._lookup_table is not None:
+            return self._lookup_table
+        drop_frames = self.drop_frames
+        frame_range = range(self.int_framerate)
+        table = []
+        for mins in range(self._block_minutes):
+            for secs in range(60):
+                # the first frames of every minute but the first one of the
+                # block are dropped
+                first = drop_frames if mins and not secs else 0
+                table.extend((mins, secs, frs) for frs in frame_range[first:])
+        table = tuple(table)
+        object.__setattr__(self, '_lookup_table', table)
+        return table
+
+    def set_conversion(self, method='auto'):
+        """selects how :meth:`.frames_to_tc` converts the frames for this
+        frame rate, the setting is shared by all the timecodes with this frame
+        rate
+
+        :param str method: 'table' reads the timecode from a lookup table of
+          the frames of a ten minute block for drop frame and of a minute for
+          non drop frame, so a conversion is a single ``divmod`` and a table
+          read. 'arithmetic' calculates it. 'auto' times both and selects the
+          faster one, the tables larger than :attr:`.MAX_TABLE_SIZE` are not
+          considered. It is done on the first conversion if no method is set.
+        :returns: the selected method, 'table' or 'arithmetic'
+        """
+        if method not in self.CONVERSIONS:
+            raise TimecodeError(
+                'Unknown conversion %r, should be one of %s.' %
+                (method, ', '.join(self.CONVERSIONS))
+            )
+
+        if method == 'arithmetic' or (
+                method == 'auto' and self._block_frames > self.MAX_TABLE_SIZE):
+            object.__setattr__(self, '_table', ())
+            return 'arithmetic'
+
+        table = self._build_table()
+        object.__setattr__(self, '_table', table)
+        if method == 'auto':
+            # the frames of a whole day in a fixed order, so both methods are
+            # timed with the same values
+            step = self.frames_per_24_hours // 997 or 1
+            samples = range(1, self.frames_per_24_hours + 1, step)
+            best = {}
+            for name, value in (('table', table), ('arithmetic', ())):
+                object.__setattr__(self, '_table', value)
+                best[name] = min(self._time_conversion(samples)
+                                 for _ in range(3))
+            if best['arithmetic'] < best['table']:
+                object.__setattr__(self, '_table', ())
+                return 'arithmetic'
+            object.__setattr__(self, '_table', table)
+        return 'table'
+
+    def _time_conversion(self, samples):
+        frames_to_tc = self.frames_to_tc
+        start = perf_counter()
+        for frames in samples:
+            frames_to_tc(frames)
+        return perf_counter() - start
+
+    @property
+    def conversion(self):
+        """returns the method :meth:`.frames_to_tc` uses, 'table',
+        'arithmetic' or None if it is not selected yet
+        """
+        table = self._table
+        if table is None:
+            return None
+        return 'table' if table else 'arithmetic'
+
+    def format_frames(self, frames, separator=':'):
+        """returns the string representation of the given frames, the same
+        with :meth:`.Timecode.__repr__` by default
+
+        :param str separator: The separator before the frames field, use ';'
+          for the drop frame notation.
+        """
+        hrs, mins, secs, frs = self.frames_to_tc(frames)
+        return "%02d:%02d:%02d%s%02d" % (hrs, mins, secs, separator, frs)
+
+    def is_canonical(self, timecode):
+        """returns True if the given timecode string is the same with the
+        string representation of its frames, without converting it
+
+        The fields should be two digits, or more for the 'ms' frames,
+        separated with ':', within the ranges of this frame rate and not a
+        dropped frame number.
+        """
+        fields = timecode.split(':')
+        if len(fields) != 4:
+            return False
+        hrs, mins, secs, frs = fields
+        if hrs not in _HOURS or mins not in _SIXTY or secs not in _SIXTY or \
+                frs not in self._frame_strings:
+            return False
+        return not (secs == '00' and mins[1] != '0' and
+                    frs in self._dropped_strings)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrameRate instances are immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrameRate instances are immutable.')
+
+    def __reduce__(self):
+        # unpickle to the shared instance
+        return FrameRate, (self._key,)
+
+    def __repr__(self):
+        return 'FrameRate(%r)' % self.framerate
+
+
+class Timecode(object):
+
+    __slots__ = ('_frames', '_rate', '_fields', '_text')
+
+    #: The default capacity of the caches of :meth:`.enable_cache`.
+    DEFAULT_CACHE_CAPACITY = 4096
+
+    # the LRUCache instances of enable_cache, None while disabled
+    _format_cache = None
+    _parse_cache = None
+
+    def __init__(self, framerate, start_timecode=None, start_seconds=None,
+                 frames=None, lazy=False):
+        """The main timecode class.
+
+        Does all the calculation over frames, so the main data it holds is
+        frames, then when required it converts the frames to a timecode by
+        using the frame rate setting.
+
+        :param str framerate: The frame rate of the Timecode instance. It
+          should be one of ['23.98', '24', '25', '29.97', '30', '50', '59.94',
+          '60', 'ms'] where "ms" equals to 1000 fps. Can not be skipped.
+          Setting the framerate will automatically set the :attr:`.drop_frame`
+          attribute to correct value. A :class:`.FrameRate` instance can also
+          be given.
+        :param start_timecode: The start timecode. Use this to be able to
+          set the timecode of this Timecode instance. It can be skipped and
+          then the frames attribute will define the timecode, and if it is also
+          skipped then the start_second attribute will define the start
+          timecode, and if start_seconds is also skipped then the default value
+          of '00:00:00:00' will be used.
+        :type start_timecode: str or None
+        :param start_seconds: A float or integer value showing the seconds.
+        :param int frames: Timecode objects can be initialized with an
+          integer number showing the total frames.
+        :param bool lazy: Set it to True to keep the start_timecode as it is
+          and convert it to frames only when the frames are first needed, by
+          the arithmetic, the comparisons or the properties. Until the
+          timecode is changed :meth:`.__repr__` returns the start_timecode
+          without any conversion if it is in the canonical form, see
+          :meth:`.FrameRate.is_canonical`. A malformed start_timecode raises
+          an error when it is converted, not here.
+        """
+        self._rate = self._validate_framerate(framerate)
+        self._fields = None
+        self._text = None
+
+        # attribute override order
+        # start_timecode > frames > start_seconds
+        if start_timecode:
+            if lazy:
+                # the _frames slot is left empty, see __getattr__
+                self._text = start_timecode
+            else:
+                self._frames = self.tc_to_frames(start_timecode)
+        else:
+            if frames is not None:  # because 0==False, and frames can be 0
+                self._frames = frames
+            elif start_seconds is not None:
+                self._frames = self.float_to_tc(start_seconds)
+            else:
+                # use default value of 00:00:00:00
+                self._frames = 1
+
+    @staticmethod
+    def _validate_framerate(framerate):
+        """validates the given framerate value and returns the shared
+        :class:`.FrameRate` instance for it
+        """
+        if isinstance(framerate, FrameRate):
+            return framerate
+        return FrameRate(framerate)
+
+    @classmethod
+    def _new(cls, rate, frames):
+        """creates a Timecode from a :class:`.FrameRate` and frames without
+        going through the validation of the constructor
+        """
+        tc = cls.__new__(cls)
+        tc._rate = rate
+        tc._frames = frames
+        tc._fields = None
+        tc._text = None
+        return tc
+
+    def __getattr__(self, name):
+        # only called when the attribute is not found, the _frames slot of a
+        # lazy timecode is empty until it is converted here
+        if name == '_frames' and self._text is not None:
+            frames = self._frames = self.tc_to_frames(self._text)
+            return frames
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" %
+            (self.__class__.__name__, name)
+        )
+
+    def __copy__(self):
+        tc = self._new(self._rate, self._frames)
+        tc._fields = self._fields
+        return tc
+
+    def __deepcopy__(self, memo):
+        # the frame rate is shared and the frames are an immutable number
+        return self.__copy__()
+
+    def __reduce__(self):
+        # works with every pickle protocol, and a lazy timecode which is not
+        # converted yet is pickled with its text, so it stays lazy
+        try:
+            frames = Timecode._frames.__get__(self)
+        except AttributeError:
+            return type(self), (self._rate, self._text, None, None, True)
+        return type(self)._new, (self._rate, frames)
+
+    @staticmethod
+    def enable_cache(capacity=DEFAULT_CACHE_CAPACITY, parse_capacity=None):
+        """enables the caching of the timecode strings
+
+        The string representations, and the other :attr:`.fields`, are cached
+        with the frame rate and the frames as the key, and the frames parsed
+        by :meth:`.tc_to_frames` with the frame rate and the timecode string.
+        Useful when the same timecodes are formatted or parsed over and over,
+        like the playhead or the marker positions. The caches are shared by
+        all the Timecode instances and enabling them again replaces them with
+        empty ones.
+
+        :param int capacity: The maximum number of the cached strings, the
+          least recently used ones are dropped when it is reached.
+        :param int parse_capacity: The maximum number of the cached parsed
+          timecodes, it is the same with ``capacity`` if skipped.
+        """
+        if parse_capacity is None:
+            parse_capacity = capacity
+        format_cache = LRUCache(capacity)
+        parse_cache = LRUCache(parse_capacity)
+        Timecode._format_cache = format_cache
+        Timecode._parse_cache = parse_cache
+
+    @staticmethod
+    def disable_cache():
+        """disables and drops the caches of :meth:`.enable_cache`
+        """
+        Timecode._format_cache = None
+        Timecode._parse_cache = None
+
+    @staticmethod
+    def clear_cache():
+        """removes all the cached values and resets the statistics of the
+        caches
+        """
+        for cache in (Timecode._format_cache, Timecode._parse_cache):
+            if cache is not None:
+                cache.clear()
+
+    @staticmethod
+    def cache_info():
+        """returns the statistics of the caches as a dictionary with the
+        'format' and 'parse' keys holding :class:`.CacheInfo` instances, or
+        None if the caches are not enabled
+        """
+        format_cache = Timecode._format_cache
+        parse_cache = Timecode._parse_cache
+        if format_cache is None or parse_cache is None:
+            return None
+        return {'format': format_cache.info(), 'parse': parse_cache.info()}
+
+    @property
+    def framerate(self):
+        return self._rate.framerate
+
+    @framerate.setter
+    def framerate(self, framerate):
+        # a lazy timecode is converted with the frame rate it was created with
+        self._frames
+        self._rate = self._validate_framerate(framerate)
+        self._fields = None
+        self._text = None
+
+    @property
+    def frames(self):
+        return self._frames
+
+    @frames.setter
+    def frames(self, frames):
+        self._frames = frames
+        # the timecode fields are calculated again when they are needed
+        self._fields = None
+        self._text = None
+
+    @property
+    def int_framerate(self):
+        return self._rate.int_framerate
+
+    @property
+    def drop_frame(self):
+        return self._rate.drop_frame
+
+    def set_timecode(self, timecode):
+        """Sets the frames by using the given timecode
+        """
+        self.frames = self.tc_to_frames(timecode)
+
+    def float_to_tc(self, seconds):
+        """set the frames by using the given seconds
+        """
+        return int(seconds * self.int_framerate)
+
+    def tc_to_frames(self, timecode):
+        """Converts the given timecode to frames
+        """
+        cache = self._parse_cache
+        if cache is not None:
+            key = (self._rate, timecode)
+            frames = cache.get(key)
+            if frames is not None:
+                return frames
+
+        frames = self._rate.tc_to_frames(timecode)
+
+        if cache is not None:
+            cache.put(key, frames)
+
+        return frames
+
+    def frames_to_tc(self, frames):
+        """Converts frames back to timecode
+
+        :returns: the hours, minutes, seconds and frames of the given frames
+        """
+        return self._rate.frames_to_tc(frames)
+
     @classmethod
     def parse_timecode(cls, timecode):
         """parses timecode string frames '00:00:00:00' or '00:00:00;00' or
@@ -230,32 +679,120 @@ class Timecode(object):
         """the overridden equality operator
         """
         if isinstance(other, Timecode):
-            return self.framerate == other.framerate and \
-                self.frames == other.frames
+            return (other._rate is self._rate or
+                    self.framerate == other.framerate) and \
+                self._frames == other._frames
         elif isinstance(other, str):
-            new_tc = Timecode(self.framerate, other)
-            return self.__eq__(new_tc)
+            return self._frames == self._str_frames(other)
         elif isinstance(other, int):
-            return self.frames == other
+            return self._frames == other
+        return NotImplemented
+
+    # a Timecode can change, use ImmutableTimecode in sets and as dictionary
+    # keys
+    __hash__ = None
+
+    def _compared_frames(self, other):
+        """returns the frames to compare this timecode with, or
+        NotImplemented for the types that can not be compared
+        """
+        if isinstance(other, Timecode):
+            if other._rate is not self._rate and \
+                    other.framerate != self.framerate:
+                raise TimecodeError(
+                    'Can not compare timecodes with different frame rates, '
+                    '%s and %s.' % (self.framerate, other.framerate)
+                )
+            return other._frames
+        elif isinstance(other, str):
+            return self._str_frames(other)
+        elif isinstance(other, int):
+            return other
+        return NotImplemented
+
+    def _str_frames(self, timecode):
+        """returns the frames of the given timecode string to compare with,
+        parsed with the constants of the frame rate and the parse cache of
+        :meth:`.enable_cache` instead of creating a new Timecode
+        """
+        if not timecode:
+            # Timecode(framerate, '') is 00:00:00:00
+            return 1
+        return self.tc_to_frames(timecode)
+
+    def __lt__(self, other):
+        frames = self._compared_frames(other)
+        if frames is NotImplemented:
+            return frames
+        return self._frames < frames
+
+    def __le__(self, other):
+        frames = self._compared_frames(other)
+        if frames is NotImplemented:
+            return frames
+        return self._frames <= frames
+
+    def __gt__(self, other):
+        frames = self._compared_frames(other)
+        if frames is NotImplemented:
+            return frames
+        return self._frames > frames
+
+    def __ge__(self, other):
+        frames = self._compared_frames(other)
+        if frames is NotImplemented:
+            return frames
+        return self._frames >= frames
 
     def __add__(self, other):
         """returns new Timecode instance with the given timecode or frames
         added to this one
         """
-        # duplicate current one
-        tc = Timecode(self.framerate, frames=self.frames)
+        if isinstance(other, Timecode):
+            frames = self._frames + other._frames
+        elif isinstance(other, int):
+            frames = self._frames + other
+        else:
+            raise TimecodeError(
+                'Type %s not supported for arithmetic.' %
+                other.__class__.__name__
+            )
+
+        return self._new(self._rate, frames)
+
+    def __radd__(self, other):
+        """returns new Timecode instance with this timecode added to the
+        given frames
+        """
+        return self.__add__(other)
 
+    def __iadd__(self, other):
+        """adds the given timecode or frames to this timecode in place
+        """
         if isinstance(other, Timecode):
-            tc.add_frames(other.frames)
+            self.add_frames(other._frames)
         elif isinstance(other, int):
-            tc.add_frames(other)
+            self.add_frames(other)
         else:
             raise TimecodeError(
                 'Type %s not supported for arithmetic.' %
                 other.__class__.__name__
             )
+        return self
 
-        return tc
+    def __isub__(self, other):
+        """subtracts the given timecode or frames from this timecode in place
+        """
+        if isinstance(other, Timecode):
+            self.sub_frames(other._frames)
+        elif isinstance(other, int):
+            self.sub_frames(other)
+        else:
+            raise TimecodeError(
+                'Type %s not supported for arithmetic.' %
+                other.__class__.__name__
+            )
+        return self
 
     def __sub__(self, other):
         """returns new Timecode object with added timecodes"""
@@ -268,8 +805,7 @@ class Timecode(object):
                 'Type %s not supported for arithmetic.' %
                 other.__class__.__name__
             )
-        return Timecode(self.framerate, start_timecode=None,
-                        frames=subtracted_frames)
+        return self._new(self._rate, subtracted_frames)
 
     def __mul__(self, other):
         """returns new Timecode object with added timecodes"""
@@ -282,8 +818,7 @@ class Timecode(object):
                 'Type %s not supported for arithmetic.' %
                 other.__class__.__name__
             )
-        return Timecode(self.framerate, start_timecode=None,
-                        frames=multiplied_frames)
+        return self._new(self._rate, multiplied_frames)
 
     def __div__(self, other):
         """returns new Timecode object with added timecodes"""
@@ -296,32 +831,57 @@ class Timecode(object):
                 'Type %s not supported for arithmetic.' %
                 other.__class__.__name__
             )
-        return Timecode(self.framerate, start_timecode=None,
-                        frames=div_frames)
+        return self._new(self._rate, div_frames)
 
     def __repr__(self):
-        return "%02d:%02d:%02d:%02d" % \
-            self.frames_to_tc(self.frames)
+        text = self._text
+        if text is not None and self._rate.is_canonical(text):
+            # an unchanged lazy timecode
+            return text
+        return self.fields.timecode
+
+    @property
+    def fields(self):
+        """returns the hours, minutes, seconds, frames and the string
+        representation of this timecode as a :class:`.TimecodeFields`
+
+        The values are calculated once and reused until the frames or the
+        frame rate of this timecode changes.
+        """
+        fields = self._fields
+        if fields is None:
+            cache = self._format_cache
+            if cache is not None:
+                key = (self._rate, self._frames)
+                fields = cache.get(key)
+                if fields is not None:
+                    self._fields = fields
+                    return fields
+
+            hrs, mins, secs, frs = self._rate.frames_to_tc(self._frames)
+            fields = self._fields = TimecodeFields(
+                hrs, mins, secs, frs,
+                "%02d:%02d:%02d:%02d" % (hrs, mins, secs, frs)
+            )
+            if cache is not None:
+                cache.put(key, fields)
+        return fields
 
     @property
     def hrs(self):
-        hrs, mins, secs, frs = self.frames_to_tc(self.frames)
-        return hrs
+        return self.fields.hrs
 
     @property
     def mins(self):
-        hrs, mins, secs, frs = self.frames_to_tc(self.frames)
-        return mins
+        return self.fields.mins
 
     @property
     def secs(self):
-        hrs, mins, secs, frs = self.frames_to_tc(self.frames)
-        return secs
+        return self.fields.secs
 
     @property
     def frs(self):
-        hrs, mins, secs, frs = self.frames_to_tc(self.frames)
-        return frs
+        return self.fields.frs
 
     @property
     def frame_number(self):
@@ -330,6 +890,79 @@ class Timecode(object):
         return self.frames - 1
 
 
+class ImmutableTimecode(Timecode):
+    """A :class:`.Timecode` which can not be changed.
+
+    It takes the same arguments with :class:`.Timecode` and shares the
+    :class:`.FrameRate` with them, but the frames and the frame rate can not
+    be set, so :meth:`.Timecode.next`, :meth:`.Timecode.back`,
+    :meth:`.Timecode.add_frames` and the other methods changing the timecode
+    raise an AttributeError. The arithmetic operators return new
+    ImmutableTimecode instances and ``+=`` and ``-=`` bind the name to a new
+    instance like they do for tuples.
+
+    It is hashable and can be shared between threads without copying or
+    locking, and it is pickled as the frame rate and the frames only.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_timecode(cls, timecode):
+        """returns an ImmutableTimecode of the given :class:`.Timecode`
+        """
+        if isinstance(timecode, ImmutableTimecode):
+            return timecode
+        tc = cls._new(timecode._rate, timecode._frames)
+        tc._fields = timecode._fields
+        return tc
+
+    def to_timecode(self):
+        """returns a mutable :class:`.Timecode` with the same frames
+        """
+        tc = Timecode._new(self._rate, self._frames)
+        tc._fields = self._fields
+        return tc
+
+    @property
+    def framerate(self):
+        return self._rate.framerate
+
+    @framerate.setter
+    def framerate(self, framerate):
+        raise AttributeError('ImmutableTimecode instances are immutable.')
+
+    @property
+    def frames(self):
+        return self._frames
+
+    @frames.setter
+    def frames(self, frames):
+        raise AttributeError('ImmutableTimecode instances are immutable.')
+
+    def __iadd__(self, other):
+        return self.__add__(other)
+
+    def __isub__(self, other):
+        return self.__sub__(other)
+
+    def __hash__(self):
+        """returns the hash of the frames, so an ImmutableTimecode hashes the
+        same with the :class:`.Timecode` and the integer frames it is equal
+        to, but not with the timecode strings it is equal to
+        """
+        return hash(self._frames)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return type(self)._new, (self._rate, self._frames)
+
+
 class TimecodeError(Exception):
     """Raised when an error occurred in timecode calculation
     """
@@ -0,0 +1,240 @@
+#!-*- coding: utf-8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Joshua Banton and PyTimeCode developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from array import array
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from .ranges import to_frames
+from .timecode import Timecode, TimecodeError
+
+
+#: The time base the timestamps in seconds are rounded to, a microsecond.
+SECONDS_TIME_BASE = Fraction(1, 1000000)
+
+
+class TimestampMapper(object):
+    """Maps the presentation timestamps of variable frame rate media to the
+    timecodes of a fixed frame rate timeline.
+
+    The timeline starts with the ``start`` timecode at the timestamp of the
+    first media frame. A timestamp maps to the timeline frame showing that
+    time, so a timecode is the frame whose duration contains the timestamp,
+    calculated with exact rational math from the time base and the frame
+    rate. The other way, a timecode maps to the media frame with the
+    timestamp nearest to the start of the timecode, found with a binary
+    search over the timestamps.
+
+    Every query has a batch version, which uses whole array operations when
+    numpy is installed.
+
+    :param timestamps: The sorted timestamps of the media frames, a numpy
+      array, an ``array`` or a sequence.
+    :param framerate: The frame rate of the timeline.
+    :param start: The timecode of the first media frame, a
+      :class:`.Timecode`, a timecode string or an integer frame count,
+      defaults to '00:00:00:00'.
+    :param time_base: The duration of a timestamp unit in seconds, like
+      ``Fraction(1, 90000)`` for MPEG-TS, then the timestamps should be
+      integers. Leave it None to give the timestamps in seconds, they are
+      rounded to microseconds.
+    """
+
+    def __init__(self, timestamps, framerate, start=None, time_base=None):
+        self.rate = Timecode._validate_framerate(framerate)
+        self.start = 1 if start is None else to_frames(self.rate, start)
+        self.time_base = SECONDS_TIME_BASE if time_base is None \
+            else Fraction(time_base)
+        self._seconds = time_base is None
+        if self.time_base <= 0:
+            raise TimecodeError('The time base should be positive.')
+
+        ticks = self._to_ticks(timestamps)
+        if not len(ticks):
+            raise TimecodeError('There should be at least one timestamp.')
+        if numpy is not None:
+            values = numpy.frombuffer(ticks, dtype=numpy.int64)
+            unsorted = bool((values[1:] < values[:-1]).any())
+        else:
+            unsorted = any(a > b for a, b in zip(ticks, ticks[1:]))
+        if unsorted:
+            raise TimecodeError('The timestamps should be sorted.')
+        self._ticks = ticks
+        self._origin = ticks[0]
+
+        # timeline frames = start + ticks since origin * _num // _den
+        ratio = self.time_base * self.rate.rational
+        self._num = ratio.numerator
+        self._den = ratio.denominator
+
+    @property
+    def framerate(self):
+        return self.rate.framerate
+
+    @property
+    def ticks(self):
+        """returns the timestamps as an ``array('q')`` of time base units
+        """
+        return self._ticks
+
+    def __len__(self):
+        """returns the number of media frames
+        """
+        return len(self._ticks)
+
+    def _to_tick(self, timestamp):
+        if self._seconds:
+            return round(timestamp * 1000000)
+        return int(timestamp)
+
+    def _to_ticks(self, timestamps):
+        """returns the given timestamps as an array('q') of time base units
+        """
+        if numpy is not None:
+            values = numpy.asarray(timestamps)
+            if self._seconds:
+                values = numpy.rint(values * 1e6)
+            return array('q', values.astype(numpy.int64).tobytes())
+        if self._seconds:
+            return array('q', [round(value * 1000000) for value in timestamps])
+        return array('q', timestamps)
+
+    def frames_at(self, timestamp):
+        """returns the timeline frames showing the given timestamp
+
+        :param timestamp: A timestamp in the time base, or in seconds.
+        :returns int: The frames of the timecode.
+        """
+        return self.start + \
+            (self._to_tick(timestamp) - self._origin) * self._num // self._den
+
+    def timecode_at(self, timestamp):
+        """returns the timecode showing the given timestamp as a
+        :class:`.Timecode`
+        """
+        return Timecode(self.rate, frames=self.frames_at(timestamp))
+
+    def frames_at_many(self, timestamps):
+        """does what :meth:`.frames_at` does for many timestamps
+
+        :returns: an int64 numpy array when numpy is installed, otherwise an
+          ``array('q')``
+        """
+        return self._frames_of_ticks(self._to_ticks(timestamps))
+
+    def timeline_frames(self):
+        """returns the timeline frames of every media frame, see
+        :meth:`.frames_at_many`
+        """
+        return self._frames_of_ticks(self._ticks)
+
+    def _frames_of_ticks(self, ticks):
+        start = self.start
+        origin = self._origin
+        num = self._num
+        den = self._den
+        if numpy is not None:
+            values = numpy.frombuffer(ticks, dtype=numpy.int64)
+            return start + (values - origin) * num // den
+        return array('q', [start + (tick - origin) * num // den
+                           for tick in ticks])
+
+    def index_at(self, timestamp):
+        """returns the index of the media frame shown at the given timestamp,
+        which is the last frame starting at or before it, or -1 if the
+        timestamp is before the first frame
+        """
+        return bisect_right(self._ticks, self._to_tick(timestamp)) - 1
+
+    def index_at_many(self, timestamps):
+        """does what :meth:`.index_at` does for many timestamps
+
+        :returns: an int64 numpy array when numpy is installed, otherwise an
+          ``array('q')``
+        """
+        ticks = self._to_ticks(timestamps)
+        if numpy is not None:
+            return numpy.searchsorted(
+                numpy.frombuffer(self._ticks, dtype=numpy.int64),
+                numpy.frombuffer(ticks, dtype=numpy.int64), side='right'
+            ) - 1
+        media_ticks = self._ticks
+        return array('q', [bisect_right(media_ticks, tick) - 1
+                           for tick in ticks])
+
+    def index_of(self, timecode):
+        """returns the index of the media frame with the timestamp nearest to
+        the start of the given timecode, the earlier frame wins a tie
+
+        :param timecode: A :class:`.Timecode`, a timecode string or an
+          integer frame count.
+        """
+        ticks = self._ticks
+        # the start of the timecode is at origin + offset / _num ticks
+        offset = (to_frames(self.rate, timecode) - self.start) * self._den
+        num = self._num
+        origin = self._origin
+        after = bisect_left(ticks, origin - (-offset // num))
+        if after == len(ticks):
+            return after - 1
+        if after == 0:
+            return 0
+        # compare the distances multiplied by _num to stay in integers
+        before_distance = offset - (ticks[after - 1] - origin) * num
+        after_distance = (ticks[after] - origin) * num - offset
+        return after if after_distance < before_distance else after - 1
+
+    def index_of_many(self, timecodes):
+        """does what :meth:`.index_of` does for many timecodes
+
+        :param timecodes: The frames of the timecodes, a numpy array, an
+          ``array`` or a sequence of integers.
+        :returns: an int64 numpy array when numpy is installed, otherwise an
+          ``array('q')``
+        """
+        if numpy is None:
+            index_of = self.index_of
+            return array('q', [index_of(frames) for frames in timecodes])
+
+        ticks = numpy.frombuffer(self._ticks, dtype=numpy.int64)
+        num = self._num
+        origin = self._origin
+        offsets = (numpy.asarray(timecodes, dtype=numpy.int64) -
+                   self.start) * self._den
+        after = numpy.searchsorted(ticks, origin - (-offsets // num),
+                                   side='left')
+        after = numpy.minimum(after, len(ticks) - 1)
+        before = numpy.maximum(after - 1, 0)
+        before_distance = numpy.abs(offsets - (ticks[before] - origin) * num)
+        after_distance = numpy.abs((ticks[after] - origin) * num - offsets)
+        return numpy.where(after_distance < before_distance, after, before)
+
+    def __repr__(self):
+        return '<TimestampMapper %s frames at %r from %s>' % (
+            len(self), self.framerate, self.rate.format_frames(self.start)
+        )